@@ -0,0 +1,65 @@
+"""Run the benchmark suite against an in-memory SQLite database and compare the results with a stored baseline.
+
+    python -m benchmarks [--output results.json] [--baseline benchmarks/baseline.json] [--save-baseline] [--check]
+"""
+import argparse
+import json
+import os
+import sys
+
+from benchmarks.suite import compare, get_benchmarks
+from benchmarks.utils import measure
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", default=BASELINE, help="The baseline JSON file to compare against.")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to the baseline file.")
+    parser.add_argument("--check", action="store_true", help="Exit with a non-zero status on a regression.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before a regression.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of runs per benchmark, the best is kept.")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this text.")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline) as f:
+            document = json.load(f)
+
+        # Throughput is not comparable across interpreter versions, so such a baseline has to be recorded again.
+        if document["python"].split(".")[:2] == [str(part) for part in sys.version_info[:2]]:
+            baseline = document["results"]
+        else:
+            print(f"ignoring the baseline recorded on Python {document['python']}", file=sys.stderr)
+
+    results = {}
+
+    for name, func in get_benchmarks():
+        if args.filter not in name:
+            continue
+
+        results[name] = measure(func, number=None, repeat=args.repeat)
+        change = f"{results[name] / baseline[name] - 1:+8.1%}" if baseline.get(name) else ""
+        print(f"{name:<32} {results[name]:>14,.0f} ops/s {change}")
+
+    document = {"python": sys.version.split()[0], "results": results}
+
+    for path in filter(None, [args.output, args.baseline if args.save_baseline else None]):
+        with open(path, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    for name, ratio in regressions:
+        print(f"regression: {name} runs at {ratio:.0%} of the baseline", file=sys.stderr)
+
+    return 1 if regressions and args.check else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
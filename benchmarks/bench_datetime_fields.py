@@ -0,0 +1,44 @@
+"""Compare the throughput of the date, datetime and time field transforms using `strptime` against the precompiled
+parsers used for ISO 8601 formats.
+
+    python -m benchmarks.bench_datetime_fields
+"""
+from datetime import datetime
+
+from benchmarks.utils import Booking, measure, report
+from sqlaf import fields
+
+
+class StrptimeMixin:
+    """Parse every value with `strptime`, as the fields did before the precompiled parsers."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._parse = self._strptime
+
+    def _strptime(self, value: str) -> datetime:
+        return datetime.strptime(value, self.format)
+
+
+def main():
+    cases = [
+        (fields.DateField, Booking.date, "2020-01-05"),
+        (fields.DateTimeField, Booking.created_at, "2020-01-01T10:00:00+0000"),
+        (fields.TimeField, Booking.time, "13:00:00+0000"),
+    ]
+
+    for field_class, source, value in cases:
+        field = field_class(source)
+        strptime_field = type(f"Strptime{field_class.__name__}", (StrptimeMixin, field_class), {})(source)
+
+        report(
+            f"{field_class.__name__}(format={field.format!r}).transform",
+            [
+                ("strptime", measure(lambda: strptime_field.transform(value))),
+                ("precompiled parser", measure(lambda: field.transform(value))),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare operator dispatch when the operator is bound on field construction against resolving it on every call.
+
+    python -m benchmarks.bench_operators
+"""
+from typing import Any, Callable
+
+from benchmarks.utils import Booking, measure, report
+from sqlaf import config, fields
+
+
+def resolve_operator(field: fields.Field) -> Callable:
+    """The previous `Field.get_filters` behaviour, which resolved the operator for every value."""
+    operator_func = None
+
+    if isinstance(field.operator, Callable):
+        operator_func = field.operator
+    elif isinstance(field.operator, str):
+        operator_func = config.FILTER_OPERATORS.get(field.operator.lower())
+
+    return operator_func
+
+
+def resolve_per_call(field: fields.Field, value: Any):
+    return resolve_operator(field)(field.source, value)
+
+
+def main():
+    field = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+    report(
+        "IntegerField(operator='gte') operator dispatch",
+        [
+            ("resolved per call", measure(lambda: resolve_operator(field), number=200000)),
+            ("bound on construction", measure(lambda: field.operator_func, number=200000)),
+        ],
+    )
+    report(
+        "IntegerField(operator='gte').get_filters",
+        [
+            ("resolved per call", measure(lambda: resolve_per_call(field, 2))),
+            ("bound on construction", measure(lambda: field.get_filters(2))),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
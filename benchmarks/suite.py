@@ -0,0 +1,114 @@
+import enum
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import sqlalchemy as db
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from benchmarks.utils import Base, Booking
+from sqlaf import fields, filters
+from sqlaf.utils import parse_query_string
+
+FILTER_SIZES = [1, 10, 100]
+
+
+class NumberOfHeads(enum.IntEnum):
+
+    one = 1
+    two = 2
+    three = 3
+
+
+# ARRAY columns are PostgreSQL only, so the table is compiled for PostgreSQL and never created in SQLite.
+guests = db.Table("guests", db.MetaData(), db.Column("guest_names", postgresql.ARRAY(db.String)))
+
+
+def get_field_cases() -> List[Tuple[str, fields.Field, str, bool]]:
+    """Get the field benchmark cases.
+
+    Returns:
+        List[Tuple[str, fields.Field, str, bool]]: The name, field, raw value and whether it can run on SQLite.
+    """
+    return [
+        ("CharField", fields.CharField(Booking.name, operator="icontains"), "Jim", True),
+        ("IntegerField", fields.IntegerField(Booking.number_of_heads, operator="gte"), "2", True),
+        ("IntegerField[in]", fields.IntegerField(Booking.number_of_heads, operator="in"), "1,2,3", True),
+        ("EnumField", fields.EnumField(Booking.number_of_heads, NumberOfHeads), "2", True),
+        ("BooleanField", fields.BooleanField(Booking.has_paid, truthy=["true"], falsy=["false"]), "true", True),
+        ("ArrayField", fields.ArrayField(guests.c.guest_names), "jim,pam", False),
+        ("DateField", fields.DateField(Booking.date, operator="gte"), "2020-01-05", True),
+        ("DateTimeField", fields.DateTimeField(Booking.created_at, operator="lt"), "2020-01-01T10:00:00+0000", True),
+        ("TimeField", fields.TimeField(Booking.time, operator="gt"), "13:00:00+0000", True),
+    ]
+
+
+def get_wide_filter(size: int) -> Tuple[db.Table, type, str]:
+    """Create a table with `size` integer columns, a `Filter` declaring a field for each of them and a query string
+    filtering on every field.
+    """
+    table = db.Table(f"wide_{size}", Base.metadata, *(db.Column(f"c{i}", db.Integer) for i in range(size)))
+    filter_class = type(
+        f"Wide{size}Filter",
+        (filters.Filter,),
+        {f"c{i}": fields.IntegerField(table.c[f"c{i}"], operator="gte") for i in range(size)},
+    )
+    query_string = "&".join(f"c{i}={i}" for i in range(size))
+    return table, filter_class, query_string
+
+
+def get_benchmarks() -> Iterator[Tuple[str, Callable]]:
+    """Get every benchmark in the suite, each stage is measured separately.
+
+    Returns:
+        Iterator[Tuple[str, Callable]]: The benchmark names and the functions to measure.
+    """
+    engine = create_engine("sqlite://")
+    wide_filters = {size: get_wide_filter(size) for size in FILTER_SIZES}
+    Base.metadata.create_all(engine)
+    connection = engine.connect()
+    connection.execute(
+        Booking.__table__.insert(), [{"id": i, "name": f"Jim {i}", "number_of_heads": i} for i in range(100)]
+    )
+    dialects = {True: sqlite.dialect(), False: postgresql.dialect()}
+
+    for name, field, value, sqlite_supported in get_field_cases():
+        expression = field.filter(value)
+        statement = select(*expression._from_objects[0].c).where(expression)
+        dialect = dialects[sqlite_supported]
+
+        yield f"transform.{name}", lambda field=field, value=value: field.clean(value)
+
+        yield f"build.{name}", lambda field=field, value=value: field.filter(value)
+        yield f"compile.{name}", lambda statement=statement, dialect=dialect: statement.compile(dialect=dialect)
+
+        if sqlite_supported:
+            yield f"execute.{name}", lambda statement=statement: connection.execute(statement).all()
+
+    for size, (table, filter_class, query_string) in wide_filters.items():
+        keys = filter_class._query_string_keys
+        statement = filter_class(select(table)).filter(query_string)
+
+        yield f"parse.{size}", lambda query_string=query_string, keys=keys: parse_query_string(query_string, keys=keys)
+        yield f"filter.{size}", lambda filter_class=filter_class, table=table, query_string=query_string: (
+            filter_class(select(table)).filter(query_string)
+        )
+        yield f"compile.{size}", lambda statement=statement: statement.compile(dialect=dialects[True])
+        yield f"execute.{size}", lambda statement=statement: connection.execute(statement).all()
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[Tuple[str, float]]:
+    """Compare the results against the baseline.
+
+    Args:
+        results (Dict[str, float]): The benchmark results in calls per second.
+        baseline (Dict[str, float]): The baseline results in calls per second.
+        tolerance (float): The fraction a benchmark can be slower than the baseline before it is a regression.
+
+    Returns:
+        List[Tuple[str, float]]: The regressed benchmarks and their throughput relative to the baseline.
+    """
+    return [
+        (name, results[name] / baseline[name])
+        for name in results
+        if baseline.get(name) and results[name] / baseline[name] < 1 - tolerance
+    ]
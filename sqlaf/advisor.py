@@ -0,0 +1,387 @@
+"""Map the columns and operators declared by `Filter` classes to the indexes they need, and report the indexes missing
+from the SQLAlchemy metadata as DDL or Alembic operations.
+
+    python -m sqlaf.advisor myapp.filters [--dialect postgresql] [--format ddl|alembic] [--all] [--check]
+"""
+import argparse
+import importlib
+import re
+import sys
+from dataclasses import dataclass, field, replace
+from types import ModuleType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from sqlalchemy import ARRAY, Column, Table
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Dialect
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.sql.elements import TextClause
+
+from sqlaf.expressions import get_case_insensitive_strategy, is_binary_collation
+from sqlaf.fields import Field
+from sqlaf.filters import Filter
+
+TRIGRAM_OPS = "gin_trgm_ops"
+PATTERN_OPS = "text_pattern_ops"
+JSONB_PATH_OPS = "jsonb_path_ops"
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """The kind of index an operator can use."""
+
+    using: str = "btree"
+    lower: bool = False
+    ops: Optional[str] = None
+    collation: Optional[str] = None
+
+    @property
+    def suffix(self) -> str:
+        return "".join(
+            [
+                "_lower" if self.lower else "",
+                f"_{self.collation.lower()}" if self.collation else "",
+                "_trgm" if self.ops == TRIGRAM_OPS else "",
+                "_pattern" if self.ops == PATTERN_OPS else "",
+                "_path" if self.ops == JSONB_PATH_OPS else "",
+                "_gin" if self.using == "gin" and self.ops is None else "",
+            ]
+        )
+
+
+BTREE = IndexSpec()
+LOWER_BTREE = IndexSpec(lower=True)
+NOCASE_BTREE = IndexSpec(collation="NOCASE")
+PATTERN_BTREE = IndexSpec(ops=PATTERN_OPS)
+LOWER_PATTERN_BTREE = IndexSpec(lower=True, ops=PATTERN_OPS)
+TRIGRAM = IndexSpec(using="gin", ops=TRIGRAM_OPS)
+LOWER_TRIGRAM = IndexSpec(using="gin", lower=True, ops=TRIGRAM_OPS)
+GIN = IndexSpec(using="gin")
+ARRAY_GIN = GIN
+JSONB_PATH_GIN = IndexSpec(using="gin", ops=JSONB_PATH_OPS)
+
+# The index each operator can be served by, negated operators are left out as they match most of the table.
+OPERATOR_INDEXES: Dict[str, IndexSpec] = {
+    "eq": BTREE,
+    "gt": BTREE,
+    "gte": BTREE,
+    "lt": BTREE,
+    "lte": BTREE,
+    "in": BTREE,
+    "range": BTREE,
+    "contains": TRIGRAM,
+    "startswith": PATTERN_BTREE,
+    "endswith": TRIGRAM,
+    "search": GIN,
+}
+
+# The index each case-insensitive operator can be served by, depending on the strategy it compiles with.
+CASE_INSENSITIVE_INDEXES: Dict[str, Dict[str, IndexSpec]] = {
+    "ieq": {"lower": LOWER_BTREE, "ilike": TRIGRAM, "nocase": NOCASE_BTREE, "native": BTREE},
+    "icontains": {"lower": LOWER_TRIGRAM, "ilike": TRIGRAM, "nocase": TRIGRAM, "native": TRIGRAM},
+    "istartswith": {"lower": LOWER_PATTERN_BTREE, "ilike": TRIGRAM, "nocase": NOCASE_BTREE, "native": PATTERN_BTREE},
+}
+
+ARRAY_OPERATOR_INDEXES: Dict[str, IndexSpec] = {
+    "contains": ARRAY_GIN,
+    "overlap": ARRAY_GIN,
+    "contained_by": ARRAY_GIN,
+    "any": ARRAY_GIN,
+}
+
+# The index each containment operator of a `JSONField` can be served by, the range operators extract the value and
+# would need an expression index per path.
+JSON_OPERATOR_INDEXES: Dict[str, IndexSpec] = {
+    "eq": JSONB_PATH_GIN,
+    "contains": JSONB_PATH_GIN,
+    "in": JSONB_PATH_GIN,
+}
+
+# Dialects that can build the GIN indexes used for substring, array containment and full-text searches.
+GIN_DIALECTS = ["postgresql"]
+
+
+@dataclass
+class IndexRecommendation:
+    """An index needed by one or more filter fields."""
+
+    table: str
+    column: str
+    spec: IndexSpec
+    fields: List[str] = field(default_factory=list)
+    exists: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"ix_{self.table}_{self.column}{self.spec.suffix}"
+
+    def is_supported(self, dialect: str = "postgresql") -> bool:
+        return self.spec.using != "gin" or dialect in GIN_DIALECTS
+
+    def unsupported_reason(self, dialect: str) -> str:
+        return f"{self.name}: {self.spec.using} indexes are not supported by {dialect}"
+
+    def expression(self, dialect: str = "postgresql") -> str:
+        """The indexed expression, e.g. `lower(name) gin_trgm_ops`."""
+        expression = _get_dialect(dialect).identifier_preparer.quote(self.column)
+
+        if self.spec.lower:
+            expression = f"lower({expression})"
+
+        if self.spec.collation:
+            expression = f"{expression} COLLATE {self.spec.collation}"
+
+        return f"{expression} {self.spec.ops}" if self.spec.ops else expression
+
+    def to_ddl(self, dialect: str = "postgresql") -> str:
+        """Render the `CREATE INDEX` statement for the dialect.
+
+        Args:
+            dialect (str, optional): The dialect name. Defaults to "postgresql".
+
+        Returns:
+            str: The DDL statement, or a comment when the dialect cannot build the index.
+        """
+        if not self.is_supported(dialect):
+            return f"-- {self.unsupported_reason(dialect)}"
+
+        preparer = _get_dialect(dialect).identifier_preparer
+        expression = self.expression(dialect)
+
+        if self.spec.lower and dialect == "mysql":
+            expression = f"({expression})"
+
+        using = f" USING {self.spec.using}" if self.spec.using != "btree" else ""
+
+        return f"CREATE INDEX {preparer.quote(self.name)} ON {preparer.quote(self.table)}{using} ({expression});"
+
+    def to_alembic(self) -> str:
+        """Render the Alembic `op.create_index` operation."""
+        if self.spec.lower or self.spec.ops or self.spec.collation:
+            columns = f"sa.text({self.expression()!r})"
+        else:
+            columns = repr(self.column)
+
+        using = f", postgresql_using={self.spec.using!r}" if self.spec.using != "btree" else ""
+
+        return f"op.create_index({self.name!r}, {self.table!r}, [{columns}]{using})"
+
+
+FilterTarget = Union[str, ModuleType, Type[Filter]]
+
+
+def _get_dialect(name: str) -> Dialect:
+    return make_url(f"{name}://").get_dialect()()
+
+
+def _get_filter_classes(targets: Iterable[FilterTarget]) -> Iterator[Type[Filter]]:
+    for target in targets:
+        if isinstance(target, str):
+            target = importlib.import_module(target)
+
+        if isinstance(target, ModuleType):
+            yield from [
+                value
+                for value in vars(target).values()
+                if isinstance(value, type) and issubclass(value, Filter) and value is not Filter
+            ]
+        else:
+            yield target
+
+
+def _get_column(source) -> Optional[Column]:
+    column = getattr(source, "expression", source)
+
+    return column if isinstance(column, Column) and isinstance(column.table, Table) else None
+
+
+def _get_spec(field: Field, column: Column, dialect: str) -> Optional[IndexSpec]:
+    if not isinstance(field.operator, str):
+        return None
+
+    operator = field.operator.lower()
+
+    if isinstance(column.type, ARRAY):
+        return ARRAY_OPERATOR_INDEXES.get(operator)
+
+    if isinstance(column.type, JSONB):
+        return JSON_OPERATOR_INDEXES.get(operator)
+
+    # FTS5 tables are an index of their own.
+    if getattr(field, "fts_table", None) is not None:
+        return None
+
+    if operator in CASE_INSENSITIVE_INDEXES:
+        comparison = {"icontains": "contains", "istartswith": "startswith"}.get(operator, "eq")
+        strategy = get_case_insensitive_strategy(
+            column, comparison, dialect, getattr(field, "case_insensitive", "auto")
+        )
+        spec = CASE_INSENSITIVE_INDEXES[operator][strategy]
+    elif operator == "startswith" and is_binary_collation(column, dialect):
+        spec = BTREE
+    else:
+        spec = OPERATOR_INDEXES.get(operator)
+
+    # Prefix matches only need an operator class on PostgreSQL, where the default one does not support `LIKE`.
+    if spec is not None and spec.ops == PATTERN_OPS and dialect != "postgresql":
+        spec = replace(spec, ops=None)
+
+    return spec
+
+
+def _normalize(expression, table: Table) -> str:
+    if isinstance(expression, Column):
+        return expression.name
+
+    text = (
+        expression.text if isinstance(expression, TextClause) else str(expression.compile(dialect=postgresql.dialect()))
+    )
+
+    return re.sub(r"\s+", "", text.replace('"', "").replace(f"{table.name}.", "")).lower()
+
+
+def _get_index_specs(table: Table) -> Iterator[Tuple[str, IndexSpec]]:
+    """Yield the leading expression and kind of every index declared on the table, including the indexes created for
+    primary keys and unique constraints.
+    """
+    for constraint in table.constraints:
+        if getattr(constraint, "columns", None) and constraint.__visit_name__ in ("primary_key_constraint", "unique"):
+            yield list(constraint.columns)[0].name, BTREE
+
+    for index in table.indexes:
+        if not index.expressions:
+            continue
+
+        options = index.dialect_options["postgresql"]
+        using = (options["using"] or "btree").lower()
+        ops = dict(options["ops"] or {})
+        expression = index.expressions[0]
+        normalized = _normalize(expression, table)
+
+        ops_name = next(
+            (name for name in (TRIGRAM_OPS, PATTERN_OPS, JSONB_PATH_OPS) if normalized.endswith(name)), None
+        )
+
+        if ops_name:
+            normalized = re.sub(f"{ops_name}$", "", normalized)
+        else:
+            ops_name = ops.get(getattr(expression, "key", None) or normalized)
+
+        normalized, collation = re.fullmatch(r"(.*?)(?:collate(\w+))?", normalized).groups()
+        collation = collation.upper() if collation else None
+
+        if normalized.startswith("lower(") and normalized.endswith(")"):
+            yield normalized[6:-1], IndexSpec(using=using, lower=True, ops=ops_name, collation=collation)
+        else:
+            yield normalized, IndexSpec(using=using, ops=ops_name, collation=collation)
+
+
+def advise(*targets: FilterTarget, dialect: str = "postgresql") -> List[IndexRecommendation]:
+    """Work out the indexes needed by the fields of `Filter` classes and whether the tables declare them.
+
+        e.g.
+
+        ```
+        for recommendation in advise("myapp.filters"):
+            if not recommendation.exists:
+                print(recommendation.to_ddl("postgresql"))
+        ```
+
+    Args:
+        targets (FilterTarget): `Filter` classes, or modules or module names whose `Filter` classes are checked.
+        dialect (str, optional): The dialect the filters are compiled for, which decides the form of the
+            case-insensitive operators. Defaults to "postgresql".
+
+    Returns:
+        List[IndexRecommendation]: One recommendation per index, with the fields that need it.
+    """
+    recommendations: Dict[Tuple[str, str, IndexSpec], IndexRecommendation] = {}
+    declared: Dict[str, List[Tuple[str, IndexSpec]]] = {}
+
+    for filter_class in _get_filter_classes(targets):
+        for key, filter_field in filter_class._fields.items():
+            column = _get_column(filter_field.source)
+            spec = _get_spec(filter_field, column, dialect) if column is not None else None
+
+            if spec is None:
+                continue
+
+            table = column.table
+
+            if table.fullname not in declared:
+                declared[table.fullname] = list(_get_index_specs(table))
+
+            recommendation = recommendations.setdefault(
+                (table.fullname, column.name, spec),
+                IndexRecommendation(
+                    table=table.fullname,
+                    column=column.name,
+                    spec=spec,
+                    exists=(column.name, spec) in declared[table.fullname],
+                ),
+            )
+            recommendation.fields.append(f"{filter_class.__name__}.{key} ({filter_field.operator})")
+
+    return list(recommendations.values())
+
+
+def render_ddl(recommendations: List[IndexRecommendation], dialect: str = "postgresql") -> str:
+    lines = []
+
+    if dialect == "postgresql" and any(r.spec.ops == TRIGRAM_OPS for r in recommendations):
+        lines.append("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    for recommendation in recommendations:
+        lines.append(f"-- {', '.join(recommendation.fields)}")
+        lines.append(recommendation.to_ddl(dialect))
+
+    return "\n".join(lines)
+
+
+def render_alembic(recommendations: List[IndexRecommendation], dialect: str = "postgresql") -> str:
+    supported = [r for r in recommendations if r.is_supported(dialect)]
+    upgrade = ["def upgrade():"]
+    downgrade = ["def downgrade():"]
+
+    if any(r.spec.ops == TRIGRAM_OPS for r in supported):
+        upgrade.append('    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")')
+
+    for recommendation in recommendations:
+        if not recommendation.is_supported(dialect):
+            upgrade.append(f"    # {recommendation.unsupported_reason(dialect)}")
+            continue
+
+        upgrade.append(f"    {recommendation.to_alembic()}")
+        downgrade.append(f"    op.drop_index({recommendation.name!r}, table_name={recommendation.table!r})")
+
+    for lines in (upgrade, downgrade):
+        if len(lines) == 1:
+            lines.append("    pass")
+
+    return "\n".join([*upgrade, "", "", *downgrade])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sqlaf.advisor", description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="+", help="Modules containing Filter classes.")
+    parser.add_argument("--dialect", default="postgresql", help="The dialect to render the DDL for.")
+    parser.add_argument("--format", choices=["ddl", "alembic"], default="ddl", help="The output format.")
+    parser.add_argument("--all", action="store_true", help="Include the indexes that already exist.")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if any index is missing.")
+    args = parser.parse_args(argv)
+
+    recommendations = advise(*args.modules, dialect=args.dialect)
+    missing = [r for r in recommendations if not r.exists]
+    selected = recommendations if args.all else missing
+
+    if args.format == "alembic":
+        print(render_alembic(selected, args.dialect))
+    else:
+        print(render_ddl(selected, args.dialect))
+
+    return 1 if args.check and missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
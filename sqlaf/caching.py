@@ -0,0 +1,158 @@
+import warnings
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from sqlalchemy import bindparam, event
+from sqlalchemy.engine import Engine, default
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.elements import BindParameter, ClauseElement
+
+from sqlaf.exceptions import UncacheableFilterWarning
+
+EXECUTION_OPTION = "sqlaf_filter"
+# The prefix of the names given to bound parameters by `bind_parameters`, which keeps them apart from the parameters
+# SQLAlchemy names after columns, e.g. the SET parameters of an UPDATE.
+BIND_PARAMETER_PREFIX = "sqlaf"
+
+
+@dataclass
+class CacheStatistics:
+    """Compiled statement cache outcomes of the statements executed for a `Filter` class."""
+
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.hits + self.misses + self.uncached
+
+    @property
+    def ratio(self) -> float:
+        """The fraction of executions that reused a compiled statement from the cache."""
+        return self.hits / self.total if self.total else 0.0
+
+
+_statistics: Dict[str, CacheStatistics] = {}
+_tracked_engines: List[Engine] = []
+
+
+def get_filter_name(filter_class: Any) -> str:
+    """Get the name that statistics are recorded under for a `Filter` class or instance.
+
+    Args:
+        filter_class (Any): The `Filter` class or instance.
+
+    Returns:
+        str: The qualified name of the class.
+    """
+    if not isinstance(filter_class, type):
+        filter_class = type(filter_class)
+
+    return f"{filter_class.__module__}.{filter_class.__qualname__}"
+
+
+def _record_cache_outcome(conn, cursor, statement, parameters, context, executemany):
+    name = context.execution_options.get(EXECUTION_OPTION) if context is not None else None
+
+    if not name:
+        return
+
+    statistics = _statistics.setdefault(name, CacheStatistics())
+
+    if context.cache_hit is default.CACHE_HIT:
+        statistics.hits += 1
+    elif context.cache_hit is default.CACHE_MISS:
+        statistics.misses += 1
+    else:
+        statistics.uncached += 1
+
+
+def track_compiled_cache(engine: Engine):
+    """Start recording the compiled statement cache outcome of every statement built by a `Filter` and executed on
+        the engine.
+
+    Args:
+        engine (Engine): The engine to listen to.
+    """
+    if engine in _tracked_engines:
+        return
+
+    event.listen(engine, "before_cursor_execute", _record_cache_outcome)
+    _tracked_engines.append(engine)
+
+
+def untrack_compiled_cache(engine: Engine):
+    """Stop recording compiled statement cache outcomes for the engine.
+
+    Args:
+        engine (Engine): The engine to stop listening to.
+    """
+    if engine not in _tracked_engines:
+        return
+
+    event.remove(engine, "before_cursor_execute", _record_cache_outcome)
+    _tracked_engines.remove(engine)
+
+
+def is_tracking() -> bool:
+    return bool(_tracked_engines)
+
+
+def get_cache_statistics(filter_class: Any) -> CacheStatistics:
+    """Get the compiled statement cache statistics for a `Filter` class.
+
+    Args:
+        filter_class (Any): The `Filter` class or instance.
+
+    Returns:
+        CacheStatistics: The cache statistics recorded for the class.
+    """
+    return _statistics.get(get_filter_name(filter_class), CacheStatistics())
+
+
+def reset_cache_statistics():
+    _statistics.clear()
+
+
+def bind_parameters(expression: ClauseElement, key: str, value: Any = None) -> ClauseElement:
+    """Replace the bound parameters of a filter expression with parameters named after the filter key and their
+        position, e.g. `sqlaf_name_0`, so that requests with the same shape compile to the same SQL. A warning is
+        raised if the expression embeds the value in a way that can not be cached e.g. a custom operator that renders
+        the value as literal SQL.
+
+    Args:
+        expression (ClauseElement): The filter expression.
+        key (str): The filter key to name the parameters after.
+        value (Any, optional): The value the expression was built with. Defaults to None.
+
+    Returns:
+        ClauseElement: The filter expression with named bound parameters.
+    """
+    names: List[str] = []
+
+    def replace(element):
+        if not isinstance(element, BindParameter):
+            return None
+
+        name = f"{BIND_PARAMETER_PREFIX}_{key}_{len(names)}"
+        names.append(name)
+
+        return bindparam(
+            name,
+            value=element.value,
+            type_=element.type,
+            expanding=element.expanding,
+            callable_=element.callable,
+            literal_execute=element.literal_execute,
+        )
+
+    expression = visitors.replacement_traverse(expression, {}, replace)
+
+    if value is not None and not names:
+        warnings.warn(
+            f"The `{key}` filter does not use bound parameters, so it will not hit the compiled statement cache.",
+            UncacheableFilterWarning,
+        )
+
+    return expression
@@ -1,4 +1,5 @@
-from typing import Callable, Dict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
 
 from sqlaf import operators
 
@@ -14,4 +15,40 @@ FILTER_OPERATORS: Dict[str, Callable] = {
     "~contains": operators.xcontains,
     "contains": operators.contains,
     "icontains": operators.icontains,
+    "startswith": operators.startswith,
+    "istartswith": operators.istartswith,
+    "endswith": operators.endswith,
+    "search": operators.search,
+    "overlap": operators.overlap,
+    "contained_by": operators.contained_by,
+    # An alias of "overlap", `&&` matches an array column sharing any element with the values.
+    "any": operators.overlap,
+    "range": operators.range_,
+    "in": operators.in_,
+    "~in": operators.xin,
 }
+
+# Operators that filter with a list of values rather than a single value.
+MULTI_VALUE_OPERATORS: List[str] = ["in", "~in"]
+
+# Inclusive "[" and exclusive "(" lower and upper bounds accepted by the "range" operator.
+RANGE_BOUNDS: List[str] = ["[]", "[)", "(]", "()"]
+
+# Operators that compare regardless of case, their compilation can be chosen per field with `case_insensitive`.
+CASE_INSENSITIVE_OPERATORS: List[str] = ["ieq", "~ieq", "icontains", "istartswith"]
+
+# Limits applied when parsing query strings, the key and value lengths are measured before decoding.
+QUERY_STRING_MAX_PAIRS: int = 256
+QUERY_STRING_MAX_KEY_LENGTH: int = 128
+QUERY_STRING_MAX_VALUE_LENGTH: int = 8192
+
+# The current time that relative date expressions, e.g. "now-7d", are evaluated against.
+CLOCK: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
+
+# The precision relative date expressions are rounded down to, so that requests made within the same minute share the
+# same bound values and cache keys.
+RELATIVE_DATETIME_ROUNDING: str = "minute"
+
+# Limits applied when parsing boolean filter expressions, see `sqlaf.grammar`.
+EXPRESSION_MAX_DEPTH: int = 8
+EXPRESSION_MAX_NODES: int = 64
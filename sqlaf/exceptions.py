@@ -28,3 +28,17 @@ class OperatorArgumentError(SQLAlchemyFiltersBaseException):
     """The filter operator logic could not be performed on the source and value that was passed into the operator."""
 
     pass
+
+
+class UncacheableFilterWarning(UserWarning):
+    """The filter expression can not be cached by SQLAlchemy's compiled statement cache."""
+
+    pass
+
+
+class UnindexedOrderingWarning(UserWarning):
+    """A column the results can be ordered by is not the leading column of an index, so ordering and paginating by it
+    requires a sort of every matching row.
+    """
+
+    pass
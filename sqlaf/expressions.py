@@ -0,0 +1,447 @@
+import re
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import ARRAY, Boolean, Float, String, Table, all_, and_, any_, bindparam, func, literal_column, not_
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.expression import false
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from sqlaf.exceptions import OperatorArgumentError
+
+
+class InArray(ColumnElement):
+    """`source IN (...)` using an expanding bound parameter, which is rendered as `source = ANY(:array)` on
+    PostgreSQL so that a large list is sent as a single array parameter.
+    """
+
+    __visit_name__ = "sqlaf_in_array"
+    inherit_cache = True
+    type = Boolean()
+
+    _traverse_internals = [
+        ("in_clause", InternalTraversal.dp_clauseelement),
+        ("array_clause", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, source: Any, values: List[Any], negate: bool = False):
+        array = bindparam(None, values, type_=ARRAY(source.type))
+
+        if negate:
+            self.in_clause = source.not_in(values)
+            self.array_clause = source != all_(array)
+        else:
+            self.in_clause = source.in_(values)
+            self.array_clause = source == any_(array)
+
+    def self_group(self, against: Optional[Any] = None) -> ColumnElement:
+        return self
+
+
+@compiles(InArray)
+def _compile_in_array(element, compiler, **kw):
+    return compiler.process(element.in_clause, **kw)
+
+
+@compiles(InArray, "postgresql")
+def _compile_in_array_postgresql(element, compiler, **kw):
+    return compiler.process(element.array_clause, **kw)
+
+
+def next_prefix(prefix: str) -> Optional[str]:
+    """Get the smallest string, in code point order, that is greater than every string starting with the prefix, e.g.
+        "abd" for "abc". `None` if there is no such string.
+
+    Args:
+        prefix (str): The prefix.
+
+    Returns:
+        Optional[str]: The exclusive upper bound of the strings starting with the prefix.
+    """
+    while prefix:
+        code = ord(prefix[-1]) + 1
+
+        if 0xD800 <= code <= 0xDFFF:
+            code = 0xE000
+
+        if code <= 0x10FFFF:
+            return prefix[:-1] + chr(code)
+
+        prefix = prefix[:-1]
+
+    return None
+
+
+def is_binary_collation(source: Any, dialect: str) -> bool:
+    """Whether the column compares strings in code point order on the dialect, so a prefix match can be rewritten as
+    a range: SQLite's default BINARY collation or the PostgreSQL "C" and "POSIX" collations.
+    """
+    collation = (getattr(getattr(source, "type", None), "collation", None) or "").strip('"')
+
+    if dialect == "sqlite":
+        return collation.upper() in ("", "BINARY")
+
+    if dialect == "postgresql":
+        return collation in ("C", "POSIX")
+
+    return False
+
+
+# Ways of comparing a column with a value regardless of case:
+#   auto:   chosen per dialect and column type when the statement is compiled.
+#   lower:  `lower(column) = :value`, served by a `lower(column)` expression index.
+#   ilike:  `column ILIKE :pattern`, served by a pg_trgm GIN index on PostgreSQL.
+#   nocase: `column = :value COLLATE NOCASE` and `column LIKE :pattern` on SQLite, served by a NOCASE index, and
+#           `lower` on other dialects.
+#   native: plain `=` and `LIKE`, for CITEXT columns and case-insensitive collations.
+CASE_INSENSITIVE_STRATEGIES = ["auto", "lower", "ilike", "nocase", "native"]
+
+LIKE_ESCAPE = "/"
+
+
+def escape_like(value: str) -> str:
+    return value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", f"{LIKE_ESCAPE}%").replace("_", f"{LIKE_ESCAPE}_")
+
+
+def is_case_insensitive_type(type_: Any) -> bool:
+    """Whether the column type compares case-insensitively by itself, i.e. CITEXT or a `_ci`/NOCASE collation."""
+    collation = (getattr(type_, "collation", None) or "").lower()
+
+    return type(type_).__name__.upper() == "CITEXT" or collation == "nocase" or "_ci" in collation
+
+
+def get_case_insensitive_strategy(source: Any, operator: str, dialect: str, strategy: str = "auto") -> str:
+    """Resolve the strategy a case-insensitive comparison compiles with.
+
+    Args:
+        source (Any): The column being compared.
+        operator (str): The comparison, one of "eq", "contains" or "startswith".
+        dialect (str): The dialect name.
+        strategy (str, optional): The strategy requested for the field. Defaults to "auto".
+
+    Returns:
+        str: One of "lower", "ilike", "nocase" or "native".
+    """
+    if strategy == "nocase" and dialect != "sqlite":
+        return "lower"
+
+    if strategy != "auto":
+        return strategy
+
+    if is_case_insensitive_type(getattr(source, "type", None)):
+        return "native"
+
+    if dialect == "postgresql":
+        return "ilike" if operator == "contains" else "lower"
+
+    if dialect == "sqlite":
+        return "nocase"
+
+    return "lower"
+
+
+class StartsWith(ColumnElement):
+    """Case-sensitive prefix match, compiled as the range `source >= :prefix AND source < :upper` where the collation
+    orders strings by code point, and as `source LIKE :prefix || '%'` elsewhere.
+    """
+
+    __visit_name__ = "sqlaf_starts_with"
+    inherit_cache = True
+    type = Boolean()
+
+    _traverse_internals = [
+        ("source", InternalTraversal.dp_clauseelement),
+        ("value", InternalTraversal.dp_clauseelement),
+        ("upper", InternalTraversal.dp_clauseelement),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("bounded", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, source: Any, value: str):
+        upper = next_prefix(value)
+
+        self.source = source
+        self.value = bindparam(None, value, type_=String())
+        self.upper = bindparam(None, upper, type_=String())
+        self.pattern = bindparam(None, escape_like(value), type_=String())
+        self.bounded = upper is not None
+
+    def build(self, dialect: str) -> ColumnElement:
+        """Build the prefix match for the dialect."""
+        if not is_binary_collation(self.source, dialect):
+            return self.source.like(self.pattern.concat(literal_column("'%'")), escape=LIKE_ESCAPE)
+
+        if not self.bounded:
+            return self.source >= self.value
+
+        return and_(self.source >= self.value, self.source < self.upper)
+
+    def self_group(self, against: Optional[Any] = None) -> ColumnElement:
+        return self
+
+    @property
+    def _from_objects(self) -> List[Any]:
+        return self.source._from_objects
+
+
+@compiles(StartsWith)
+def _compile_starts_with(element, compiler, **kw):
+    return compiler.process(element.build(compiler.dialect.name), **kw)
+
+
+class CaseInsensitive(ColumnElement):
+    """Case-insensitive equality, containment or prefix match which is compiled in the form an index can serve on each
+    dialect, see `CASE_INSENSITIVE_STRATEGIES`. The value is bound both as given and escaped for `LIKE`.
+    """
+
+    __visit_name__ = "sqlaf_case_insensitive"
+    inherit_cache = True
+    type = Boolean()
+
+    _traverse_internals = [
+        ("source", InternalTraversal.dp_clauseelement),
+        ("value", InternalTraversal.dp_clauseelement),
+        ("pattern", InternalTraversal.dp_clauseelement),
+        ("operator", InternalTraversal.dp_string),
+        ("strategy", InternalTraversal.dp_string),
+        ("negate", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, source: Any, value: str, operator: str = "eq", strategy: str = "auto", negate: bool = False):
+        self.source = source
+        self.operator = operator
+        self.strategy = strategy
+        self.negate = negate
+        self.value = bindparam(None, value, type_=String()) if operator == "eq" else None
+        self.pattern = bindparam(None, escape_like(value), type_=String())
+
+    def get_strategy(self, dialect: str) -> str:
+        return get_case_insensitive_strategy(self.source, self.operator, dialect, self.strategy)
+
+    def build(self, dialect: str) -> ColumnElement:
+        """Build the comparison for the dialect."""
+        strategy = self.get_strategy(dialect)
+        source = self.source
+
+        if self.operator == "contains":
+            pattern = literal_column("'%'").concat(self.pattern).concat(literal_column("'%'"))
+        elif self.operator == "startswith":
+            pattern = self.pattern.concat(literal_column("'%'"))
+        else:
+            pattern = self.pattern
+
+        if strategy == "ilike":
+            expression = source.ilike(pattern, escape=LIKE_ESCAPE)
+        elif self.operator != "eq":
+            expression = (func.lower(source) if strategy == "lower" else source).like(pattern, escape=LIKE_ESCAPE)
+        elif strategy == "lower":
+            expression = func.lower(source) == self.value
+        elif strategy == "nocase":
+            expression = source == self.value.collate("NOCASE")
+        else:
+            expression = source == self.value
+
+        return not_(expression) if self.negate else expression
+
+    def self_group(self, against: Optional[Any] = None) -> ColumnElement:
+        return self
+
+    @property
+    def _from_objects(self) -> List[Any]:
+        return self.source._from_objects
+
+
+@compiles(CaseInsensitive)
+def _compile_case_insensitive(element, compiler, **kw):
+    return compiler.process(element.build(compiler.dialect.name), **kw)
+
+
+def _quote_fts5(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _parse_web_search(query: str) -> Tuple[List[List[str]], List[str]]:
+    groups: List[List[str]] = []
+    excluded: List[str] = []
+    pending_or = False
+
+    for sign, phrase, word in re.findall(r'(-?)"([^"]*)"?|(\S+)', query):
+        if word and word.lower() == "or":
+            pending_or = bool(groups)
+            continue
+
+        negate = bool(sign) or word.startswith("-")
+        term = phrase if phrase or sign else word.lstrip("-")
+
+        if not term.strip():
+            continue
+
+        if negate:
+            excluded.append(_quote_fts5(term))
+        elif pending_or:
+            groups[-1].append(_quote_fts5(term))
+        else:
+            groups.append([_quote_fts5(term)])
+
+        pending_or = False
+
+    return groups, excluded
+
+
+def to_fts5_query(query: str) -> str:
+    """Translate a web search style query, as accepted by PostgreSQL's `websearch_to_tsquery`, into an FTS5 query.
+        Words and "quoted phrases" must all match, `or` between two terms matches either and a leading `-` excludes
+        the term. Every term is quoted, so FTS5 syntax in the query is searched for literally.
+
+        e.g.
+
+        ```
+        to_fts5_query('"dunder mifflin" paper or sales -scranton')
+        '"dunder mifflin" AND ("paper" OR "sales") NOT "scranton"'
+        ```
+
+    Args:
+        query (str): The web search style query.
+
+    Raises:
+        OperatorArgumentError: The query does not contain a term that is not excluded.
+
+    Returns:
+        str: The FTS5 query.
+    """
+    groups, excluded = _parse_web_search(query)
+
+    if not groups:
+        raise OperatorArgumentError("search must contain at least one term that is not excluded")
+
+    terms = [group[0] if len(group) == 1 else f"({' OR '.join(group)})" for group in groups]
+
+    return " AND ".join(terms) + "".join(f" NOT {term}" for term in excluded)
+
+
+def _regconfig(config: str) -> ColumnElement:
+    return literal_column("'{}'".format(config.replace("'", "''")))
+
+
+class WebSearchQuery(TypeDecorator):
+    """A web search style query, which is translated into an FTS5 query with `to_fts5_query` when it is bound on
+    SQLite, so PostgreSQL receives the query as it was given to `websearch_to_tsquery`.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect: Any) -> Optional[str]:
+        if value is None or dialect.name not in ("default", "sqlite"):
+            return value
+
+        return to_fts5_query(value)
+
+
+class Search(ColumnElement):
+    """Full-text search, compiled as `source @@ websearch_to_tsquery(config, :query)` on PostgreSQL, where the source
+    is a tsvector column or expression, and as `source MATCH :query` on SQLite, where the source is an FTS5 table or
+    one of its columns. FTS5 can not match a query without a term that is not excluded, e.g. `-scranton`, so on SQLite
+    such a query matches no rows.
+    """
+
+    __visit_name__ = "sqlaf_search"
+    inherit_cache = True
+    type = Boolean()
+
+    _traverse_internals = [
+        ("source", InternalTraversal.dp_clauseelement),
+        ("query", InternalTraversal.dp_clauseelement),
+        ("config", InternalTraversal.dp_string),
+        ("has_included_terms", InternalTraversal.dp_boolean),
+    ]
+
+    def __init__(self, source: Any, query: str, config: str = "english"):
+        self.source = source
+        self.config = config
+        self.query = bindparam(None, query, type_=WebSearchQuery())
+        self.has_included_terms = bool(_parse_web_search(query)[0])
+
+    def self_group(self, against: Optional[Any] = None) -> ColumnElement:
+        return self
+
+    @property
+    def _from_objects(self) -> List[Any]:
+        return self.source._from_objects
+
+
+class SearchRank(ColumnElement):
+    """Relevance of a full-text search match, higher is more relevant: `ts_rank` on PostgreSQL and the negated FTS5
+    `rank` of the matched table on SQLite, which is only available in a query that also filters with the match.
+    """
+
+    __visit_name__ = "sqlaf_search_rank"
+    inherit_cache = True
+    type = Float()
+
+    _traverse_internals = [
+        ("source", InternalTraversal.dp_clauseelement),
+        ("query", InternalTraversal.dp_clauseelement),
+        ("config", InternalTraversal.dp_string),
+    ]
+
+    def __init__(self, source: Any, query: str, config: str = "english"):
+        self.source = source
+        self.config = config
+        self.query = bindparam(None, query, type_=String())
+
+    @property
+    def _from_objects(self) -> List[Any]:
+        return self.source._from_objects
+
+
+@compiles(Search, "postgresql")
+def _compile_search_postgresql(element, compiler, **kw):
+    query = func.websearch_to_tsquery(_regconfig(element.config), element.query)
+
+    return compiler.process(element.source.op("@@")(query), **kw)
+
+
+@compiles(SearchRank, "postgresql")
+def _compile_search_rank_postgresql(element, compiler, **kw):
+    query = func.websearch_to_tsquery(_regconfig(element.config), element.query)
+
+    return compiler.process(func.ts_rank(element.source, query), **kw)
+
+
+def _check_search_dialect(compiler):
+    # The default dialect is used when a statement is converted to a string, which renders the SQLite form.
+    if compiler.dialect.name not in ("default", "sqlite"):
+        raise CompileError(f"full-text search is not supported by {compiler.dialect.name}")
+
+
+def _format_fts_table(element, compiler) -> str:
+    table = element.source if isinstance(element.source, Table) else element.source.table
+
+    return compiler.preparer.format_table(table)
+
+
+@compiles(Search)
+@compiles(Search, "sqlite")
+def _compile_search_sqlite(element, compiler, **kw):
+    _check_search_dialect(compiler)
+
+    if not element.has_included_terms:
+        return compiler.process(false(), **kw)
+
+    if isinstance(element.source, Table):
+        source = _format_fts_table(element, compiler)
+    else:
+        source = compiler.process(element.source, **kw)
+
+    return f"{source} MATCH {compiler.process(element.query, **kw)}"
+
+
+@compiles(SearchRank)
+@compiles(SearchRank, "sqlite")
+def _compile_search_rank_sqlite(element, compiler, **kw):
+    _check_search_dialect(compiler)
+
+    return f"-{_format_fts_table(element, compiler)}.rank"
@@ -1,9 +1,12 @@
-from typing import Any, Callable, List, Union
+import inspect
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from sqlalchemy.sql.elements import BinaryExpression
 
 from sqlaf import config
 from sqlaf.fields import IField
+from sqlaf.fields.cache import CacheInfo, TransformCache
 from sqlaf.exceptions import FieldInstantiationException, FieldValidationException
 
 
@@ -12,12 +15,21 @@ class Field(IField):
     allowed_operators: List[Union[str, Callable]] = []
     null_values: List[str] = []
 
+    def __new__(cls, *args, **kwargs):
+        field = super().__new__(cls)
+        # The arguments are kept so that `with_operator` can declare the same field with another operator.
+        field._arguments = (args, kwargs)
+        field._operator_fields = {}
+        return field
+
     def __init__(
         self,
         source,
         operator: Union[str, Callable] = "eq",
         default: Any = None,
         null_values: List[Any] = [],
+        cache_size: int = 0,
+        bounds: str = "[]",
         *args,
         **kwargs,
     ):
@@ -28,6 +40,10 @@ class Field(IField):
             operator (str, optional): The operator to use for filtering. Defaults to "eq".
             default (Any, optional): The default value to use if the value is None. Defaults to None.
             null_values (List[Any], optional): The values to treat as null e.g. "null". Defaults to [].
+            cache_size (int, optional): The number of transformed values to cache, caching is disabled if 0. Defaults
+                to 0.
+            bounds (str, optional): Whether the lower and upper bounds of the "range" operator are inclusive "[]" or
+                exclusive "()", e.g. "[)" for a half-open range. Defaults to "[]".
         """
         if self.allowed_operators and operator not in self.allowed_operators and not isinstance(operator, Callable):
             raise FieldInstantiationException(f"{operator} not supported for {self.__class__}")
@@ -35,7 +51,75 @@ class Field(IField):
         self.default = default
         self.source = source
         self.operator = operator
+        self.operator_func = self._get_operator_func(operator)
+        self.many = isinstance(operator, str) and operator.lower() in config.MULTI_VALUE_OPERATORS
+        self.range = isinstance(operator, str) and operator.lower() == "range"
         self.null_values = null_values
+        self.cache = TransformCache(cache_size) if cache_size else None
+
+        if bounds not in config.RANGE_BOUNDS:
+            raise FieldInstantiationException(f"{bounds} is not a supported range bounds.")
+
+        self.bounds = bounds
+
+        if self.range:
+            self.operator_func = partial(self.operator_func, bounds=bounds)
+
+    def with_operator(self, operator: str) -> "Field":
+        """Get the field declared with the same arguments but another operator, e.g. for a condition of a filter
+            expression such as `name.icontains=a`.
+
+        Args:
+            operator (str): The operator.
+
+        Raises:
+            FieldInstantiationException: The operator is not allowed for the field.
+
+        Returns:
+            Field: The field.
+        """
+        if operator == self.operator:
+            return self
+
+        field = self._operator_fields.get(operator)
+
+        if field is None:
+            args, kwargs = self._arguments
+            arguments = inspect.signature(type(self).__init__).bind(self, *args, **kwargs)
+            arguments.arguments["operator"] = operator
+            field = self._operator_fields[operator] = type(self)(*arguments.args[1:], **arguments.kwargs)
+
+        return field
+
+    @property
+    def accepts_list(self) -> bool:
+        """Whether the field filters with a list of values, in which case repeated query parameter keys and comma
+        separated values are all kept.
+        """
+        return self.many
+
+    def _get_operator_func(self, operator: Union[str, Callable]) -> Callable:
+        """Resolve the operator to the function that builds the filter expression, so it only happens once when the
+            field is declared rather than every time it filters.
+
+        Args:
+            operator (Union[str, Callable]): The operator key or a custom operator function.
+
+        Raises:
+            FieldInstantiationException: The operator is not a supported operator key.
+
+        Returns:
+            Callable: The operator function.
+        """
+        if isinstance(operator, Callable):
+            return operator
+
+        operator_func = config.FILTER_OPERATORS.get(operator.lower()) if isinstance(operator, str) else None
+
+        if not operator_func:
+            raise FieldInstantiationException(f"{operator} is not a supported operator.")
+
+        return operator_func
 
     def transform(self, value: Any) -> Any:
         """Function which allows for manipulation of the value being passed in i.e. if the data needs to be in a
@@ -49,9 +133,52 @@ class Field(IField):
         """
         return value
 
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Get the hits, misses, evictions and size of the transform cache.
+
+        Returns:
+            Optional[CacheInfo]: The cache statistics, or None if caching is disabled.
+        """
+        return self.cache.info() if self.cache else None
+
+    def is_cacheable(self, value: Any) -> bool:
+        """Whether the transformed value can be cached, which is not the case for values that transform differently
+            over time e.g. "now".
+
+        Args:
+            value (Any): The value to transform.
+
+        Returns:
+            bool: True if the transformed value can be cached.
+        """
+        return True
+
+    def _transform(self, value: Any) -> Any:
+        if self.cache is None or not self.is_cacheable(value):
+            return self.transform(value)
+
+        return self.cache.get(value, self.transform)
+
+    def split(self, value: Any) -> List[Any]:
+        """Split the value into the list of values used by multi value operators e.g. `in`.
+
+        Args:
+            value (Any): A list of values or a comma separated string.
+
+        Returns:
+            List[Any]: The values.
+        """
+        if isinstance(value, (list, tuple)):
+            return list(value)
+
+        if isinstance(value, str):
+            return value.split(",")
+
+        return [value]
+
     def get_filters(self, value: Any) -> BinaryExpression:
-        """Using the field source, operator and value, create a FilterHandler instance and perform the filtering which
-            will return the SQLAlchemy filters that will be required to be performed.
+        """Using the field source, operator and value, call the operator function which will return the SQLAlchemy
+            filters that will be required to be performed.
 
         Args:
             value (Any): The value to filter with.
@@ -59,33 +186,83 @@ class Field(IField):
         Returns:
             BinaryExpression: An SQLAlchemy BinaryExpression filter.
         """
-        operator_func = None
+        return self.operator_func(self.source, value)
 
-        if isinstance(self.operator, Callable):
-            operator_func = self.operator
-        elif isinstance(self.operator, str):
-            operator_func = config.FILTER_OPERATORS.get(self.operator.lower())
+    def split_range(self, value: Any) -> Tuple[Any, Any]:
+        """Split a range, e.g. "2..7", "2020-01-01.." or "..2020-02-01", into its transformed lower and upper bounds,
+            where a missing bound is `None`.
 
-        if not operator_func:
-            raise NotImplementedError(f"{self.operator} is not a supported operator.")
+        Args:
+            value (Any): The range string or a (lower, upper) pair.
 
-        return operator_func(self.source, value)
+        Raises:
+            FieldValidationException: The value is not a range, the range is empty or its bounds cannot be compared.
 
-    def filter(self, value: Any) -> BinaryExpression:
-        """Facade function for transforming the data and then performing the filtering.
+        Returns:
+            Tuple[Any, Any]: The lower and upper bounds.
+        """
+        if isinstance(value, (list, tuple)) and len(value) == 2:
+            lower, upper = value
+        elif isinstance(value, str) and ".." in value:
+            lower, _, upper = value.partition("..")
+        else:
+            raise FieldValidationException(f"{value} is not a range e.g. 1..5.")
+
+        lower = self._transform(lower) if lower not in (None, "") else None
+        upper = self._transform(upper) if upper not in (None, "") else None
+
+        if lower is None and upper is None:
+            raise FieldValidationException(f"{value} does not have a lower or upper bound.")
+
+        try:
+            is_empty = (
+                lower is not None and upper is not None and (lower > upper or (lower == upper and self.bounds != "[]"))
+            )
+        except TypeError:
+            raise FieldValidationException(f"The bounds of {value} cannot be compared.")
+
+        if is_empty:
+            raise FieldValidationException(f"{value} is an empty range.")
+
+        return lower, upper
+
+    def clean(self, value: Any) -> Any:
+        """Convert the raw value into the value the operator is called with, treating null values as `None` and
+            transforming each value of multi value operators and both bounds of ranges.
 
         Args:
-            value (Any): The value to filter with.
+            value (Any): The raw value.
 
         Raises:
             e: FieldValidationException
 
         Returns:
-            BinaryExpression: An SQLAlchemy BinaryExpression filter.
+            Any: The transformed value.
         """
         try:
-            value = None if value in self.null_values else self.transform(value)
+            if value in self.null_values:
+                return None
+
+            if self.many:
+                return [self._transform(v) for v in self.split(value)]
+
+            if self.range:
+                return self.split_range(value)
+
+            return self._transform(value)
         except FieldValidationException as e:
             raise e
 
-        return self.get_filters(value)
+    def filter(self, value: Any) -> BinaryExpression:
+        """Facade function for transforming the data and then performing the filtering.
+
+        Args:
+            value (Any): The value to filter with.
+
+        Raises:
+            e: FieldValidationException
+
+        Returns:
+            BinaryExpression: An SQLAlchemy BinaryExpression filter.
+        """
+        return self.get_filters(self.clean(value))
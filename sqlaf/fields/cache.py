@@ -0,0 +1,77 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Any, Callable
+
+from sqlaf.exceptions import SQLAlchemyFiltersBaseException
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class TransformCache:
+    def __init__(self, maxsize: int):
+        """Size bounded least recently used cache of transformed values, keyed by the type and value of the raw input.
+            Validation exceptions are cached as well and raised again on a hit.
+
+        Args:
+            maxsize (int): The maximum number of values to keep.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, value: Any, transform: Callable[[Any], Any]) -> Any:
+        """Get the transformed value from the cache, transforming and caching it on a miss. Unhashable values are
+            transformed without being cached.
+
+        Args:
+            value (Any): The raw value.
+            transform (Callable[[Any], Any]): The transform function.
+
+        Returns:
+            Any: The transformed value.
+        """
+        key = (type(value), value)
+
+        try:
+            with self._lock:
+                result = self._data[key]
+                self._data.move_to_end(key)
+                self.hits += 1
+        except KeyError:
+            result = self._transform(key, value, transform)
+        except TypeError:
+            return transform(value)
+
+        error, result = result
+
+        if error:
+            raise result[0](*result[1])
+
+        return result
+
+    def _transform(self, key: Any, value: Any, transform: Callable[[Any], Any]) -> Any:
+        try:
+            result = (False, transform(value))
+        except SQLAlchemyFiltersBaseException as e:
+            result = (True, (type(e), e.args))
+
+        with self._lock:
+            self.misses += 1
+            self._data[key] = result
+
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+        return result
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
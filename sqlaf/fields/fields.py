@@ -1,15 +1,60 @@
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from decimal import Decimal, InvalidOperation
 from enum import Enum, IntEnum
-from typing import Any, Callable, List, Union
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+from sqlalchemy import Boolean, Date, DateTime, Integer, Numeric, Table, Time, literal_column, or_, select
+from sqlalchemy.sql.elements import ColumnElement
 
+from sqlaf import config, operators
 from sqlaf.exceptions import FieldInstantiationException, FieldValidationException
 from sqlaf.fields import Field
+from sqlaf.expressions import CASE_INSENSITIVE_STRATEGIES, Search, SearchRank
+from sqlaf.utils import ROUNDINGS, get_datetime_parser, is_relative_datetime, resolve_relative_datetime
 
 
 class CharField(Field):
 
-    allowed_operators = ["eq", "~eq", "ieq", "~ieq", "contains", "icontains"]
+    allowed_operators = [
+        "eq",
+        "~eq",
+        "ieq",
+        "~ieq",
+        "contains",
+        "icontains",
+        "startswith",
+        "istartswith",
+        "endswith",
+        "in",
+        "~in",
+    ]
+
+    def __init__(
+        self,
+        source,
+        operator: Union[str, Callable] = "eq",
+        default: Any = None,
+        null_values: List[Any] = [],
+        case_insensitive: str = "auto",
+        **kwargs,
+    ):
+        """Field for string columns.
+
+        Args:
+            case_insensitive (str, optional): How the case-insensitive operators compile, one of "auto", "lower",
+                "ilike", "nocase" or "native". "auto" picks the form per dialect and column type when the statement
+                is compiled. Defaults to "auto".
+        """
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
+
+        if case_insensitive not in CASE_INSENSITIVE_STRATEGIES:
+            raise FieldInstantiationException(f"{case_insensitive} is not a supported case_insensitive strategy.")
+
+        self.case_insensitive = case_insensitive
+
+        if case_insensitive != "auto" and isinstance(operator, str) and operator in config.CASE_INSENSITIVE_OPERATORS:
+            self.operator_func = partial(self.operator_func, strategy=case_insensitive)
 
     def transform(self, value: Any) -> str:
         value = super().transform(value)
@@ -20,9 +65,74 @@ class CharField(Field):
             raise FieldValidationException(f"{value} is not of type string.")
 
 
+class SearchField(Field):
+
+    allowed_operators = ["search"]
+
+    def __init__(
+        self,
+        source,
+        operator: Union[str, Callable] = "search",
+        default: Any = None,
+        null_values: List[Any] = [],
+        config: str = "english",
+        fts_table: Optional[Table] = None,
+        **kwargs,
+    ):
+        """Full-text search with a web search style query, e.g. `"dunder mifflin" paper or sales -scranton`.
+
+        Args:
+            source: A tsvector column or expression on PostgreSQL, or a column of an FTS5 table on SQLite. When
+                `fts_table` is given, the column holding the rowid of the FTS5 table's rows.
+            config (str, optional): The PostgreSQL text search configuration. Defaults to "english".
+            fts_table (Table, optional): The SQLite FTS5 table to search, matching rows are found by rowid. Defaults
+                to None.
+        """
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
+        self.config = config
+        self.fts_table = fts_table
+
+        if operator == "search":
+            self.operator_func = partial(self.operator_func, config=config, fts_table=fts_table)
+
+    def transform(self, value: Any) -> str:
+        value = super().transform(value)
+
+        if not isinstance(value, str) or not value.strip():
+            raise FieldValidationException(f"{value} is not a valid search.")
+
+        return value
+
+    def rank(self, value: Any) -> ColumnElement:
+        """Get the relevance of the rows matching the search, for ordering, higher is more relevant.
+
+            e.g.
+
+            ```
+            query.order_by(BookingFilter.search.rank(data["search"]).desc())
+            ```
+
+        Args:
+            value (Any): The search.
+
+        Returns:
+            ColumnElement: The rank expression.
+        """
+        value = self.transform(value)
+
+        if self.fts_table is None:
+            return SearchRank(self.source, value, self.config)
+
+        return (
+            select(SearchRank(self.fts_table, value, self.config))
+            .where(Search(self.fts_table, value, self.config), literal_column("rowid") == self.source)
+            .scalar_subquery()
+        )
+
+
 class IntegerField(Field):
 
-    allowed_operators = ["eq", "~eq", "gt", "gte", "lt", "lte"]
+    allowed_operators = ["eq", "~eq", "gt", "gte", "lt", "lte", "in", "~in", "range"]
 
     def transform(self, value: Any) -> int:
         value = super().transform(value)
@@ -36,9 +146,30 @@ class IntegerField(Field):
             raise FieldValidationException(f"{value} is not of type integer.")
 
 
+class DecimalField(Field):
+
+    allowed_operators = ["eq", "~eq", "gt", "gte", "lt", "lte", "in", "~in", "range"]
+
+    def transform(self, value: Any) -> Decimal:
+        value = super().transform(value)
+
+        if value is None:
+            return value
+
+        try:
+            value = Decimal(str(value))
+        except (InvalidOperation, ValueError):
+            raise FieldValidationException(f"{value} is not of type decimal.")
+
+        if not value.is_finite():
+            raise FieldValidationException(f"{value} is not a finite decimal.")
+
+        return value
+
+
 class EnumField(Field):
 
-    allowed_operators = ["eq", "~eq"]
+    allowed_operators = ["eq", "~eq", "in", "~in"]
 
     def __init__(
         self,
@@ -47,8 +178,9 @@ class EnumField(Field):
         operator: Union[str, Callable] = "eq",
         default: Any = None,
         null_values: List[Any] = [],
+        **kwargs,
     ):
-        super().__init__(source, operator=operator, default=default, null_values=null_values)
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
 
         if not enum_class:
             raise FieldInstantiationException("`enum_class` cannot be None.")
@@ -81,8 +213,9 @@ class BooleanField(Field):
         falsy: List = [],
         default: Any = None,
         null_values: List[Any] = [],
+        **kwargs,
     ):
-        super().__init__(source, operator=operator, default=default, null_values=null_values)
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
 
         if truthy and isinstance(truthy, list):
             self.truthy = truthy
@@ -104,7 +237,7 @@ class BooleanField(Field):
 
 class ArrayField(Field):
 
-    allowed_operators = ["contains", "~contains"]
+    allowed_operators = ["contains", "~contains", "overlap", "contained_by", "any"]
 
     def __init__(
         self,
@@ -112,24 +245,79 @@ class ArrayField(Field):
         operator: Union[str, Callable] = "contains",
         default: Any = None,
         null_values: List[Any] = [],
+        enum_class: Optional[Enum] = None,
+        **kwargs,
     ):
-        super().__init__(source, operator=operator, default=default, null_values=null_values)
+        """Field for array columns, the values are converted to the item type of the array.
+
+        Args:
+            enum_class (Enum, optional): Enum the items must be values of, the enum of an `Enum` item type is used if
+                not given. Defaults to None.
+        """
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
+        self.item_type = getattr(getattr(source, "type", None), "item_type", None)
+        self.enum_class = enum_class
+
+    @property
+    def accepts_list(self) -> bool:
+        return True
+
+    def transform_item(self, item: Any) -> Any:
+        """Convert an item of the array to the item type of the array, e.g. an integer for `ARRAY(Integer)`.
+
+        Args:
+            item (Any): The item.
+
+        Raises:
+            FieldValidationException: The item is not of the item type.
+
+        Returns:
+            Any: The converted item.
+        """
+        item_enum_class = getattr(self.item_type, "enum_class", None)
+
+        try:
+            if self.enum_class:
+                return self.enum_class(int(item) if issubclass(self.enum_class, IntEnum) else item).value
+
+            if item_enum_class:
+                return item if isinstance(item, item_enum_class) else item_enum_class[item]
+
+            python_type = self.item_type.python_type if self.item_type is not None else str
+        except (KeyError, TypeError, ValueError):
+            raise FieldValidationException(f"{item} is not a valid {(self.enum_class or item_enum_class).__name__}.")
+        except NotImplementedError:
+            return item
+
+        if isinstance(item, python_type) or not isinstance(item, str):
+            return item
+
+        try:
+            if python_type is bool:
+                return {"true": True, "1": True, "false": False, "0": False}[item.lower()]
+
+            if python_type in (date, datetime):
+                return python_type.fromisoformat(item)
+
+            return python_type(item)
+        except (KeyError, TypeError, ValueError):
+            raise FieldValidationException(f"{item} is not of type {python_type.__name__}.")
 
     def transform(self, value: Any):
         value = super().transform(value)
 
-        if isinstance(value, list):
-            return value
+        if isinstance(value, str):
+            value = value.split(",")
 
-        if not isinstance(value, str):
+        if not isinstance(value, (list, tuple)):
             return None
 
-        return value.split(",")
+        return [self.transform_item(item) for item in value]
 
 
 class DateField(Field):
 
-    allowed_operators = ["eq", "~eq", "gt", "gte", "lt", "lte"]
+    allowed_operators = ["eq", "~eq", "gt", "gte", "lt", "lte", "range"]
     format = "%Y-%m-%d"
 
     def __init__(
@@ -137,21 +325,53 @@ class DateField(Field):
         source,
         operator: Union[str, Callable] = "eq",
         format: str = None,
+        timezone: tzinfo = timezone.utc,
+        rounding: Optional[str] = None,
         default: Any = None,
         null_values: List[Any] = [],
+        **kwargs,
     ):
-        super().__init__(source, operator=operator, default=default, null_values=null_values)
+        """Field for a date column, which also accepts relative date expressions e.g. "today-7d", see
+            `sqlaf.utils.resolve_relative_datetime`.
+
+        Args:
+            format (str, optional): The format of the value. Defaults to "%Y-%m-%d".
+            timezone (tzinfo, optional): The timezone relative date expressions are evaluated in. Defaults to UTC.
+            rounding (str, optional): The precision relative date expressions are rounded down to, "second",
+                "minute", "hour" or "day". Defaults to `config.RELATIVE_DATETIME_ROUNDING`.
+        """
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
 
         if format:
             self.format = format
 
+        if rounding is not None and rounding not in ROUNDINGS:
+            raise FieldInstantiationException(f"{rounding} is not a supported rounding.")
+
+        self.timezone = timezone
+        self.rounding = rounding
+        self._parse = get_datetime_parser(self.format)
+
+    @property
+    def _is_aware(self) -> bool:
+        return "%z" in self.format or "%Z" in self.format
+
     def _parse_datetime_string(self, value: Any):
-        return datetime.strptime(value, self.format).date()
+        return self._parse(value).date()
+
+    def _from_relative(self, value: datetime):
+        return value.date()
+
+    def is_cacheable(self, value: Any) -> bool:
+        return not is_relative_datetime(value)
 
     def transform(self, value: Any):
         if isinstance(value, date):
             return value
 
+        if is_relative_datetime(value):
+            return self._from_relative(resolve_relative_datetime(value, self.timezone, self.rounding))
+
         try:
             return self._parse_datetime_string(value)
         except ValueError:
@@ -163,8 +383,154 @@ class DateTimeField(DateField):
     datetime_type = datetime
     format = "%Y-%m-%dT%H:%M:%S%z"
 
+    # The format of a coarse value, e.g. "2020-01-01", for each granularity.
+    granularity_formats = {"month": "%Y-%m", "day": "%Y-%m-%d", "hour": "%Y-%m-%dT%H"}
+
+    def __init__(
+        self,
+        source,
+        operator: Union[str, Callable] = "eq",
+        format: str = None,
+        granularity: Optional[str] = None,
+        timezone: tzinfo = timezone.utc,
+        rounding: Optional[str] = None,
+        default: Any = None,
+        null_values: List[Any] = [],
+        **kwargs,
+    ):
+        """Field for a timestamp column.
+
+        Args:
+            granularity (str, optional): Filter by the whole "month", "day" or "hour" the value falls in, e.g.
+                `2020-01-01` matches any time on that day, compiled as a half-open range on the column so an index on
+                it can still be used. Defaults to None.
+            timezone (tzinfo, optional): The timezone the periods start and end, and relative date expressions are
+                evaluated, in. Naive columns are assumed to store UTC, and relative values are naive when the format
+                is. Defaults to UTC.
+        """
+        super().__init__(
+            source,
+            operator=operator,
+            format=format,
+            timezone=timezone,
+            rounding=rounding,
+            default=default,
+            null_values=null_values,
+            **kwargs,
+        )
+
+        if granularity is not None and granularity not in self.granularity_formats:
+            raise FieldInstantiationException(
+                f"{granularity} is not a supported granularity, expected one of: {', '.join(self.granularity_formats)}."
+            )
+
+        self.granularity = granularity
+
+        if granularity is not None:
+            self._parse_period = get_datetime_parser(self.granularity_formats[granularity])
+
     def _parse_datetime_string(self, value: Any):
-        return datetime.strptime(value, self.format)
+        return self._parse(value)
+
+    def _from_relative(self, value: datetime):
+        # Match the parsed values, so that a naive value and a relative value can bound the same range.
+        return value if self._is_aware else value.replace(tzinfo=None)
+
+    def _localize(self, value: datetime) -> datetime:
+        localize = getattr(self.timezone, "localize", None)
+        return localize(value) if localize else value.replace(tzinfo=self.timezone)
+
+    def truncate(self, value: datetime) -> datetime:
+        """Get the start of the period the value falls in, in the timezone of the field. Naive values are taken to be
+            in the timezone of the field.
+
+        Args:
+            value (datetime): The value.
+
+        Returns:
+            datetime: The start of the period.
+        """
+        if value.tzinfo is not None:
+            value = value.astimezone(self.timezone).replace(tzinfo=None)
+
+        value = value.replace(minute=0, second=0, microsecond=0)
+
+        if self.granularity != "hour":
+            value = value.replace(hour=0)
+
+        if self.granularity == "month":
+            value = value.replace(day=1)
+
+        return self._localize(value)
+
+    def next_period(self, start: datetime) -> datetime:
+        """Get the start of the period after the period starting at `start`.
+
+        Args:
+            start (datetime): The start of a period.
+
+        Returns:
+            datetime: The start of the next period.
+        """
+        if self.granularity == "hour":
+            return (start.astimezone(timezone.utc) + timedelta(hours=1)).astimezone(self.timezone)
+
+        value = start.replace(tzinfo=None)
+
+        if self.granularity == "day":
+            return self._localize(value + timedelta(days=1))
+
+        return self._localize((value.replace(day=28) + timedelta(days=4)).replace(day=1))
+
+    def transform(self, value: Any):
+        if self.granularity is None:
+            return super().transform(value)
+
+        if isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day)
+        elif not isinstance(value, datetime):
+            try:
+                value = self._parse_period(value)
+            except (TypeError, ValueError):
+                value = super().transform(value)
+
+        return self.truncate(value)
+
+    def _to_column(self, value: Optional[datetime]) -> Optional[datetime]:
+        if value is None or getattr(getattr(self.source, "type", None), "timezone", False):
+            return value
+
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def get_filters(self, value: Any) -> Any:
+        if self.granularity is None or not isinstance(self.operator, str) or value is None:
+            return super().get_filters(value)
+
+        if self.range:
+            lower, upper = value
+            lower = lower if lower is None or self.bounds[0] == "[" else self.next_period(lower)
+            upper = upper if upper is None or self.bounds[1] == ")" else self.next_period(upper)
+        else:
+            lower, upper = value, self.next_period(value)
+
+        lower, upper = self._to_column(lower), self._to_column(upper)
+
+        if self.operator == "~eq":
+            return or_(self.source < lower, self.source >= upper)
+
+        if self.operator == "gt":
+            return self.source >= upper
+
+        if self.operator == "gte":
+            return self.source >= lower
+
+        if self.operator == "lt":
+            return self.source < lower
+
+        if self.operator == "lte":
+            return self.source < upper
+
+        return operators.range_(self.source, (lower, upper), bounds="[)")
 
 
 class TimeField(DateField):
@@ -172,7 +538,103 @@ class TimeField(DateField):
     format = "%H:%M:%S%z"
 
     def _parse_datetime_string(self, value: Any):
-        if "%z" in self.format or "%Z" in self.format:
-            return datetime.strptime(value, self.format).timetz()
+        if self._is_aware:
+            return self._parse(value).timetz()
+
+        return self._parse(value).time()
+
+    def _from_relative(self, value: datetime):
+        return value.timetz() if self._is_aware else value.time()
+
+
+class JSONField(Field):
+
+    allowed_operators = ["eq", "~eq", "contains", "in", "gt", "gte", "lt", "lte", "range"]
+
+    # Operators compiled to `@>` containment, which a `jsonb_path_ops` GIN index can serve.
+    containment_operators = ["eq", "~eq", "contains", "in"]
+
+    # The types the extracted text is cast to for range operators, by the field that transforms the value.
+    cast_types = [
+        (DateTimeField, DateTime(timezone=True)),
+        (TimeField, Time()),
+        (DateField, Date()),
+        (IntegerField, Integer()),
+        (DecimalField, Numeric()),
+        (BooleanField, Boolean()),
+    ]
+
+    def __init__(
+        self,
+        source,
+        path: str,
+        operator: Union[str, Callable] = "eq",
+        value_field: Union[Field, Type[Field]] = CharField,
+        default: Any = None,
+        null_values: List[Any] = [],
+        **kwargs,
+    ):
+        """Field for a value within a JSONB column.
+
+        Args:
+            path (str): The dot separated path of the value within the document, e.g. "address.city".
+            value_field (Union[Field, Type[Field]], optional): The field, or field class, whose transform converts
+                the value, e.g. `IntegerField` so that `"2"` matches the JSON number `2`. Defaults to CharField.
+        """
+        super().__init__(source, operator=operator, default=default, null_values=null_values, **kwargs)
+        self.path = path.split(".")
+        self.value_field = value_field(source) if isinstance(value_field, type) else value_field
+        self.many = self.many or operator == "contains"
+
+    def transform(self, value: Any) -> Any:
+        return self.value_field.transform(super().transform(value))
+
+    def get_document(self, value: Any) -> Dict[str, Any]:
+        """Nest the value in a document at the path, e.g. `{"address": {"city": "Scranton"}}`.
+
+        Args:
+            value (Any): The value.
+
+        Returns:
+            Dict[str, Any]: The document.
+        """
+        document = _to_json(value)
+
+        for key in reversed(self.path):
+            document = {key: document}
+
+        return document
+
+    def get_extraction(self) -> Any:
+        """Get the value at the path as text, cast to the type of the `value_field`."""
+        text = self.source[tuple(self.path)].astext
+        cast_type = next((type_ for cls, type_ in self.cast_types if isinstance(self.value_field, cls)), None)
+
+        return text.cast(cast_type) if cast_type is not None else text
+
+    def get_filters(self, value: Any) -> Any:
+        if self.operator not in self.containment_operators:
+            return self.operator_func(self.get_extraction(), value)
+
+        if self.operator == "in":
+            return or_(*[self.source.contains(self.get_document(v)) for v in value])
+
+        filter_expression = self.source.contains(self.get_document(value))
+
+        return ~filter_expression if self.operator == "~eq" else filter_expression
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
 
-        return datetime.strptime(value, self.format).time()
+    return value
@@ -1,28 +1,148 @@
-from typing import Any, Dict, List
+import inspect
+import warnings
+from time import perf_counter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
+from sqlalchemy import (
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+    and_,
+    false,
+    func,
+    literal,
+    not_,
+    null,
+    or_,
+    select,
+    tuple_,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.engine import Result
 from sqlalchemy.orm.query import Query
-from sqlalchemy.sql.elements import BinaryExpression
+from sqlalchemy.sql.dml import Delete, Update
+from sqlalchemy.sql.elements import BinaryExpression, ColumnElement
+from sqlalchemy.sql.selectable import Select
 
-from sqlaf.exceptions import QueryParamaterDataException, SQLAlchemyFiltersBaseException
-from sqlaf.fields import Field
+from sqlaf import caching, grammar, instrumentation, pagination, simplifier
+from sqlaf.exceptions import (
+    FieldInstantiationException,
+    QueryParamaterDataException,
+    SQLAlchemyFiltersBaseException,
+    UnindexedOrderingWarning,
+)
+from sqlaf.fields import BooleanField, CharField, EnumField, Field
 from sqlaf.filters import IFilter
-from sqlaf.utils import get_public_attrs, parse_query_string
+from sqlaf.utils import parse_query_string
+
+Statement = Union[Query, Select, Update, Delete]
+
+# The fields `Filter.facets` can count the values of.
+FACET_FIELDS = (BooleanField, CharField, EnumField)
 
 
 class Filter(IFilter):
+
+    _fields: Dict[str, Field] = {}
+    _multi_value_keys: FrozenSet[str] = frozenset()
+    _query_string_keys: Optional[FrozenSet[str]] = None
+
+    # Keys used by `post_filter` that should be parsed from a query string as well as the declared fields. If
+    # `post_filter` is overridden and this is not set, every key in a query string is parsed.
+    post_filter_keys: Optional[List[str]] = None
+
+    # The key of a boolean filter expression combining conditions on the declared fields, e.g.
+    # `?where=or(name.icontains=a,size.gte=3)`, see `sqlaf.grammar`. Expressions are not accepted if None.
+    expression_key: Optional[str] = None
+    expression_max_depth: Optional[int] = None
+    expression_max_nodes: Optional[int] = None
+
+    # Whether the filters of the last call to `filter` can never match, which is only detected when `simplify` is set.
+    is_empty: bool = False
+
+    # The columns the results can be ordered by, keyed by the name used with the ordering key, e.g.
+    # `?ordering=-created,name`. Each should be the leading column of an index, see `paginate`.
+    ordering: Dict[str, Any] = {}
+    default_ordering: Optional[str] = None
+    ordering_key: str = "ordering"
+    cursor_key: str = "cursor"
+    page_size: int = 20
+    # The columns added to every ordering so that the sort key of each row is unique. Defaults to the primary key of
+    # the table of the first ordering column.
+    tiebreaker: Optional[List[Any]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Build the field registry for the `Filter` subclass once, when the class is created, so that filtering
+        only has to touch the declared fields.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._fields = cls._get_declared_fields()
+        cls._multi_value_keys = frozenset(key for key, field in cls._fields.items() if field.accepts_list)
+        cls._query_string_keys = (
+            None
+            if cls.post_filter is not Filter.post_filter and cls.post_filter_keys is None
+            else frozenset(cls._fields).union(
+                cls.post_filter_keys or (),
+                [cls.expression_key] if cls.expression_key else (),
+                [cls.ordering_key, cls.cursor_key] if cls.ordering else (),
+            )
+        )
+
+        if cls.ordering:
+            cls._check_ordering()
+
+    @classmethod
+    def _check_ordering(cls):
+        """Resolve the tie-breaker and warn about ordering columns that are not the leading column of an index."""
+        for key, column in cls.ordering.items():
+            if not _is_indexed(column):
+                warnings.warn(
+                    f"The `{key}` ordering of {cls.__name__} is not the leading column of an index.",
+                    UnindexedOrderingWarning,
+                )
+
+        if cls.tiebreaker is None:
+            column = next(iter(cls.ordering.values()))
+            table = getattr(_get_column(column), "table", None)
+
+            if table is None or not table.primary_key.columns:
+                raise FieldInstantiationException(f"{cls.__name__} needs a tiebreaker, as {column} has no primary key.")
+
+            cls.tiebreaker = list(table.primary_key.columns)
+
+    @classmethod
+    def _get_declared_fields(cls) -> Dict[str, Field]:
+        """Get the public `Field` class attributes declared on the `Filter` class and its parents. The closest
+            declaration of an attribute wins, so a subclass can remove an inherited field by setting it to `None`.
+
+        Returns:
+            Dict[str, Field]: The declared fields keyed by attribute name, in alphabetical order.
+        """
+        attributes: Dict[str, Any] = {}
+
+        for klass in reversed(cls.__mro__):
+            attributes.update(vars(klass))
+
+        return {
+            key: value
+            for key, value in sorted(attributes.items())
+            if not key.startswith("_") and isinstance(value, Field)
+        }
+
     def _get_filter_attributes(self) -> List[str]:
-        """Get the public class attributes from the `Filter` class.
+        """Get the names of the fields declared on the `Filter` class.
 
         Returns:
-            List[str]: A list of public class attributes.
+            List[str]: A list of field attribute names.
         """
-        return get_public_attrs(self)
+        return list(self._fields)
 
     def _transform_data(self, data: Any) -> Dict:
         """Transfer the data into a dictionary if it's not already in dictionary format.
 
         Args:
-            data (Any): Query parameters in string or dictionary format.
+            data (Any): Query parameters in string, bytes or dictionary format. Only the keys of the declared fields and
+                `post_filter_keys` are parsed from a query string.
 
         Returns:
             Dict: Query parameters in dictionary format.
@@ -30,38 +150,584 @@ class Filter(IFilter):
         if isinstance(data, dict):
             return data
 
-        if isinstance(data, str):
-            return parse_query_string(data)
+        if isinstance(data, (str, bytes)):
+            return parse_query_string(data, multi_value_keys=self._multi_value_keys, keys=self._query_string_keys)
 
-        raise QueryParamaterDataException("data must be in dictionary or string format.")
+        raise QueryParamaterDataException("data must be in dictionary, string or bytes format.")
 
-    def filter(self, data: Any) -> Query:
-        """Perform the filtering dependent on the `Filter` class config.
+    def filter(self, data: Any) -> Statement:
+        """Perform the filtering dependent on the `Filter` class config. The filters are applied with `where`, so the
+            `Filter` can be given an ORM `Query`, or a `Select`, `Update` or `Delete` statement.
 
         Args:
             data (Any): The data to perform the filtering with.
 
+            If the `Filter` was created with `simplify=True`, comparisons on the same column are merged and duplicate
+            filters removed, see `sqlaf.simplifier`. When the filters can never match, e.g. `size >= 10 AND size <= 5`,
+            `is_empty` is set and the statement is filtered with `false()`.
+
         Returns:
-            Query: Returns the original query with the filters generated from the filtering mechanism appended.
+            Statement: Returns the original query with the filters generated from the filtering mechanism appended.
         """
-        data = self._transform_data(data)
-        filters: List[BinaryExpression] = []
+        tracer = instrumentation.get_tracer()
+
+        if tracer is None:
+            data = self._transform_data(data)
+        else:
+            filter_name = caching.get_filter_name(self)
+            start = perf_counter()
+            data = self._transform_data(data)
+            tracer.timing(filter_name, instrumentation.PARSE, perf_counter() - start)
+
+        sort_keys = self.get_ordering(data)[1] if self.ordering else []
+        filters = self._get_filters(data, tracer)[1]
+
+        self.is_empty = False
+
+        if self._simplify:
+            filters, self.is_empty = simplifier.simplify(filters)
+
+            if self.is_empty:
+                filters = [false()]
+
+        query = self._query
 
-        for key in self._get_filter_attributes():
-            field = getattr(self, key)
+        if self.ordering and isinstance(query, (Query, Select)):
+            query = query.order_by(*[pagination.order_by(column, descending) for column, descending in sort_keys])
+
+        if caching.is_tracking() or instrumentation.is_instrumenting_engines():
+            query = query.execution_options(**{caching.EXECUTION_OPTION: caching.get_filter_name(self)})
+
+        return query.where(*filters)
+
+    def _get_filters(
+        self, data: Dict, tracer: Optional[instrumentation.Tracer] = None
+    ) -> Tuple[Dict[str, ColumnElement], List[ColumnElement]]:
+        """Build the filters of the declared fields, the filter expression and `post_filter`.
+
+        Args:
+            data (Dict): Dictionary containing filter key values pairs.
+            tracer (instrumentation.Tracer, optional): The active tracer. Defaults to None.
+
+        Returns:
+            Tuple[Dict[str, ColumnElement], List[ColumnElement]]: The filters of the declared fields keyed by field
+                key, and every filter to apply.
+        """
+        filter_name = caching.get_filter_name(self) if tracer is not None else None
+        field_filters: Dict[str, ColumnElement] = {}
+
+        for key, field in self._fields.items():
+            if key not in data and field.default is None:
+                continue
+
+            value = data.get(key, field.default)
+
+            try:
+                if tracer is None:
+                    filter_expression = field.filter(value=value)
+                else:
+                    filter_expression = self._trace_field(tracer, filter_name, key, field, value)
+            except SQLAlchemyFiltersBaseException as e:
+                if tracer is not None:
+                    tracer.failure(filter_name, key, e)
+
+                if self._raise_exceptions:
+                    raise e
 
-            if not field or not isinstance(field, Field) or (key not in data and field.default is None):
                 continue
 
+            if self._bind_parameters:
+                filter_expression = caching.bind_parameters(
+                    filter_expression, key, None if value in field.null_values else value
+                )
+
+            field_filters[key] = filter_expression
+
+        filters = list(field_filters.values())
+
+        if self.expression_key is not None and self.expression_key in data:
             try:
-                filter_expression = field.filter(value=data.get(key, field.default))
-                filters.append(filter_expression)
+                filters.append(self._get_expression_filter(data[self.expression_key], tracer))
             except SQLAlchemyFiltersBaseException as e:
+                if tracer is not None:
+                    tracer.failure(filter_name, self.expression_key, e)
+
                 if self._raise_exceptions:
                     raise e
 
-        self.post_filter(data, filters)
-        return self._query.filter(*filters)
+        if tracer is None:
+            self.post_filter(data, filters)
+        else:
+            start = perf_counter()
+            self.post_filter(data, filters)
+            tracer.timing(filter_name, instrumentation.POST_FILTER, perf_counter() - start)
+
+        return field_filters, filters
+
+    def _get_expression_filter(self, value: Any, tracer: Optional[instrumentation.Tracer] = None) -> ColumnElement:
+        """Parse a boolean filter expression and compile it into a single filter, where each condition is built by
+            the declared field, with the condition's operator if it has one. If any condition is invalid the whole
+            expression is, so that a failed condition can not widen an `or`.
+
+        Args:
+            value (Any): The filter expression.
+            tracer (instrumentation.Tracer, optional): The active tracer. Defaults to None.
+
+        Raises:
+            QueryParamaterDataException: The expression is invalid or a condition is not on a declared field.
+
+        Returns:
+            ColumnElement: The filter.
+        """
+        node = grammar.parse_expression(value, self.expression_max_depth, self.expression_max_nodes)
+        conditions: List[grammar.Condition] = []
+
+        def compile_node(node: grammar.Node) -> ColumnElement:
+            if isinstance(node, grammar.Group):
+                children = [compile_node(child) for child in node.children]
+
+                if node.operator == grammar.NOT:
+                    return not_(children[0])
+
+                return (and_ if node.operator == grammar.AND else or_)(*children)
+
+            field = self._fields.get(node.key)
+
+            if field is None:
+                raise QueryParamaterDataException(f"{node.key} is not a filter field.")
+
+            if node.operator is not None:
+                try:
+                    field = field.with_operator(node.operator)
+                except FieldInstantiationException:
+                    raise QueryParamaterDataException(f"{node.operator} is not supported for {node.key}.")
+
+            if tracer is None:
+                filter_expression = field.filter(value=node.value)
+            else:
+                filter_expression = self._trace_field(
+                    tracer, caching.get_filter_name(self), node.key, field, node.value
+                )
+
+            if self._bind_parameters:
+                filter_expression = caching.bind_parameters(
+                    filter_expression,
+                    f"{self.expression_key}_{len(conditions)}",
+                    None if node.value in field.null_values else node.value,
+                )
+
+            conditions.append(node)
+            return filter_expression
+
+        return compile_node(node)
+
+    @staticmethod
+    def _trace_field(
+        tracer: instrumentation.Tracer, filter_name: str, key: str, field: Field, value: Any
+    ) -> BinaryExpression:
+        """Build the filter for a field, timing the `transform` and `operator` stages separately.
+
+        Args:
+            tracer (instrumentation.Tracer): The active tracer.
+            filter_name (str): The qualified name of the `Filter` class.
+            key (str): The field key.
+            field (Field): The field.
+            value (Any): The raw value.
+
+        Returns:
+            BinaryExpression: An SQLAlchemy BinaryExpression filter.
+        """
+        start = perf_counter()
+        value = field.clean(value)
+        transformed = perf_counter()
+        tracer.timing(filter_name, instrumentation.TRANSFORM, transformed - start, key)
+        filter_expression = field.get_filters(value)
+        tracer.timing(filter_name, instrumentation.OPERATOR, perf_counter() - transformed, key)
+
+        return filter_expression
+
+    def _execute(
+        self,
+        session: Any,
+        data: Any,
+        handler: Callable[[Result], Any],
+        empty: Any = None,
+        prepare: Optional[Callable[[Statement], Statement]] = None,
+    ) -> Any:
+        """Filter the statement, execute it with the session and pass the result to the handler. When the session is
+            an `AsyncSession` the execution is awaitable and resolves to the value returned by the handler. When the
+            filters can never match the statement is not executed and `empty` is returned instead.
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+            handler (Callable[[Result], Any]): Function which extracts the return value from the result.
+            empty (Any, optional): The value to return if the filters can never match. Defaults to None.
+            prepare (Callable[[Statement], Statement], optional): Function which modifies the filtered statement
+                before it is executed, e.g. to limit it. Defaults to None.
+
+        Returns:
+            Any: The value returned by the handler, or an awaitable resolving to it.
+        """
+        statement = self.filter(data)
+
+        if self.is_empty:
+            return self._await_value(empty) if inspect.iscoroutinefunction(session.execute) else empty
+
+        if prepare is not None:
+            statement = prepare(statement)
+
+        if isinstance(statement, Query):
+            statement = statement.statement
+
+        result = session.execute(statement)
+
+        if inspect.isawaitable(result):
+            return self._await_result(result, handler)
+
+        return handler(result)
+
+    @staticmethod
+    async def _await_value(value: Any) -> Any:
+        return value
+
+    @staticmethod
+    async def _await_result(result: Any, handler: Callable[[Result], Any]) -> Any:
+        return handler(await result)
+
+    @staticmethod
+    def _rows(result: Result) -> Result:
+        """Return ORM entities or column values directly when a single entity or column is selected."""
+        return result.scalars() if len(result.keys()) == 1 else result
+
+    def all(self, session: Any, data: Any) -> List:
+        """Filter the statement and return all of the rows.
+
+            e.g.
+
+            ```
+            bookings = await BookingFilter(select(Booking)).all(async_session, data)
+            ```
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+
+        Returns:
+            List: The matching rows.
+        """
+        return self._execute(session, data, lambda result: self._rows(result).all(), empty=[])
+
+    def first(self, session: Any, data: Any) -> Any:
+        """Filter the statement and return the first row, or `None` if there are no matching rows. The statement is
+            limited to one row, so the other matching rows are not fetched.
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+
+        Returns:
+            Any: The first matching row.
+        """
+        return self._execute(
+            session, data, lambda result: self._rows(result).first(), prepare=lambda statement: statement.limit(1)
+        )
+
+    def one_or_none(self, session: Any, data: Any) -> Any:
+        """Filter the statement and return the matching row, or `None` if there are no matching rows.
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+
+        Raises:
+            MultipleResultsFound: More than one row matches.
+
+        Returns:
+            Any: The matching row.
+        """
+        return self._execute(session, data, lambda result: self._rows(result).one_or_none())
+
+    def exists(self, session: Any, data: Any) -> Any:
+        """Filter the statement and return whether any row matches, with `SELECT EXISTS (... LIMIT 1)`, so the
+            database stops at the first matching row rather than fetching or counting the rows.
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+
+        Returns:
+            Any: Whether a row matches, or an awaitable resolving to it.
+        """
+
+        def prepare(statement: Statement) -> Select:
+            statement = statement.statement if isinstance(statement, Query) else statement
+            return select(statement.order_by(None).limit(1).exists())
+
+        return self._execute(session, data, lambda result: result.scalar(), empty=False, prepare=prepare)
+
+    def count_at_most(self, session: Any, data: Any, n: int) -> Any:
+        """Filter the statement and count the matching rows, up to `n`. The rows are counted from a subquery limited to
+            `n` rows, so the database stops scanning once it has found them, e.g. `count_at_most(session, data, 2) > 1`
+            checks whether there is more than one matching row.
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+            n (int): The maximum number of rows to count.
+
+        Returns:
+            Any: The number of matching rows, at most `n`, or an awaitable resolving to it.
+        """
+
+        def prepare(statement: Statement) -> Select:
+            statement = statement.statement if isinstance(statement, Query) else statement
+            return select(func.count()).select_from(statement.order_by(None).limit(n).subquery())
+
+        return self._execute(session, data, lambda result: result.scalar(), empty=0, prepare=prepare)
+
+    def get_ordering(self, data: Dict) -> Tuple[str, List[pagination.SortKey]]:
+        """Get the ordering requested with the ordering key, e.g. "-created,name" for created descending then name, or
+            the default ordering. The tie-breaker is appended, in the direction of the last column, so that the sort
+            key of each row is unique.
+
+        Args:
+            data (Dict): Dictionary containing filter key values pairs.
+
+        Raises:
+            QueryParamaterDataException: The ordering is not one of the declared orderings.
+
+        Returns:
+            Tuple[str, List[pagination.SortKey]]: The normalized ordering and its sort key columns and directions.
+        """
+        value = data.get(self.ordering_key) or self.default_ordering or ""
+        names = [name.strip() for name in value.split(",") if name.strip()] if isinstance(value, str) else None
+        invalid = names is None or any(name.lstrip("-") not in self.ordering for name in names)
+
+        if invalid:
+            if self._raise_exceptions:
+                raise QueryParamaterDataException(f"{value} is not a valid ordering.")
+
+            names = [name for name in (self.default_ordering or "").split(",") if name]
+
+        keys: List[pagination.SortKey] = []
+
+        for name in dict.fromkeys(names):
+            keys.append((self.ordering[name.lstrip("-")], name.startswith("-")))
+
+        descending = keys[-1][1] if keys else False
+        columns = [_get_column(column) for column, _ in keys]
+
+        for column in self.tiebreaker:
+            if not any(_get_column(column).compare(other) for other in columns):
+                keys.append((column, descending))
+
+        return ",".join(dict.fromkeys(names)), keys
+
+    def paginate(self, session: Any, data: Any, size: Optional[int] = None) -> Any:
+        """Filter the statement and return a page of the rows, in the requested ordering, after the cursor given with
+            the cursor key. Rather than skipping the rows of the previous pages with `OFFSET`, the page continues
+            from the sort key of the last row of the previous page, e.g. `(created_at, id) > (:created_at, :id)`, so
+            with an index on the sort key every page costs the same as the first.
+
+            e.g.
+
+            ```
+            page = BookingFilter(select(Booking)).paginate(session, "ordering=-created&cursor=...")
+            page.items, page.next_cursor
+            ```
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+            size (int, optional): The number of rows in a page. Defaults to `page_size`.
+
+        Raises:
+            QueryParamaterDataException: The cursor is invalid or was created with another ordering.
+
+        Returns:
+            Any: The `pagination.Page`, or an awaitable resolving to it.
+        """
+        if not self.ordering:
+            raise FieldInstantiationException(f"{self.__class__.__name__} does not declare an ordering.")
+
+        data = self._transform_data(data)
+        size = size or self.page_size
+        ordering, keys = self.get_ordering(data)
+        cursor = data.get(self.cursor_key)
+        values = pagination.decode_cursor(cursor, ordering, len(keys), [c for c, _ in keys]) if cursor else None
+
+        def prepare(statement: Statement) -> Statement:
+            if values is not None:
+                statement = statement.where(pagination.keyset_filter(keys, values))
+
+            return statement.limit(size + 1)
+
+        def handler(result: Result) -> pagination.Page:
+            rows = list(self._rows(result).all())
+
+            if len(rows) <= size:
+                return pagination.Page(rows)
+
+            last = rows[size - 1]
+            next_cursor = pagination.encode_cursor(ordering, [pagination.get_value(last, c) for c, _ in keys])
+
+            return pagination.Page(rows[:size], next_cursor)
+
+        return self._execute(session, data, handler, empty=pagination.Page([]), prepare=prepare)
+
+    def page_with_total(
+        self,
+        session: Any,
+        data: Any,
+        size: Optional[int] = None,
+        offset: int = 0,
+        estimate_threshold: Optional[int] = None,
+    ) -> Any:
+        """Filter the statement and return a page of the rows with the total number of matching rows, counted with
+            `count(*) OVER ()` in the same statement rather than a separate `SELECT count(*)`.
+
+            Counting every matching row can cost more than fetching the page on large tables, so with an
+            `estimate_threshold` the planner's estimate of the number of rows is read first, e.g. with `EXPLAIN` on
+            PostgreSQL, and when it is at least the threshold it is returned as the total, with `is_estimate` set,
+            and the rows are not counted.
+
+        Args:
+            session (Any): A `Session` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+            size (int, optional): The number of rows in a page. Defaults to `page_size`.
+            offset (int, optional): The number of rows to skip. Defaults to 0.
+            estimate_threshold (int, optional): The estimated number of rows above which the estimate is used as the
+                total. Defaults to None.
+
+        Returns:
+            Any: The `pagination.CountedPage`, or an awaitable resolving to it.
+        """
+        if inspect.iscoroutinefunction(session.execute) and hasattr(session, "run_sync"):
+            return session.run_sync(
+                lambda sync_session: self.page_with_total(sync_session, data, size, offset, estimate_threshold)
+            )
+
+        statement = self.filter(data)
+        statement = statement.statement if isinstance(statement, Query) else statement
+        size = size or self.page_size
+
+        if self.is_empty:
+            return pagination.CountedPage([], 0)
+
+        estimate = None if estimate_threshold is None else pagination.estimate_count(session, statement)
+
+        if estimate is not None and estimate >= estimate_threshold:
+            items = self._rows(session.execute(statement.limit(size).offset(offset))).all()
+            return pagination.CountedPage(list(items), estimate, is_estimate=True)
+
+        counted = statement.add_columns(func.count().over().label("sqlaf_total")).limit(size).offset(offset)
+        result = session.execute(counted).freeze()
+        columns = len(result().keys()) - 1
+        items = list(self._rows(result().columns(*range(columns))).all())
+        total = result().columns(columns).scalar()
+
+        if total is None:
+            # The page is empty, so the total is only known if it is the first page.
+            count = select(func.count()).select_from(statement.order_by(None).subquery())
+            total = 0 if offset == 0 else session.execute(count).scalar()
+
+        return pagination.CountedPage(items, total)
+
+    def facets(self, session: Any, data: Any, fields: List[str]) -> Any:
+        """Count the rows for each value of the given fields, e.g. to show how many results each option of a filter
+            would have. The counts of a field are filtered by every active filter except the field's own, so selecting
+            one status still shows the counts of the other statuses, and all of the fields are counted in a single
+            statement. On PostgreSQL this groups by `GROUPING SETS` with a `count(*) FILTER (WHERE ...)` per field,
+            and on other databases it is a `UNION ALL` of a grouped select per field. With `simplify` the statement is
+            not executed when the filters can never match.
+
+            e.g.
+
+            ```
+            BookingFilter(select(Booking)).facets(session, "status=open&has_paid=true", ["status", "has_paid"])
+            {"status": {"open": 4, "closed": 2}, "has_paid": {True: 4}}
+            ```
+
+        Args:
+            session (Any): A `Session`, `Connection` or `AsyncSession`.
+            data (Any): The data to perform the filtering with.
+            fields (List[str]): The keys of the `EnumField`, `BooleanField` or `CharField` fields to count.
+
+        Raises:
+            QueryParamaterDataException: A key is not one of the fields which can be counted.
+
+        Returns:
+            Any: The counts of each value keyed by field key, values without rows are left out, or an awaitable
+                resolving to them.
+        """
+        if inspect.iscoroutinefunction(session.execute) and hasattr(session, "run_sync"):
+            return session.run_sync(lambda sync_session: self.facets(sync_session, data, fields))
+
+        for key in fields:
+            if not isinstance(self._fields.get(key), FACET_FIELDS):
+                raise QueryParamaterDataException(f"{key} is not an enum, boolean or char field.")
+
+        fields = list(dict.fromkeys(fields))
+        field_filters, filters = self._get_filters(self._transform_data(data))
+        facet_filters = {key: field_filters[key] for key in fields if key in field_filters}
+        filters = [f for f in filters if not any(f is other for other in facet_filters.values())]
+        conditions = [[f for other, f in facet_filters.items() if other != key] for key in fields]
+        counts: Dict[str, Dict[Any, int]] = {key: {} for key in fields}
+
+        self.is_empty = False
+
+        if self._simplify:
+            filters, self.is_empty = simplifier.simplify(filters)
+            # The counts of a field whose other filters can never match are all zero.
+            empty = [self.is_empty or simplifier.simplify([*filters, *c])[1] for c in conditions]
+
+            if all(empty):
+                return counts
+
+            conditions = [[false()] if is_empty else c for c, is_empty in zip(conditions, empty)]
+
+        statement = self._query.statement if isinstance(self._query, Query) else self._query
+        statement = statement.order_by(None).limit(None).offset(None).where(*filters)
+        columns = [self._fields[key].source for key in fields]
+        bind = session.get_bind() if hasattr(session, "get_bind") else session
+
+        if bind.dialect.name == "postgresql":
+            statement = statement.with_only_columns(
+                *columns,
+                *[func.grouping(column) for column in columns],
+                *[func.count().filter(and_(*c)) if c else func.count() for c in conditions],
+            ).group_by(func.grouping_sets(*[tuple_(column) for column in columns]))
+
+            size = len(fields)
+
+            for row in session.execute(statement):
+                # GROUPING(column) is 0 for the rows grouped by the column.
+                index = [row[size + i] for i in range(size)].index(0)
+                counts[fields[index]][row[index]] = row[2 * size + index]
+        else:
+            selects = []
+
+            for index, column in enumerate(columns):
+                slots = [column if i == index else type_coerce(null(), c.type) for i, c in enumerate(columns)]
+                labels = [slot.label(f"sqlaf_facet_{i}") for i, slot in enumerate(slots)]
+                facet = statement.with_only_columns(literal(index).label("sqlaf_facet"), *labels, func.count())
+                selects.append(facet.where(*conditions[index]).group_by(column))
+
+            for row in session.execute(union_all(*selects)):
+                counts[fields[row[0]]][row[row[0] + 1]] = row[-1]
+
+        return {key: {value: count for value, count in values.items() if count} for key, values in counts.items()}
+
+    @classmethod
+    def get_cache_statistics(cls) -> caching.CacheStatistics:
+        """Get the compiled statement cache statistics for the statements built by the `Filter` class. Statistics are
+            only recorded for engines passed to `sqlaf.caching.track_compiled_cache`.
+
+        Returns:
+            caching.CacheStatistics: The cache hits, misses and uncached executions.
+        """
+        return caching.get_cache_statistics(cls)
 
     def post_filter(self, data: Dict, filters: List):
         """If there is any filtering that needs performing manually post filtering, this function can be
@@ -87,3 +753,28 @@ class Filter(IFilter):
             List: An array of filters.
         """
         return filters
+
+
+def _get_column(column: Any) -> Any:
+    return column.__clause_element__() if hasattr(column, "__clause_element__") else column
+
+
+def _is_indexed(column: Any) -> bool:
+    """Whether the column is the leading column of an index, primary key or unique constraint of its table."""
+    column = _get_column(column)
+    table = getattr(column, "table", None)
+
+    if getattr(column, "index", False) or getattr(column, "unique", False):
+        return True
+
+    if table is None:
+        return False
+
+    indexed = [list(index.columns) for index in table.indexes]
+    indexed += [
+        list(constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+    ]
+
+    return any(columns and columns[0].name == column.name for columns in indexed)
@@ -5,10 +5,14 @@ class IFilter(ABC):
 
     _query = None
     _raise_exceptions = True
+    _bind_parameters = False
+    _simplify = False
 
-    def __init__(self, query, raise_exceptions=False):
+    def __init__(self, query, raise_exceptions=False, bind_parameters=False, simplify=False):
         self._query = query
         self._raise_exceptions = raise_exceptions
+        self._bind_parameters = bind_parameters
+        self._simplify = simplify
 
     @abstractmethod
     def filter(self):
@@ -0,0 +1,216 @@
+"""Parse boolean filter expressions, which combine conditions on the declared fields with AND, OR and NOT, either as
+nested JSON or in a compact query string syntax.
+
+    {"or": [{"name.icontains": "a"}, {"size.gte": 3}]}
+    or(name.icontains=a,size.gte=3)
+"""
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Union
+
+from sqlaf import config
+from sqlaf.exceptions import QueryParamaterDataException
+
+AND = "and"
+OR = "or"
+NOT = "not"
+GROUPS = [AND, OR, NOT]
+
+_NAME = re.compile(r"[\w~.]+")
+
+
+@dataclass
+class Condition:
+    """A condition on a declared field, filtering with the field's operator unless another is given."""
+
+    key: str
+    operator: Optional[str]
+    value: Any
+
+
+@dataclass
+class Group:
+    """Conditions and groups combined with AND or OR, or negated with NOT."""
+
+    operator: str
+    children: List["Node"]
+
+
+Node = Union[Condition, Group]
+
+
+class _Parser:
+    def __init__(self, max_depth: Optional[int], max_nodes: Optional[int]):
+        self.max_depth = config.EXPRESSION_MAX_DEPTH if max_depth is None else max_depth
+        self.max_nodes = config.EXPRESSION_MAX_NODES if max_nodes is None else max_nodes
+        self.nodes = 0
+
+    def _count(self, depth: int):
+        self.nodes += 1
+
+        if self.nodes > self.max_nodes:
+            raise QueryParamaterDataException(f"filter expression has more than {self.max_nodes} nodes.")
+
+        if depth > self.max_depth:
+            raise QueryParamaterDataException(f"filter expression is nested deeper than {self.max_depth} levels.")
+
+    def _condition(self, name: str, value: Any, depth: int) -> Condition:
+        self._count(depth)
+        key, _, operator = name.partition(".")
+
+        if not key:
+            raise QueryParamaterDataException(f"{name} is not a valid filter expression condition.")
+
+        return Condition(key, operator or None, value)
+
+    def _group(self, operator: str, children: List[Node]) -> Group:
+        if not children or (operator == NOT and len(children) != 1):
+            raise QueryParamaterDataException(f"{operator} needs {'one' if operator == NOT else 'at least one'} node.")
+
+        return Group(operator, children)
+
+    def parse_json(self, value: Any, depth: int = 1) -> Node:
+        if isinstance(value, list):
+            self._count(depth)
+            return self._group(AND, [self.parse_json(item, depth + 1) for item in value])
+
+        if not isinstance(value, dict) or not value:
+            raise QueryParamaterDataException(f"{value} is not a valid filter expression node.")
+
+        if len(value) > 1:
+            self._count(depth)
+            return self._group(AND, [self.parse_json({key: item}, depth + 1) for key, item in value.items()])
+
+        ((name, item),) = value.items()
+
+        if name not in GROUPS:
+            return self._condition(name, item, depth)
+
+        self._count(depth)
+        items = [item] if name == NOT and not isinstance(item, list) else item
+
+        if not isinstance(items, list):
+            raise QueryParamaterDataException(f"{name} must be a list of nodes.")
+
+        return self._group(name, [self.parse_json(child, depth + 1) for child in items])
+
+    def parse_compact(self, value: str) -> Node:
+        self.text = value
+        self.index = 0
+        nodes = self._nodes(1)
+
+        if self.index < len(self.text):
+            raise QueryParamaterDataException(f"unexpected {self.text[self.index]!r} at position {self.index}.")
+
+        if len(nodes) == 1:
+            return nodes[0]
+
+        self._count(1)
+        return self._group(AND, nodes)
+
+    def _skip_whitespace(self):
+        while self.index < len(self.text) and self.text[self.index].isspace():
+            self.index += 1
+
+    def _nodes(self, depth: int) -> List[Node]:
+        nodes = [self._node(depth)]
+        self._skip_whitespace()
+
+        while self.text.startswith(",", self.index):
+            self.index += 1
+            nodes.append(self._node(depth))
+            self._skip_whitespace()
+
+        return nodes
+
+    def _node(self, depth: int) -> Node:
+        self._skip_whitespace()
+        match = _NAME.match(self.text, self.index)
+
+        if match is None:
+            raise QueryParamaterDataException(f"expected a condition or group at position {self.index}.")
+
+        name = match.group()
+        self.index = match.end()
+        self._skip_whitespace()
+
+        if name.lower() in GROUPS and self.text.startswith("(", self.index):
+            self._count(depth)
+            self.index += 1
+            children = self._nodes(depth + 1)
+
+            if not self.text.startswith(")", self.index):
+                raise QueryParamaterDataException(f"expected ')' at position {self.index}.")
+
+            self.index += 1
+            return self._group(name.lower(), children)
+
+        if not self.text.startswith("=", self.index):
+            raise QueryParamaterDataException(f"expected '=' at position {self.index}.")
+
+        self.index += 1
+        self._skip_whitespace()
+        return self._condition(name, self._value(), depth)
+
+    def _value(self) -> str:
+        if not self.text.startswith('"', self.index):
+            start = self.index
+
+            while self.index < len(self.text) and self.text[self.index] not in ",)":
+                self.index += 1
+
+            end = self.index
+            return self.text[start:end].strip()
+
+        value = ""
+        self.index += 1
+
+        while self.index < len(self.text) and self.text[self.index] != '"':
+            if self.text[self.index] == "\\" and self.index + 1 < len(self.text):
+                self.index += 1
+
+            value += self.text[self.index]
+            self.index += 1
+
+        if self.index >= len(self.text):
+            raise QueryParamaterDataException("unterminated quoted value.")
+
+        self.index += 1
+        return value
+
+
+def parse_expression(value: Any, max_depth: Optional[int] = None, max_nodes: Optional[int] = None) -> Node:
+    """Parse a filter expression into a tree of `Group` and `Condition` nodes.
+
+        In JSON, a group is an object with a single "and", "or" or "not" key whose value is a list of nodes, and a
+        condition is an object with a single "key" or "key.operator" key whose value is the value to filter with.
+        Lists, and objects with several keys, are combined with AND. The compact syntax has the same structure, e.g.
+        `and(or(name.icontains=a,size.gte=3),not(status=closed))`, where whitespace around names and values is ignored
+        and a value can be double quoted to include a comma, parenthesis or surrounding whitespace. Strings starting
+        with "{" or "[" are parsed as JSON.
+
+    Args:
+        value (Any): The expression, as a dictionary, list or string.
+        max_depth (int, optional): The maximum nesting depth. Defaults to `config.EXPRESSION_MAX_DEPTH`.
+        max_nodes (int, optional): The maximum number of groups and conditions. Defaults to
+            `config.EXPRESSION_MAX_NODES`.
+
+    Raises:
+        QueryParamaterDataException: The expression is invalid or exceeds one of the limits.
+
+    Returns:
+        Node: The root node.
+    """
+    parser = _Parser(max_depth, max_nodes)
+
+    if isinstance(value, str) and value.lstrip()[:1] in ("{", "["):
+        try:
+            value = json.loads(value)
+        except (ValueError, RecursionError):
+            raise QueryParamaterDataException("filter expression is not valid JSON.")
+
+    if isinstance(value, str):
+        return parser.parse_compact(value)
+
+    return parser.parse_json(value)
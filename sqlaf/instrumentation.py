@@ -0,0 +1,239 @@
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from sqlaf import caching
+
+PARSE = "parse"
+TRANSFORM = "transform"
+OPERATOR = "operator"
+POST_FILTER = "post_filter"
+COMPILE = "compile"
+EXECUTE = "execute"
+
+
+class Tracer:
+    """Receives the timings of each filtering stage and the field validation failures. Override the methods to record
+    them, the default implementation ignores everything.
+    """
+
+    def timing(self, filter_name: str, stage: str, duration: float, field: Optional[str] = None):
+        """Called with the duration of a stage.
+
+        Args:
+            filter_name (str): The qualified name of the `Filter` class.
+            stage (str): The stage e.g. `transform`.
+            duration (float): The duration in seconds.
+            field (str, optional): The field key for per field stages. Defaults to None.
+        """
+        pass
+
+    def failure(self, filter_name: str, field: str, exception: Exception):
+        """Called when a field fails to validate or build its filter.
+
+        Args:
+            filter_name (str): The qualified name of the `Filter` class.
+            field (str): The field key.
+            exception (Exception): The exception raised by the field.
+        """
+        pass
+
+
+_tracer: ContextVar[Optional[Tracer]] = ContextVar("sqlaf_tracer", default=None)
+_global_tracer: Optional[Tracer] = None
+_instrumented_engines: Dict[Engine, Tracer] = {}
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer.get() or _global_tracer
+
+
+def set_tracer(tracer: Optional[Tracer]):
+    """Set the tracer used by every filter in the process, `None` disables tracing.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer.
+    """
+    global _global_tracer
+    _global_tracer = tracer
+
+
+@contextmanager
+def trace(tracer: Tracer) -> Iterator[Tracer]:
+    """Trace the filters used within the context, e.g. for a single request.
+
+        e.g.
+
+        ```
+        with instrumentation.trace(LoggingTracer()):
+            BookingFilter(query).filter(data)
+        ```
+
+    Args:
+        tracer (Tracer): The tracer.
+    """
+    token = _tracer.set(tracer)
+
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+
+
+def _get_filter_name(execution_options) -> Optional[str]:
+    return execution_options.get(caching.EXECUTION_OPTION) if execution_options else None
+
+
+def _get_engine_tracer(engine: Engine) -> Optional[Tracer]:
+    # `Engine.execution_options()` returns a proxy of the engine which shares its listeners
+    while engine not in _instrumented_engines and hasattr(engine, "_proxied"):
+        engine = engine._proxied
+
+    return _instrumented_engines.get(engine)
+
+
+def _before_execute(conn, clauseelement, multiparams, params, execution_options):
+    if _get_filter_name(getattr(clauseelement, "_execution_options", None)):
+        conn.info["sqlaf_execute_start"] = perf_counter()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    filter_name = _get_filter_name(context.execution_options) if context is not None else None
+    start = conn.info.pop("sqlaf_execute_start", None)
+
+    if not filter_name:
+        return
+
+    now = perf_counter()
+    context._sqlaf_cursor_start = now
+
+    tracer = _get_engine_tracer(conn.engine)
+
+    if start is not None and tracer is not None:
+        tracer.timing(filter_name, COMPILE, now - start)
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_sqlaf_cursor_start", None)
+
+    tracer = _get_engine_tracer(conn.engine) if start is not None else None
+
+    if tracer is not None:
+        tracer.timing(_get_filter_name(context.execution_options), EXECUTE, perf_counter() - start)
+
+
+def instrument_engine(engine: Engine, tracer: Tracer):
+    """Record the `compile` and `execute` stages of the statements built by a `Filter` and executed on the engine. The
+        `compile` stage covers the compiled statement cache lookup or compilation and parameter processing, and the
+        `execute` stage covers the database round trip.
+
+    Args:
+        engine (Engine): The engine to listen to.
+        tracer (Tracer): The tracer to send the timings to.
+    """
+    if engine not in _instrumented_engines:
+        event.listen(engine, "before_execute", _before_execute)
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+    _instrumented_engines[engine] = tracer
+
+
+def uninstrument_engine(engine: Engine):
+    if _instrumented_engines.pop(engine, None) is None:
+        return
+
+    event.remove(engine, "before_execute", _before_execute)
+    event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def is_instrumenting_engines() -> bool:
+    return bool(_instrumented_engines)
+
+
+class LoggingTracer(Tracer):
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        """Tracer which logs every timing and failure.
+
+        Args:
+            logger (logging.Logger, optional): The logger to use. Defaults to the `sqlaf` logger.
+            level (int, optional): The level timings are logged at, failures are logged at `WARNING`. Defaults to
+                logging.DEBUG.
+        """
+        self.logger = logger or logging.getLogger("sqlaf")
+        self.level = level
+
+    def timing(self, filter_name: str, stage: str, duration: float, field: Optional[str] = None):
+        if field:
+            self.logger.log(self.level, "%s.%s %s took %.6fs", filter_name, field, stage, duration)
+        else:
+            self.logger.log(self.level, "%s %s took %.6fs", filter_name, stage, duration)
+
+    def failure(self, filter_name: str, field: str, exception: Exception):
+        self.logger.warning("%s.%s failed with %s: %s", filter_name, field, type(exception).__name__, exception)
+
+
+@dataclass
+class Timing:
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """Simple in-process registry of counters and timing summaries."""
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.timings: Dict[str, Timing] = defaultdict(Timing)
+        self._lock = Lock()
+
+    def increment(self, name: str, value: int = 1):
+        with self._lock:
+            self.counters[name] += value
+
+    def observe(self, name: str, duration: float):
+        with self._lock:
+            timing = self.timings[name]
+            timing.count += 1
+            timing.total += duration
+            timing.min = min(timing.min, duration)
+            timing.max = max(timing.max, duration)
+
+    def names(self) -> List[str]:
+        return sorted([*self.counters, *self.timings])
+
+    def clear(self):
+        with self._lock:
+            self.counters.clear()
+            self.timings.clear()
+
+
+class MetricsTracer(Tracer):
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """Tracer which records timings as `<filter>.<stage>` or `<filter>.<field>.<stage>` and failures as
+            `<filter>.<field>.failures.<exception type>` counters.
+
+        Args:
+            registry (MetricsRegistry, optional): The registry to record to. Defaults to a new registry.
+        """
+        self.registry = registry or MetricsRegistry()
+
+    def timing(self, filter_name: str, stage: str, duration: float, field: Optional[str] = None):
+        self.registry.observe(f"{filter_name}.{field}.{stage}" if field else f"{filter_name}.{stage}", duration)
+
+    def failure(self, filter_name: str, field: str, exception: Exception):
+        self.registry.increment(f"{filter_name}.{field}.failures.{type(exception).__name__}")
@@ -1,33 +1,36 @@
-from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 import sqlalchemy
-from sqlalchemy import Column, func
+from sqlalchemy import Column, Table, literal_column, select
 from sqlalchemy.sql.elements import BinaryExpression
 
 from sqlaf.exceptions import OperatorArgumentError
+from sqlaf.expressions import CaseInsensitive, InArray, Search, StartsWith
+
+# Lists longer than this are sent as a single array parameter on dialects that support it.
+IN_ARRAY_THRESHOLD = 100
 
 
 def eq(source: Column, value: Any) -> BinaryExpression:
     return source == value
 
 
-def ieq(source: Column, value: Any) -> BinaryExpression:
+def ieq(source: Column, value: Any, strategy: str = "auto") -> BinaryExpression:
     if not isinstance(value, str):
         raise OperatorArgumentError("case insensitive operator can only be used with string values")
 
-    return func.lower(source) == value.lower()
+    return CaseInsensitive(source, value.lower(), strategy=strategy)
 
 
 def xeq(source: Column, value: Any) -> BinaryExpression:
     return source != value
 
 
-def xieq(source: Column, value: Any) -> BinaryExpression:
+def xieq(source: Column, value: Any, strategy: str = "auto") -> BinaryExpression:
     if not isinstance(value, str):
         raise OperatorArgumentError("case insensitive operator can only be used with string values")
 
-    return func.lower(source) != value.lower()
+    return CaseInsensitive(source, value.lower(), strategy=strategy, negate=True)
 
 
 def gt(source: Column, value: Any) -> BinaryExpression:
@@ -66,8 +69,96 @@ def xcontains(source: Column, value: Any) -> BinaryExpression:
     return sqlalchemy.not_(source.contains(value, autoescape=isinstance(value, str)))
 
 
-def icontains(source: Column, value: Any) -> BinaryExpression:
+def icontains(source: Column, value: Any, strategy: str = "auto") -> BinaryExpression:
     if not isinstance(value, str):
         raise OperatorArgumentError("icontains can only be using with string values")
 
-    return func.lower(source).contains(value.lower(), autoescape=True)
+    return CaseInsensitive(source, value.lower(), operator="contains", strategy=strategy)
+
+
+def range_(source: Column, value: Tuple[Any, Any], bounds: str = "[]") -> BinaryExpression:
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise OperatorArgumentError("range operator can only be used with a (lower, upper) pair")
+
+    lower, upper = value
+
+    if lower is None and upper is None:
+        raise OperatorArgumentError("range operator needs a lower or upper bound")
+
+    if bounds == "[]" and lower is not None and upper is not None:
+        return source.between(lower, upper)
+
+    filters = []
+
+    if lower is not None:
+        filters.append(source >= lower if bounds[0] == "[" else source > lower)
+
+    if upper is not None:
+        filters.append(source <= upper if bounds[1] == "]" else source < upper)
+
+    return sqlalchemy.and_(*filters)
+
+
+def overlap(source: Column, value: List[Any]) -> BinaryExpression:
+    if not isinstance(value, (list, tuple)):
+        raise OperatorArgumentError("overlap operator can only be used with a list of values")
+
+    return source.overlap(list(value))
+
+
+def contained_by(source: Column, value: List[Any]) -> BinaryExpression:
+    if not isinstance(value, (list, tuple)):
+        raise OperatorArgumentError("contained_by operator can only be used with a list of values")
+
+    return source.contained_by(list(value))
+
+
+def startswith(source: Column, value: Any) -> BinaryExpression:
+    if not isinstance(value, str):
+        raise OperatorArgumentError("startswith can only be used with string values")
+
+    return StartsWith(source, value)
+
+
+def istartswith(source: Column, value: Any, strategy: str = "auto") -> BinaryExpression:
+    if not isinstance(value, str):
+        raise OperatorArgumentError("istartswith can only be used with string values")
+
+    return CaseInsensitive(source, value.lower(), operator="startswith", strategy=strategy)
+
+
+def endswith(source: Column, value: Any) -> BinaryExpression:
+    if not isinstance(value, str):
+        raise OperatorArgumentError("endswith can only be used with string values")
+
+    return source.endswith(value, autoescape=True)
+
+
+def in_(source: Column, value: List[Any]) -> BinaryExpression:
+    if not isinstance(value, (list, tuple)):
+        raise OperatorArgumentError("in operator can only be used with a list of values")
+
+    if len(value) > IN_ARRAY_THRESHOLD:
+        return InArray(source, list(value))
+
+    return source.in_(value)
+
+
+def xin(source: Column, value: List[Any]) -> BinaryExpression:
+    if not isinstance(value, (list, tuple)):
+        raise OperatorArgumentError("~in operator can only be used with a list of values")
+
+    if len(value) > IN_ARRAY_THRESHOLD:
+        return InArray(source, list(value), negate=True)
+
+    return source.not_in(value)
+
+
+def search(source: Column, value: Any, config: str = "english", fts_table: Optional[Table] = None) -> BinaryExpression:
+    if not isinstance(value, str):
+        raise OperatorArgumentError("search can only be used with string values")
+
+    if fts_table is None:
+        return Search(source, value, config)
+
+    return source.in_(select(literal_column("rowid")).select_from(fts_table).where(Search(fts_table, value, config)))
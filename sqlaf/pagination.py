@@ -0,0 +1,294 @@
+"""Allowlisted ordering, keyset (cursor) pagination and counting for `Filter` classes.
+
+Rather than skipping rows with `OFFSET`, which gets slower the deeper the page, each page continues from the sort key
+of the last row of the previous page, e.g. `WHERE (created_at, id) > (:created_at, :id) ORDER BY created_at, id LIMIT
+21`, so every page costs the same as the first when the sort key is indexed.
+
+Counting the rows of a large table can cost more than fetching a page of them, so `estimate_count` reads the number of
+rows the query planner expects instead.
+"""
+import base64
+import binascii
+import json
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Column, and_, false, literal, or_, text, tuple_
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
+
+from sqlaf.exceptions import QueryParamaterDataException
+
+T = TypeVar("T")
+
+# A sort key column and whether it is sorted in descending order.
+SortKey = Tuple[Column, bool]
+
+_TYPES = {"datetime": datetime, "date": date, "time": time, "decimal": Decimal, "uuid": UUID}
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of rows and the cursor of the next page, which is None on the last page."""
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass
+class CountedPage(Generic[T]):
+    """A page of rows and the total number of matching rows, which is the planner's estimate if `is_estimate`."""
+
+    items: List[T]
+    total: int
+    is_estimate: bool = False
+
+
+def _encode_value(value: Any) -> Any:
+    for name, type_ in _TYPES.items():
+        if isinstance(value, type_):
+            return {name: value.isoformat() if hasattr(value, "isoformat") else str(value)}
+
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+
+    ((name, encoded),) = value.items()
+    type_ = _TYPES[name]
+
+    return type_.fromisoformat(encoded) if hasattr(type_, "fromisoformat") else type_(encoded)
+
+
+def encode_cursor(ordering: str, values: Sequence[Any]) -> str:
+    """Encode the sort key of a row into an opaque cursor.
+
+    Args:
+        ordering (str): The ordering the sort key belongs to, e.g. "-created".
+        values (Sequence[Any]): The values of the sort key columns, including the tie-breaker.
+
+    Returns:
+        str: The cursor.
+    """
+    payload = json.dumps([ordering, [_encode_value(value) for value in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def is_nullable(column: Any) -> bool:
+    """Whether a sort key column can be NULL. Expressions other than columns are assumed to be nullable."""
+    column = column.__clause_element__() if hasattr(column, "__clause_element__") else column
+    return getattr(column, "nullable", True)
+
+
+def _is_valid_value(column: Any, value: Any) -> bool:
+    if value is None:
+        return is_nullable(column)
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return True
+
+    if isinstance(value, bool) and python_type is not bool:
+        return False
+
+    return isinstance(value, (int, float) if python_type is float else python_type)
+
+
+def decode_cursor(cursor: str, ordering: str, length: int, columns: Optional[Sequence[Any]] = None) -> List[Any]:
+    """Decode the sort key of a cursor created by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor.
+        ordering (str): The ordering of the request, which must match the ordering the cursor was created with.
+        length (int): The number of sort key columns.
+        columns (Sequence[Any], optional): The sort key columns, which the values are checked against, so that a
+            tampered cursor is rejected before it reaches the database. Defaults to None.
+
+    Raises:
+        QueryParamaterDataException: The cursor is invalid or belongs to another ordering.
+
+    Returns:
+        List[Any]: The values of the sort key columns.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_ordering, values = json.loads(payload)
+        values = [_decode_value(value) for value in values]
+    except (ArithmeticError, TypeError, ValueError, KeyError, binascii.Error):
+        raise QueryParamaterDataException(f"{cursor} is not a valid cursor.")
+
+    if cursor_ordering != ordering or len(values) != length:
+        raise QueryParamaterDataException(f"{cursor} is not a valid cursor for the ordering {ordering}.")
+
+    if columns is not None and not all(_is_valid_value(column, value) for column, value in zip(columns, values)):
+        raise QueryParamaterDataException(f"{cursor} is not a valid cursor for the ordering {ordering}.")
+
+    return values
+
+
+def order_by(column: Any, descending: bool) -> ColumnElement:
+    """Order by a sort key column. NULLs sort after every value, i.e. last in ascending and first in descending order,
+        on every database, which `keyset_filter` relies on.
+
+    Args:
+        column (Any): The column.
+        descending (bool): Whether to sort in descending order.
+
+    Returns:
+        ColumnElement: The ORDER BY clause.
+    """
+    clause = column.desc() if descending else column.asc()
+
+    if not is_nullable(column):
+        return clause
+
+    return clause.nulls_first() if descending else clause.nulls_last()
+
+
+def keyset_filter(keys: List[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """Build the filter for the rows after the sort key in the order of the keys. When every key is sorted in the same
+        direction and none can be NULL this is a single row value comparison, e.g. `(created_at, id) > (:created_at,
+        :id)`, which an index on the keys can serve, otherwise it is expanded into `a > :a OR (a = :a AND b < :b)`,
+        with `IS NULL` branches for nullable keys as NULLs sort after every value, see `order_by`.
+
+    Args:
+        keys (List[SortKey]): The sort key columns and directions.
+        values (Sequence[Any]): The sort key of the last row of the previous page.
+
+    Returns:
+        ColumnElement: The filter.
+    """
+    nullable = [is_nullable(column) for column, _ in keys]
+    bounds = [None if value is None else literal(value, column.type) for (column, _), value in zip(keys, values)]
+    columns = [column for column, _ in keys]
+    descending = {descending for _, descending in keys}
+
+    if not any(nullable) and (len(keys) == 1 or len(descending) == 1):
+        left, right = (columns[0], bounds[0]) if len(keys) == 1 else (tuple_(*columns), tuple_(*bounds))
+        return left < right if descending == {True} else left > right
+
+    filters = []
+
+    for index, (column, descending) in enumerate(keys):
+        if bounds[index] is None:
+            # Only non NULL values sort after NULL, and only in descending order.
+            if not descending:
+                continue
+
+            after = column.is_not(None)
+        else:
+            after = column < bounds[index] if descending else column > bounds[index]
+
+            if nullable[index] and not descending:
+                after = or_(after, column.is_(None))
+
+        equal = [c.is_(None) if b is None else c == b for c, b in zip(columns[:index], bounds[:index])]
+        filters.append(and_(*equal, after))
+
+    return or_(*filters) if filters else false()
+
+
+def get_value(row: Any, column: Any) -> Any:
+    """Get the value of a sort key column from an ORM entity or a row.
+
+    Args:
+        row (Any): The entity or row.
+        column (Any): The column or ORM attribute.
+
+    Returns:
+        Any: The value.
+    """
+    mapping = getattr(row, "_mapping", None)
+
+    if mapping is None:
+        return getattr(row, column.key)
+
+    try:
+        return mapping[column]
+    except KeyError:
+        return mapping[column.key]
+
+
+class Explain(Executable, ClauseElement):
+    """The plan of a statement, `EXPLAIN (FORMAT JSON)` on PostgreSQL and `EXPLAIN QUERY PLAN` on SQLite."""
+
+    __visit_name__ = "explain"
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    prefix = "EXPLAIN QUERY PLAN" if compiler.dialect.name == "sqlite" else "EXPLAIN (FORMAT JSON)"
+
+    return f"{prefix} {compiler.process(element.statement, **kw)}"
+
+
+def _estimate_postgresql(session: Any, statement: Any) -> Optional[int]:
+    plan = session.execute(Explain(statement)).scalar()
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+_SQLITE_PLAN = re.compile(r"(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX (\w+))?")
+
+
+def _estimate_sqlite(session: Any, statement: Any) -> Optional[int]:
+    # SQLite does not estimate the rows of a plan, so the row counts ANALYZE stores in `sqlite_stat1` stand in: the
+    # rows of the table for a scan, or the average rows per key of the index for a search.
+    details = [row[-1] for row in session.execute(Explain(statement))]
+    match = next((m for m in map(_SQLITE_PLAN.match, details) if m), None)
+
+    if match is None:
+        return None
+
+    operation, table, index = match.groups()
+
+    try:
+        stats = dict(session.execute(text("SELECT idx, stat FROM sqlite_stat1 WHERE tbl = :tbl"), {"tbl": table}).all())
+    except DBAPIError:
+        return None
+
+    if operation == "SCAN" and stats:
+        return int(next(iter(stats.values())).split()[0])
+
+    if operation == "SEARCH" and index in stats:
+        return int(stats[index].split()[1])
+
+    return None
+
+
+# Functions which return the planner's estimate of the number of rows a statement returns, by dialect name.
+ESTIMATORS = {"postgresql": _estimate_postgresql, "sqlite": _estimate_sqlite}
+
+
+def estimate_count(session: Any, statement: Any) -> Optional[int]:
+    """Get the query planner's estimate of the number of rows the statement returns, without running it.
+
+    Args:
+        session (Any): A `Session` or `Connection`.
+        statement (Any): The statement.
+
+    Returns:
+        Optional[int]: The estimate, or None if the dialect has no estimator or the planner gave no estimate.
+    """
+    bind = session.get_bind() if hasattr(session, "get_bind") else session
+    estimator = ESTIMATORS.get(bind.dialect.name)
+
+    return estimator(session, statement) if estimator else None
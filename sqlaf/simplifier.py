@@ -0,0 +1,250 @@
+"""Simplify the filters collected by a `Filter` before they are applied: comparisons on the same column are merged into
+a single range or list of values, duplicates are removed and sets of filters that can never match are detected, so the
+query can be answered without a database round trip.
+"""
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, BooleanClauseList, ClauseElement, ClauseList
+
+from sqlaf.expressions import is_case_insensitive_type
+
+# The types of values that compare the same in Python as in the database. Strings are left out of ranges as their
+# order depends on the collation.
+ORDERED_TYPES = (int, float, Decimal, date, datetime, time, timedelta)
+COMPARISONS = {operators.gt, operators.ge, operators.lt, operators.le}
+
+
+class _ColumnPredicates:
+    """The comparisons of one column, as the values it can be, the values it can not be and its bounds."""
+
+    def __init__(self, column: ClauseElement):
+        self.column = column
+        self.expressions: List[ClauseElement] = []
+        self.values: Optional[List[Any]] = None
+        self.excluded: Dict[Any, None] = {}
+        self.lower: Optional[Tuple[Any, bool]] = None
+        self.upper: Optional[Tuple[Any, bool]] = None
+        # The names of the bound parameters given by `caching.bind_parameters`, by the part of the filters they are
+        # reused for, so the rebuilt filters still compile to the same SQL.
+        self.bind_names: Dict[str, str] = {}
+
+    def add(self, operator: Any, value: Any, bind_names: List[str] = []):
+        part = "values"
+
+        if operator in (operators.eq, operators.in_op):
+            values = value if operator is operators.in_op else [value]
+            self.values = list(
+                dict.fromkeys(values if self.values is None else [v for v in self.values if v in values])
+            )
+        elif operator in (operators.ne, operators.not_in_op):
+            part = "excluded"
+            self.excluded.update(dict.fromkeys(value if operator is operators.not_in_op else [value]))
+        elif operator is operators.between_op:
+            self.add(operators.ge, value[0], bind_names[:1])
+            self.add(operators.le, value[1], bind_names[1:])
+            return
+        elif operator in (operators.gt, operators.ge):
+            part = "lower"
+            bound = (value, operator is operators.ge)
+
+            if self.lower is None or value > self.lower[0] or (value == self.lower[0] and not bound[1]):
+                self.lower = bound
+        else:
+            part = "upper"
+            bound = (value, operator is operators.le)
+
+            if self.upper is None or value < self.upper[0] or (value == self.upper[0] and not bound[1]):
+                self.upper = bound
+
+        if bind_names:
+            self.bind_names.setdefault(part, bind_names[0])
+
+    def _in_bounds(self, value: Any) -> bool:
+        if self.lower is not None and (value < self.lower[0] or (value == self.lower[0] and not self.lower[1])):
+            return False
+
+        if self.upper is not None and (value > self.upper[0] or (value == self.upper[0] and not self.upper[1])):
+            return False
+
+        return True
+
+    def is_empty(self) -> bool:
+        if self.values is not None:
+            self.values = [value for value in self.values if value not in self.excluded and self._in_bounds(value)]
+            return not self.values
+
+        if self.lower is None or self.upper is None:
+            return False
+
+        if self.lower[0] == self.upper[0]:
+            return not (self.lower[1] and self.upper[1]) or self.lower[0] in self.excluded
+
+        return self.lower[0] > self.upper[0]
+
+    def _bind(self, part: str, value: Any, expanding: bool = False) -> Any:
+        name = self.bind_names.get(part)
+
+        return value if name is None else bindparam(name, value, type_=self.column.type, expanding=expanding)
+
+    def to_filters(self) -> List[ClauseElement]:
+        if self.values is not None:
+            if len(self.values) == 1:
+                return [self.column == self._bind("values", self.values[0])]
+
+            return [self.column.in_(self._bind("values", self.values, expanding=True))]
+
+        filters = []
+        lower = None if self.lower is None else self._bind("lower", self.lower[0])
+        upper = None if self.upper is None else self._bind("upper", self.upper[0])
+
+        if self.lower is not None and self.upper is not None and self.lower[1] and self.upper[1]:
+            filters.append(self.column.between(lower, upper))
+        else:
+            if self.lower is not None:
+                filters.append(self.column >= lower if self.lower[1] else self.column > lower)
+
+            if self.upper is not None:
+                filters.append(self.column <= upper if self.upper[1] else self.column < upper)
+
+        if self.excluded:
+            excluded = list(self.excluded)
+
+            if len(excluded) == 1:
+                filters.append(self.column != self._bind("excluded", excluded[0]))
+            else:
+                filters.append(self.column.not_in(self._bind("excluded", excluded, expanding=True)))
+
+        return filters
+
+
+def _flatten(filters: List[ClauseElement]) -> List[ClauseElement]:
+    flattened = []
+
+    for expression in filters:
+        if isinstance(expression, BooleanClauseList) and expression.operator is operators.and_:
+            flattened.extend(_flatten(list(expression.clauses)))
+        else:
+            flattened.append(expression)
+
+    return flattened
+
+
+def _get_bind_names(expression: ClauseElement) -> List[str]:
+    return [
+        element.key
+        for element in visitors.iterate(expression)
+        if isinstance(element, BindParameter) and not element.unique
+    ]
+
+
+def _get_value(bind: Any) -> Any:
+    if not isinstance(bind, BindParameter) or bind.callable is not None:
+        raise ValueError("not a bound value")
+
+    return bind.value
+
+
+def _decompose(expression: ClauseElement) -> Optional[Tuple[ClauseElement, Any, Any]]:
+    """Get the column, operator and value of a comparison the simplifier understands, or None."""
+    if not isinstance(expression, BinaryExpression) or expression.modifiers.get("escape"):
+        return None
+
+    operator = expression.operator
+
+    try:
+        if operator is operators.between_op and isinstance(expression.right, ClauseList):
+            value = [_get_value(bind) for bind in expression.right.clauses]
+        elif operator in (operators.in_op, operators.not_in_op) and getattr(expression.right, "expanding", False):
+            value = list(_get_value(expression.right))
+        elif operator in COMPARISONS or operator in (operators.eq, operators.ne):
+            value = _get_value(expression.right)
+        else:
+            return None
+    except ValueError:
+        return None
+
+    values = value if isinstance(value, list) else [value]
+    ranged = operator in COMPARISONS or operator is operators.between_op
+
+    if any(v is None for v in values):
+        return None
+
+    if ranged and not all(isinstance(v, ORDERED_TYPES) and not isinstance(v, bool) for v in values):
+        return None
+
+    if any(isinstance(v, str) for v in values) and is_case_insensitive_type(expression.left.type):
+        return None
+
+    try:
+        hash(tuple(values))
+    except TypeError:
+        return None
+
+    return expression.left, operator, value
+
+
+def simplify(filters: List[ClauseElement]) -> Tuple[List[ClauseElement], bool]:
+    """Merge the comparisons, `=`, `!=`, `>`, `>=`, `<`, `<=`, `BETWEEN`, `IN` and `NOT IN`, on the same column, remove
+        duplicate filters and detect filters that can never match, e.g. `size >= 10 AND size <= 5`. The filters are
+        combined with AND, filters that can not be simplified are kept as they are and the filters of a column are
+        only rebuilt if they could be simplified.
+
+    Args:
+        filters (List[ClauseElement]): The filters.
+
+    Returns:
+        Tuple[List[ClauseElement], bool]: The simplified filters, and whether they can never match.
+    """
+    simplified: List[Any] = []
+    columns: List[_ColumnPredicates] = []
+
+    for expression in _flatten(filters):
+        if any(expression.compare(other) for other in simplified if isinstance(other, ClauseElement)):
+            continue
+
+        comparison = _decompose(expression)
+
+        if comparison is None:
+            simplified.append(expression)
+            continue
+
+        column, operator, value = comparison
+        predicates = next((p for p in columns if p.column.compare(column)), None)
+
+        if predicates is None:
+            predicates = _ColumnPredicates(column)
+            columns.append(predicates)
+            simplified.append(predicates)
+
+        try:
+            predicates.add(operator, value, _get_bind_names(expression))
+        except TypeError:
+            # The values can not be compared in Python, e.g. naive and aware datetimes.
+            simplified.append(expression)
+            continue
+
+        predicates.expressions.append(expression)
+
+    result = []
+
+    for item in simplified:
+        if not isinstance(item, _ColumnPredicates):
+            result.append(item)
+            continue
+
+        try:
+            if item.is_empty():
+                return [], True
+
+            rebuilt = item.to_filters()
+        except TypeError:
+            result.extend(item.expressions)
+            continue
+
+        result.extend(item.expressions if len(rebuilt) == len(item.expressions) == 1 else rebuilt)
+
+    return result, False
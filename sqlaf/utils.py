@@ -1,6 +1,11 @@
 import inspect
-from typing import Any, Dict
-from urllib.parse import parse_qs
+import re
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+from urllib.parse import unquote, unquote_to_bytes
+
+from sqlaf import config
+from sqlaf.exceptions import QueryParamaterDataException
 
 
 def get_public_attrs(instance: Any):
@@ -16,11 +21,38 @@ def get_public_attrs(instance: Any):
     return [a[0] for a in attributes if not (a[0].startswith("_") or a[0].startswith("__") or a[0].endswith("__"))]
 
 
-def parse_query_string(query_string: str) -> Dict:
-    """Parse a querystring and return it in a dictionary format.
+def _unquote(value: Union[str, bytes]) -> str:
+    if isinstance(value, bytes):
+        return unquote_to_bytes(value.replace(b"+", b" ")).decode("utf-8", "replace")
+
+    return unquote(value.replace("+", " "), errors="replace")
+
+
+def parse_query_string(
+    query_string: Union[str, bytes],
+    multi_value_keys: Optional[Iterable[str]] = None,
+    keys: Optional[Iterable[str]] = None,
+    max_pairs: Optional[int] = None,
+    max_key_length: Optional[int] = None,
+    max_value_length: Optional[int] = None,
+) -> Dict:
+    """Parse a querystring and return it in a dictionary format. Only the first value of a key is kept, unless the key
+        is a multi value key, in which case the values of repeated keys and comma separated values are kept as a list
+        e.g. `id=1,2&id=3` is parsed as `{"id": ["1", "2", "3"]}`.
+
+        When `keys` is given, any other key is skipped without its value being decoded. The number of pairs and the
+        length of each key and value (before decoding) are limited, the limits default to the values in `sqlaf.config`.
 
     Args:
-        query_string (str): Query string
+        query_string (Union[str, bytes]): Query string, bytes are accepted as-is from an ASGI scope.
+        multi_value_keys (Iterable[str], optional): The keys to keep every value for. Defaults to None.
+        keys (Iterable[str], optional): The keys to parse, all keys are parsed if None. Defaults to None.
+        max_pairs (int, optional): The maximum number of key value pairs. Defaults to None.
+        max_key_length (int, optional): The maximum length of a key. Defaults to None.
+        max_value_length (int, optional): The maximum length of a value. Defaults to None.
+
+    Raises:
+        QueryParamaterDataException: The query string exceeds one of the limits.
 
     Returns:
         Dict: Query string represented in dictionary format.
@@ -28,7 +60,239 @@ def parse_query_string(query_string: str) -> Dict:
     if not query_string:
         return {}
 
-    if query_string[0] == "?":
+    is_bytes = isinstance(query_string, bytes)
+    separator, equals, comma = (b"&", b"=", b",") if is_bytes else ("&", "=", ",")
+
+    if query_string[:1] == (b"?" if is_bytes else "?"):
         query_string = query_string[1:]
 
-    return {k: v[0] for k, v in parse_qs(query_string).items()}
+    max_pairs = config.QUERY_STRING_MAX_PAIRS if max_pairs is None else max_pairs
+    max_key_length = config.QUERY_STRING_MAX_KEY_LENGTH if max_key_length is None else max_key_length
+    max_value_length = config.QUERY_STRING_MAX_VALUE_LENGTH if max_value_length is None else max_value_length
+
+    if query_string.count(separator) >= max_pairs:
+        raise QueryParamaterDataException(f"query string has more than {max_pairs} parameters.")
+
+    multi_value_keys = multi_value_keys or ()
+    raw_keys = None
+
+    if keys is not None:
+        keys = set(keys)
+        raw_keys = {key.encode("utf-8") for key in keys} if is_bytes else keys
+
+    data: Dict[str, Any] = {}
+
+    for pair in query_string.split(separator):
+        key, found, value = pair.partition(equals)
+
+        if len(key) > max_key_length:
+            raise QueryParamaterDataException(f"query string key is longer than {max_key_length} characters.")
+
+        if len(value) > max_value_length:
+            raise QueryParamaterDataException(f"query string value is longer than {max_value_length} characters.")
+
+        if not found or not value:
+            continue
+
+        if raw_keys is not None and key not in raw_keys:
+            if (b"%" if is_bytes else "%") not in key and (b"+" if is_bytes else "+") not in key:
+                continue
+
+            key = _unquote(key)
+
+            if key not in keys:
+                continue
+        else:
+            key = _unquote(key) if is_bytes or "%" in key or "+" in key else key
+
+        if key in multi_value_keys:
+            data.setdefault(key, []).extend(_unquote(item) for item in value.split(comma))
+        elif key not in data:
+            data[key] = _unquote(value)
+
+    return data
+
+
+_DATETIME_DIRECTIVES = {
+    "Y": "([0-9]{4})",
+    "m": "([0-9]{2})",
+    "d": "([0-9]{2})",
+    "H": "([0-9]{2})",
+    "M": "([0-9]{2})",
+    "S": "([0-9]{2})",
+    "z": "(Z|[+-][0-9]{2}:?[0-5][0-9])",
+}
+_timezones: Dict[str, timezone] = {"Z": timezone.utc}
+
+
+def _get_timezone(offset: str) -> timezone:
+    tz = _timezones.get(offset)
+
+    if tz is None:
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[-2:]))
+        tz = _timezones[offset] = timezone(-delta if offset[0] == "-" else delta)
+
+    return tz
+
+
+def get_datetime_parser(format: str) -> Callable[[str], datetime]:
+    """Get a function that parses a string into a datetime in the same way as `datetime.strptime(value, format)`.
+
+        If the format only uses zero padded numeric directives (`%Y`, `%m`, `%d`, `%H`, `%M`, `%S` and `%z`), as the
+        ISO 8601 formats do, the format is compiled into a regular expression once and values matching it are parsed
+        without `strptime`. Anything else, including values the fast path does not match, falls back to `strptime` so
+        the result and any error are identical.
+
+    Args:
+        format (str): The `strptime` format.
+
+    Returns:
+        Callable[[str], datetime]: The parser.
+    """
+
+    def strptime(value: str) -> datetime:
+        return datetime.strptime(value, format)
+
+    pattern = ""
+    directives = []
+    index = 0
+
+    while index < len(format):
+        char = format[index]
+
+        if char != "%":
+            pattern += re.escape(char)
+            index += 1
+            continue
+
+        directive = format[index + 1] if index + 1 < len(format) else ""
+
+        if directive == "%":
+            pattern += "%"
+        elif directive in _DATETIME_DIRECTIVES and directive not in directives:
+            pattern += _DATETIME_DIRECTIVES[directive]
+            directives.append(directive)
+        else:
+            return strptime
+
+        index += 2
+
+    regex = re.compile(pattern + r"\Z")
+    # Directives missing from the format take the `strptime` defaults, which are appended to the matched groups.
+    defaults = ("1900", "01", "01", "00", "00", "00")
+    year, month, day, hour, minute, second = (
+        directives.index(directive) if directive in directives else len(directives) + position
+        for position, directive in enumerate("YmdHMS")
+    )
+    tz = directives.index("z") if "z" in directives else None
+
+    def parse(value: str) -> datetime:
+        match = regex.match(value) if isinstance(value, str) else None
+
+        if match is None:
+            return strptime(value)
+
+        groups = match.groups() + defaults
+
+        try:
+            return datetime(
+                int(groups[year]),
+                int(groups[month]),
+                int(groups[day]),
+                int(groups[hour]),
+                int(groups[minute]),
+                int(groups[second]),
+                tzinfo=None if tz is None else _get_timezone(groups[tz]),
+            )
+        except ValueError:
+            return strptime(value)
+
+    return parse
+
+
+_RELATIVE_DATETIME = re.compile(r"(now|today|startofweek|startofmonth|startofyear)((?:[+-][0-9]+[smhdwMy])*)\Z")
+_RELATIVE_OFFSET = re.compile(r"([+-][0-9]+)([smhdwMy])")
+_OFFSET_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+ROUNDINGS = ["second", "minute", "hour", "day"]
+
+
+def is_relative_datetime(value: Any) -> bool:
+    """Whether the value is a relative date expression e.g. "now-7d".
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        bool: True if the value is a relative date expression.
+    """
+    return isinstance(value, str) and _RELATIVE_DATETIME.match(value) is not None
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    year, month = divmod(value.month - 1 + months, 12)
+    year, month = value.year + year, month + 1
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    last_day = (datetime(next_year, next_month, 1) - timedelta(days=1)).day
+
+    return value.replace(year=year, month=month, day=min(value.day, last_day))
+
+
+def resolve_relative_datetime(value: str, tz: tzinfo = timezone.utc, rounding: Optional[str] = None) -> datetime:
+    """Evaluate a relative date expression against `config.CLOCK`, e.g. "now-7d" is seven days ago.
+
+        An expression is an anchor, "now", "today", "startofweek", "startofmonth" or "startofyear", followed by any
+        number of offsets, a signed integer and a unit: "s" seconds, "m" minutes, "h" hours, "d" days, "w" weeks, "M"
+        months or "y" years, e.g. "startofmonth-1M". The anchors and day, month and year offsets are in the wall time
+        of the timezone. The result is rounded down to the `rounding`, so that expressions evaluated within the same
+        minute, by default, give the same datetime.
+
+    Args:
+        value (str): The relative date expression.
+        tz (tzinfo, optional): The timezone to evaluate the expression in. Defaults to UTC.
+        rounding (str, optional): The precision to round down to, "second", "minute", "hour" or "day". Defaults to
+            `config.RELATIVE_DATETIME_ROUNDING`.
+
+    Raises:
+        ValueError: The value is not a relative date expression.
+
+    Returns:
+        datetime: The datetime, aware in the timezone.
+    """
+    match = _RELATIVE_DATETIME.match(value) if isinstance(value, str) else None
+
+    if match is None:
+        raise ValueError(f"{value} is not a relative date expression.")
+
+    rounding = rounding or config.RELATIVE_DATETIME_ROUNDING
+
+    if rounding not in ROUNDINGS:
+        raise ValueError(f"{rounding} is not a supported rounding.")
+
+    anchor, offsets = match.groups()
+    now = config.CLOCK()
+    now = (now if now.tzinfo is not None else now.replace(tzinfo=timezone.utc)).astimezone(tz).replace(tzinfo=None)
+
+    if anchor != "now":
+        now = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    if anchor == "startofweek":
+        now -= timedelta(days=now.weekday())
+    elif anchor == "startofmonth":
+        now = now.replace(day=1)
+    elif anchor == "startofyear":
+        now = now.replace(month=1, day=1)
+
+    for amount, unit in _RELATIVE_OFFSET.findall(offsets):
+        if unit in ("M", "y"):
+            now = _add_months(now, int(amount) * (12 if unit == "y" else 1))
+        else:
+            now += timedelta(**{_OFFSET_UNITS[unit]: int(amount)})
+
+    now = now.replace(microsecond=0)
+
+    for position, unit in enumerate(("second", "minute", "hour")):
+        if ROUNDINGS.index(rounding) > position:
+            now = now.replace(**{unit: 0})
+
+    localize = getattr(tz, "localize", None)
+    return localize(now) if localize else now.replace(tzinfo=tz)
@@ -1,8 +1,11 @@
+import asyncio
 from unittest import TestCase
 
 import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from tests.implementation.db import Session, engine
+from tests.implementation.db import PostgresDBConfig, Session, engine
 
 
 class FilterTestCase(TestCase):
@@ -20,3 +23,32 @@ class FilterTestCase(TestCase):
 
         self.session.commit()
         self.session.expunge_all()
+
+    def capture_statements(self, callback):
+        """Call the callback and return its result with the SQL statements it executed with the session."""
+        statements = []
+        bind = self.session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(bind, "before_cursor_execute", before_cursor_execute)
+
+        try:
+            return callback(), statements
+        finally:
+            event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+    def run_async(self, callback):
+        """Await the callback with an `AsyncSession` and return its result."""
+
+        async def run():
+            async_engine = PostgresDBConfig.create_async_engine()
+
+            try:
+                async with AsyncSession(async_engine) as session:
+                    return await callback(session)
+            finally:
+                await async_engine.dispose()
+
+        return asyncio.run(run())
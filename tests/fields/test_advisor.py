@@ -0,0 +1,196 @@
+import ast
+import io
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+import sqlalchemy as db
+from sqlalchemy import func, text
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import advisor, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.models import Booking
+
+metadata = db.MetaData()
+
+guest = db.Table(
+    "guest",
+    metadata,
+    db.Column("id", db.Integer, primary_key=True),
+    db.Column("email", db.String, unique=True),
+    db.Column("name", db.String),
+    db.Column("age", db.Integer, index=True),
+    db.Column("tags", postgresql.ARRAY(db.String)),
+    db.Index("ix_guest_name_lower", func.lower(text("name"))),
+    db.Index("ix_guest_name_trgm", text("name gin_trgm_ops"), postgresql_using="gin"),
+    db.Index("ix_guest_tags_gin", "tags", postgresql_using="gin"),
+    db.Index("ix_guest_email_nocase", text("email COLLATE NOCASE")),
+)
+
+
+class GuestFilter(filters.Filter):
+    id = fields.IntegerField(guest.c.id)
+    email = fields.CharField(guest.c.email, operator="ieq")
+    name = fields.CharField(guest.c.name, operator="contains")
+    age = fields.IntegerField(guest.c.age, operator="gte")
+    tags = fields.ArrayField(guest.c.tags)
+
+
+class BookingFilter(filters.Filter):
+    name = fields.CharField(Booking.name, operator="icontains")
+    exact_name = fields.CharField(Booking.name, operator="ieq")
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="~eq")
+    date = fields.DateField(Booking.date, operator="gte")
+    guest_names = fields.ArrayField(Booking.guest_names)
+    custom = fields.CharField(Booking.name, operator=lambda source, value: source == value)
+
+
+class AdvisorTestCase(TestCase):
+    def get_recommendations(self, *targets):
+        return {(r.column, r.name): r for r in advisor.advise(*targets)}
+
+    def test_existing_indexes(self):
+        recommendations = self.get_recommendations(GuestFilter)
+        self.assertEqual(
+            {key: r.exists for key, r in recommendations.items()},
+            {
+                ("age", "ix_guest_age"): True,
+                ("email", "ix_guest_email_lower"): False,
+                ("id", "ix_guest_id"): True,
+                ("name", "ix_guest_name_trgm"): True,
+                ("tags", "ix_guest_tags_gin"): True,
+            },
+        )
+
+    def test_missing_indexes(self):
+        recommendations = self.get_recommendations(BookingFilter)
+        self.assertEqual(
+            sorted(recommendations),
+            [
+                ("date", "ix_booking_date"),
+                ("guest_names", "ix_booking_guest_names_gin"),
+                ("name", "ix_booking_name_lower"),
+                ("name", "ix_booking_name_trgm"),
+            ],
+        )
+        self.assertFalse(any(r.exists for r in recommendations.values()))
+        self.assertEqual(recommendations[("name", "ix_booking_name_trgm")].fields, ["BookingFilter.name (icontains)"])
+
+    def test_dialect(self):
+        recommendations = {(r.column, r.name): r.exists for r in advisor.advise(GuestFilter, dialect="sqlite")}
+        self.assertTrue(recommendations[("email", "ix_guest_email_nocase")])
+
+        recommendations = {r.name for r in advisor.advise(BookingFilter, dialect="sqlite")}
+        self.assertIn("ix_booking_name_nocase", recommendations)
+        self.assertNotIn("ix_booking_name_lower", recommendations)
+
+    def test_case_insensitive_override(self):
+        class NameFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator="icontains", case_insensitive="lower")
+
+        (recommendation,) = advisor.advise(NameFilter)
+        self.assertEqual(recommendation.name, "ix_booking_name_lower_trgm")
+        self.assertEqual(
+            recommendation.to_ddl("postgresql"),
+            "CREATE INDEX ix_booking_name_lower_trgm ON booking USING gin (lower(name) gin_trgm_ops);",
+        )
+
+    def test_prefix_operators(self):
+        class NameFilter(filters.Filter):
+            prefix = fields.CharField(Booking.name, operator="startswith")
+            lower_prefix = fields.CharField(Booking.name, operator="istartswith")
+            suffix = fields.CharField(Booking.name, operator="endswith")
+
+        self.assertEqual(
+            sorted(r.name for r in advisor.advise(NameFilter)),
+            ["ix_booking_name_lower_pattern", "ix_booking_name_pattern", "ix_booking_name_trgm"],
+        )
+        self.assertEqual(
+            sorted(r.name for r in advisor.advise(NameFilter, dialect="sqlite")),
+            ["ix_booking_name", "ix_booking_name_nocase", "ix_booking_name_trgm"],
+        )
+
+        recommendation = next(r for r in advisor.advise(NameFilter) if r.name == "ix_booking_name_lower_pattern")
+        self.assertEqual(
+            recommendation.to_ddl(),
+            "CREATE INDEX ix_booking_name_lower_pattern ON booking (lower(name) text_pattern_ops);",
+        )
+
+    def test_fields_share_recommendation(self):
+        class NameFilter(filters.Filter):
+            first = fields.CharField(Booking.name)
+            second = fields.CharField(Booking.name, operator="in")
+
+        (recommendation,) = advisor.advise(NameFilter)
+        self.assertEqual(recommendation.fields, ["NameFilter.first (eq)", "NameFilter.second (in)"])
+
+    def test_ddl(self):
+        recommendations = self.get_recommendations(BookingFilter)
+        trigram = recommendations[("name", "ix_booking_name_trgm")]
+        lower = recommendations[("name", "ix_booking_name_lower")]
+
+        self.assertEqual(
+            trigram.to_ddl("postgresql"), "CREATE INDEX ix_booking_name_trgm ON booking USING gin (name gin_trgm_ops);"
+        )
+        self.assertEqual(trigram.to_ddl("sqlite"), "-- ix_booking_name_trgm: gin indexes are not supported by sqlite")
+        self.assertEqual(lower.to_ddl("sqlite"), "CREATE INDEX ix_booking_name_lower ON booking (lower(name));")
+        self.assertEqual(lower.to_ddl("mysql"), "CREATE INDEX ix_booking_name_lower ON booking ((lower(name)));")
+        self.assertTrue(advisor.render_ddl([trigram]).startswith("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+
+    def test_alembic(self):
+        recommendations = self.get_recommendations(BookingFilter)
+        trigram = recommendations[("name", "ix_booking_name_trgm")]
+        array = recommendations[("guest_names", "ix_booking_guest_names_gin")]
+
+        self.assertEqual(
+            trigram.to_alembic(),
+            "op.create_index('ix_booking_name_trgm', 'booking', [sa.text('name gin_trgm_ops')], "
+            "postgresql_using='gin')",
+        )
+        self.assertEqual(
+            array.to_alembic(),
+            "op.create_index('ix_booking_guest_names_gin', 'booking', ['guest_names'], postgresql_using='gin')",
+        )
+
+        rendered = advisor.render_alembic([trigram, array])
+        self.assertIn('op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")', rendered)
+        self.assertIn("op.drop_index('ix_booking_guest_names_gin', table_name='booking')", rendered)
+
+    def test_alembic_quoted_identifiers(self):
+        table = db.Table("Guest's", db.MetaData(), db.Column("GuestName", db.String))
+
+        class QuotedFilter(filters.Filter):
+            name = fields.CharField(table.c.GuestName, operator="ieq")
+            exact_name = fields.CharField(table.c.GuestName)
+
+        recommendations = advisor.advise(QuotedFilter)
+        self.assertEqual(len(recommendations), 2)
+
+        rendered = advisor.render_alembic(recommendations)
+        module = ast.parse(rendered)
+        strings = {node.value for node in ast.walk(module) if isinstance(node, ast.Constant)}
+        self.assertLessEqual({"Guest's", "GuestName", 'lower("GuestName")', "ix_Guest's_GuestName_lower"}, strings)
+
+    def test_main(self):
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            status = advisor.main([__name__, "--dialect", "sqlite", "--check"])
+
+        self.assertEqual(status, 1)
+        self.assertIn("CREATE INDEX ix_booking_date ON booking (date);", output.getvalue())
+        self.assertNotIn("ix_guest_age", output.getvalue())
+
+
+class AdvisorDDLTestCase(FilterTestCase):
+    def test_ddl_executes(self):
+        for recommendation in advisor.advise(BookingFilter):
+            if recommendation.spec.ops is None:
+                self.session.execute(recommendation.to_ddl("postgresql"))
+
+        indexes = {
+            name
+            for (name,) in self.session.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'booking'"))
+        }
+        self.assertIn("ix_booking_name_lower", indexes)
+        self.assertIn("ix_booking_guest_names_gin", indexes)
@@ -1,15 +1,27 @@
-from sqlaf import fields, filters
+from datetime import date
+from enum import Enum
+
+import sqlalchemy as db
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import exceptions, fields, filters
 from tests.base import FilterTestCase
 from tests.implementation.factories import BookingFactory
 from tests.implementation.models import Booking
 
 
+class Guest(Enum):
+    JIM = "jim"
+    MICHAEL = "michael"
+    PAM = "pam"
+
+
 class BooleanFieldTestCase(FilterTestCase):
     def setUp(self):
         super().setUp()
-        BookingFactory(guest_names=["michael", "dwight", "pam", "jim"])
-        BookingFactory(guest_names=["kevin", "angela", "toby", "michael"])
-        BookingFactory(guest_names=["jim", "michael"])
+        BookingFactory(guest_names=["michael", "dwight", "pam", "jim"], room_numbers=[1, 2])
+        BookingFactory(guest_names=["kevin", "angela", "toby", "michael"], room_numbers=[3])
+        BookingFactory(guest_names=["jim", "michael"], room_numbers=[2, 4])
 
     # contains operator
 
@@ -90,3 +102,102 @@ class BooleanFieldTestCase(FilterTestCase):
         filtered_query = BookingFilter(query).filter({"guest_names": ["jim", "michael"]}).all()
         self.assertEqual(len(filtered_query), 1)
         self.assertEqual(filtered_query[0].guest_names, ["kevin", "angela", "toby", "michael"])
+
+    # overlap operator
+
+    def test_overlap_filter(self):
+        class BookingFilter(filters.Filter):
+            guest_names = fields.ArrayField(Booking.guest_names, operator="overlap")
+
+        query = self.session.query(Booking).order_by(Booking.id)
+        filtered_query = BookingFilter(query).filter("guest_names=pam,toby").all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].guest_names, ["michael", "dwight", "pam", "jim"])
+        self.assertEqual(filtered_query[1].guest_names, ["kevin", "angela", "toby", "michael"])
+
+    def test_overlap_filter_integer_array(self):
+        class BookingFilter(filters.Filter):
+            room_numbers = fields.ArrayField(Booking.room_numbers, operator="overlap")
+
+        query = self.session.query(Booking).order_by(Booking.id)
+        statement = BookingFilter(query).filter("room_numbers=3&room_numbers=4")
+        compiled = statement.statement.compile(dialect=postgresql.dialect())
+        self.assertIn("booking.room_numbers && %(room_numbers_1)s::INTEGER[]", str(compiled))
+        self.assertEqual(compiled.params["room_numbers_1"], [3, 4])
+
+        filtered_query = statement.all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].room_numbers, [3])
+        self.assertEqual(filtered_query[1].room_numbers, [2, 4])
+
+    def test_integer_array_invalid_item(self):
+        class BookingFilter(filters.Filter):
+            room_numbers = fields.ArrayField(Booking.room_numbers, operator="overlap")
+
+        query = self.session.query(Booking)
+
+        with self.assertRaisesRegex(exceptions.FieldValidationException, "four is not of type int"):
+            BookingFilter(query, raise_exceptions=True).filter({"room_numbers": "3,four"})
+
+    # contained_by operator
+
+    def test_contained_by_filter(self):
+        class BookingFilter(filters.Filter):
+            room_numbers = fields.ArrayField(Booking.room_numbers, operator="contained_by")
+
+        query = self.session.query(Booking).order_by(Booking.id)
+        filtered_query = BookingFilter(query).filter({"room_numbers": "1,2,3"}).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].room_numbers, [1, 2])
+        self.assertEqual(filtered_query[1].room_numbers, [3])
+
+    # any operator
+
+    def test_any_filter(self):
+        query = self.session.query(Booking).order_by(Booking.id)
+
+        for value in ["2", [3, 4], "5"]:
+            with self.subTest(value=value):
+                rows = {}
+
+                for operator in ["any", "overlap"]:
+
+                    class BookingFilter(filters.Filter):
+                        room_numbers = fields.ArrayField(Booking.room_numbers, operator=operator)
+
+                    statement = BookingFilter(query).filter({"room_numbers": value})
+                    self.assertIn(
+                        "booking.room_numbers && ", str(statement.statement.compile(dialect=postgresql.dialect()))
+                    )
+                    rows[operator] = [booking.id for booking in statement.all()]
+
+                self.assertEqual(rows["any"], rows["overlap"])
+
+    # enum_class
+
+    def test_enum_class(self):
+        class BookingFilter(filters.Filter):
+            guest_names = fields.ArrayField(Booking.guest_names, operator="overlap", enum_class=Guest)
+
+        query = self.session.query(Booking).order_by(Booking.id)
+        filtered_query = BookingFilter(query).filter({"guest_names": "pam"}).all()
+        self.assertEqual(len(filtered_query), 1)
+
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"guest_names": "pam,toby"})
+
+    def test_item_types(self):
+        table = db.Table(
+            "guest",
+            db.MetaData(),
+            db.Column("guests", postgresql.ARRAY(db.Enum(Guest))),
+            db.Column("flags", postgresql.ARRAY(db.Boolean)),
+            db.Column("dates", postgresql.ARRAY(db.Date)),
+        )
+
+        self.assertEqual(fields.ArrayField(table.c.guests).transform("JIM,PAM"), [Guest.JIM, Guest.PAM])
+        self.assertEqual(fields.ArrayField(table.c.flags).transform("true,0"), [True, False])
+        self.assertEqual(fields.ArrayField(table.c.dates).transform("2022-01-02"), [date(2022, 1, 2)])
+
+        with self.assertRaises(exceptions.FieldValidationException):
+            fields.ArrayField(table.c.guests).transform("TOBY")
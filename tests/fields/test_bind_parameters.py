@@ -0,0 +1,110 @@
+import warnings
+
+from sqlalchemy import literal_column, update
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import caching, exceptions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.db import engine
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    name = fields.CharField(Booking.name, operator="icontains")
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+
+def literal_eq(field, value):
+    return field == literal_column(f"'{value}'")
+
+
+class BindParametersTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Jim Halpert", number_of_heads=2)
+        BookingFactory(name="Michael Scott", number_of_heads=7)
+        BookingFactory(name="Pam Beesly", number_of_heads=4)
+
+    def compile(self, query):
+        return query.statement.compile(dialect=postgresql.dialect())
+
+    def test_named_bind_parameters(self):
+        query = self.session.query(Booking)
+        compiled = self.compile(BookingFilter(query, bind_parameters=True).filter({"name": "M", "number_of_heads": 4}))
+        self.assertIn("%(sqlaf_name_0)s", str(compiled))
+        self.assertIn("%(sqlaf_number_of_heads_0)s", str(compiled))
+        self.assertEqual(compiled.params["sqlaf_name_0"], "m")
+        self.assertEqual(compiled.params["sqlaf_number_of_heads_0"], 4)
+
+    def test_update_statement(self):
+        statement = BookingFilter(update(Booking).values(name="Dwight Schrute"), bind_parameters=True).filter(
+            {"name": "jim"}
+        )
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.assertEqual(compiled.params, {"name": "Dwight Schrute", "sqlaf_name_0": "jim"})
+
+        self.session.execute(statement, execution_options={"synchronize_session": False})
+        self.assertEqual(
+            sorted(name for (name,) in self.session.query(Booking.name)),
+            ["Dwight Schrute", "Michael Scott", "Pam Beesly"],
+        )
+
+    def test_key_with_suffix(self):
+        class SuffixBookingFilter(filters.Filter):
+            heads = fields.IntegerField(Booking.number_of_heads, operator="range")
+            heads_1 = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+        query = self.session.query(Booking)
+        compiled = self.compile(
+            SuffixBookingFilter(query, bind_parameters=True).filter({"heads": "1..5", "heads_1": 3})
+        )
+        self.assertEqual(compiled.params, {"sqlaf_heads_0": 1, "sqlaf_heads_1": 5, "sqlaf_heads_1_0": 3})
+
+    def test_same_shape_compiles_to_same_sql(self):
+        query = self.session.query(Booking)
+        first = self.compile(BookingFilter(query, bind_parameters=True).filter({"name": "a", "number_of_heads": 1}))
+        second = self.compile(BookingFilter(query, bind_parameters=True).filter({"name": "b", "number_of_heads": 9}))
+        self.assertEqual(str(first), str(second))
+
+    def test_filter_results(self):
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query, bind_parameters=True).filter({"name": "sc", "number_of_heads": 4}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Michael Scott")
+
+    def test_null_value_does_not_warn(self):
+        class NullBookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, null_values=["null"])
+
+        query = self.session.query(Booking)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            NullBookingFilter(query, bind_parameters=True).filter({"number_of_heads": "null"})
+
+        self.assertEqual(caught, [])
+
+    def test_uncacheable_custom_operator_warns(self):
+        class LiteralBookingFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator=literal_eq)
+
+        query = self.session.query(Booking)
+
+        with self.assertWarns(exceptions.UncacheableFilterWarning):
+            LiteralBookingFilter(query, bind_parameters=True).filter({"name": "Jim Halpert"})
+
+    def test_cache_statistics(self):
+        caching.reset_cache_statistics()
+        caching.track_compiled_cache(engine)
+        self.addCleanup(caching.untrack_compiled_cache, engine)
+
+        query = self.session.query(Booking)
+
+        for name in ("Jim", "Michael", "Pam"):
+            BookingFilter(query, bind_parameters=True).filter({"name": name}).all()
+
+        statistics = BookingFilter.get_cache_statistics()
+        self.assertEqual(statistics.total, 3)
+        self.assertGreaterEqual(statistics.hits, 2)
+        self.assertGreater(statistics.ratio, 0.5)
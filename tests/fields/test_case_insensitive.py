@@ -0,0 +1,99 @@
+import sqlalchemy as db
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from sqlaf import exceptions, expressions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+def compile_where(statement, dialect):
+    return str(statement.whereclause.compile(dialect=dialect))
+
+
+class CaseInsensitiveTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="100% Michael Scott")
+        BookingFactory(name="Jim_Halpert")
+        BookingFactory(name="JimXHalpert")
+
+    def filter(self, operator, value, strategy="auto"):
+        class BookingFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator=operator, case_insensitive=strategy)
+
+        return BookingFilter(db.select(Booking.name).order_by(Booking.name)).filter({"name": value})
+
+    def test_strategies(self):
+        for strategy in ("auto", "lower", "ilike", "nocase"):
+            with self.subTest(strategy=strategy):
+                names = self.session.execute(self.filter("ieq", "jim_halpert", strategy)).scalars().all()
+                self.assertEqual(names, ["Jim_Halpert"])
+
+                names = self.session.execute(self.filter("~ieq", "jim_halpert", strategy)).scalars().all()
+                self.assertEqual(names, ["100% Michael Scott", "JimXHalpert"])
+
+                names = self.session.execute(self.filter("icontains", "0% m", strategy)).scalars().all()
+                self.assertEqual(names, ["100% Michael Scott"])
+
+    def test_postgresql(self):
+        self.assertEqual(
+            compile_where(self.filter("ieq", "Jim"), postgresql.dialect()), "lower(booking.name) = %(param_1)s"
+        )
+        self.assertEqual(
+            compile_where(self.filter("icontains", "Jim"), postgresql.dialect()),
+            "booking.name ILIKE '%%' || %(param_1)s || '%%' ESCAPE '/'",
+        )
+
+    def test_sqlite(self):
+        self.assertEqual(
+            compile_where(self.filter("ieq", "Jim"), sqlite.dialect()), 'booking.name = (? COLLATE "NOCASE")'
+        )
+        self.assertEqual(
+            compile_where(self.filter("icontains", "Jim"), sqlite.dialect()),
+            "booking.name LIKE '%' || ? || '%' ESCAPE '/'",
+        )
+
+    def test_other_dialects(self):
+        self.assertEqual(
+            compile_where(self.filter("ieq", "Jim", "nocase"), mysql.dialect()), "lower(booking.name) = %s"
+        )
+
+    def test_case_insensitive_column(self):
+        table = db.Table("guest", db.MetaData(), db.Column("name", db.String(collation="utf8mb4_general_ci")))
+
+        class GuestFilter(filters.Filter):
+            name = fields.CharField(table.c.name, operator="ieq")
+
+        statement = GuestFilter(db.select(table.c.name)).filter({"name": "Jim"})
+        self.assertEqual(compile_where(statement, mysql.dialect()), "guest.name = %s")
+        self.assertEqual(expressions.get_case_insensitive_strategy(table.c.name, "eq", "mysql"), "native")
+
+    def test_escaped_value(self):
+        statement = self.filter("ieq", "Jim_Halpert", "ilike")
+        self.assertEqual(statement.compile(dialect=postgresql.dialect()).params, {"param_1": "jim/_halpert"})
+
+    def test_unsupported_strategy(self):
+        with self.assertRaises(exceptions.FieldInstantiationException):
+            fields.CharField(Booking.name, operator="ieq", case_insensitive="upper")
+
+    def test_sqlite_execution(self):
+        engine = db.create_engine("sqlite://")
+        table = db.Table("guest", db.MetaData(), db.Column("name", db.String))
+        table.create(engine)
+
+        class GuestFilter(filters.Filter):
+            exact = fields.CharField(table.c.name, operator="ieq")
+            partial = fields.CharField(table.c.name, operator="icontains")
+
+        with engine.begin() as connection:
+            connection.execute(table.insert(), [{"name": "Jim_Halpert"}, {"name": "JIMXHALPERT"}])
+            statement = db.select(table.c.name)
+
+            self.assertEqual(
+                connection.execute(GuestFilter(statement).filter({"exact": "jim_halpert"})).scalars().all(),
+                ["Jim_Halpert"],
+            )
+            self.assertEqual(
+                connection.execute(GuestFilter(statement).filter({"partial": "m_h"})).scalars().all(), ["Jim_Halpert"]
+            )
@@ -1,3 +1,5 @@
+from sqlalchemy import String, type_coerce
+
 from sqlaf import fields, filters
 from tests.base import FilterTestCase
 from tests.implementation.factories import BookingFactory
@@ -152,3 +154,66 @@ class CharFieldTestCase(FilterTestCase):
         filtered_query = BookingFilter(query).filter({"name": "t\\b"}).order_by(Booking.name).all()  # NOQA
         self.assertEqual(len(filtered_query), 1)
         self.assertEqual(filtered_query[0].name, "Pam Halpert\Beesly")  # NOQA
+
+    # startswith operator
+
+    def test_startswith_filter(self):
+        class BookingFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator="startswith")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"name": "100%"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "100% Michael Scott")
+
+        filtered_query = BookingFilter(query).filter({"name": "jim"}).all()
+        self.assertEqual(len(filtered_query), 0)
+
+    def test_startswith_filter_range(self):
+        class BookingFilter(filters.Filter):
+            name = fields.CharField(
+                type_coerce(Booking.name.collate("C"), String(collation="C")), operator="startswith"
+            )
+
+        query = self.session.query(Booking)
+        statement = BookingFilter(query).filter({"name": "Pam Halpert\\"})
+        self.assertIn("<", str(statement.statement.compile(dialect=self.session.bind.dialect)))
+        filtered_query = statement.all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Pam Halpert\Beesly")  # NOQA
+
+    # istartswith operator
+
+    def test_istartswith_filter(self):
+        class BookingFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator="istartswith")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"name": "jim h"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Jim Halpert")
+
+    # endswith operator
+
+    def test_endswith_filter(self):
+        class BookingFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator="endswith")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"name": "Halpert"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Jim Halpert")
+
+    # in operator
+
+    def test_in_filter(self):
+        class BookingFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator="in")
+
+        query = self.session.query(Booking)
+        filtered_query = (
+            BookingFilter(query).filter("name=Jim Halpert&name=100%25 Michael Scott").order_by(Booking.name).all()
+        )
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].name, "100% Michael Scott")
+        self.assertEqual(filtered_query[1].name, "Jim Halpert")
@@ -1,4 +1,4 @@
-from sqlaf import fields, filters
+from sqlaf import exceptions, fields, filters
 from tests.base import FilterTestCase
 from tests.implementation.factories import BookingFactory
 from tests.implementation.models import Booking
@@ -23,3 +23,7 @@ class CustomOperatorTestCase(FilterTestCase):
         filtered_query = BookingFilter(query).filter({"name": "Jim Halpert"}).all()
         self.assertEqual(len(filtered_query), 1)
         self.assertEqual(filtered_query[0].name, "jim halpert")
+
+    def test_unknown_operator(self):
+        with self.assertRaises(exceptions.FieldInstantiationException):
+            fields.Field(Booking.name, operator="unknown")
@@ -1,6 +1,7 @@
-from datetime import date
+from datetime import date, datetime, timezone
+from unittest import mock
 
-from sqlaf import fields, filters
+from sqlaf import exceptions, fields, filters
 from tests.base import FilterTestCase
 from tests.implementation.factories import BookingFactory
 from tests.implementation.models import Booking
@@ -93,3 +94,65 @@ class DateFieldTestCase(FilterTestCase):
         self.assertEqual(filtered_query[1].date, date(2022, 1, 1))
         self.assertEqual(filtered_query[2].date, date(2022, 1, 2))
         self.assertEqual(filtered_query[3].date, date(2022, 1, 1))
+
+    # range operator
+
+    def test_range_filter(self):
+        class BookingFilter(filters.Filter):
+            date = fields.DateField(Booking.date, operator="range")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"date": "2022-01-02..2022-01-04"}).order_by(Booking.date).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].date, date(2022, 1, 2))
+        self.assertEqual(filtered_query[1].date, date(2022, 1, 4))
+
+    def test_range_filter_open_bounds(self):
+        class BookingFilter(filters.Filter):
+            date = fields.DateField(Booking.date, operator="range")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"date": "2022-01-02.."}).all()), 2)
+        self.assertEqual(len(BookingFilter(query).filter({"date": "..2022-01-02"}).all()), 4)
+
+    def test_range_filter_half_open_bounds(self):
+        class BookingFilter(filters.Filter):
+            date = fields.DateField(Booking.date, operator="range", bounds="[)")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"date": "2022-01-01..2022-01-04"}).all()
+        self.assertEqual(len(filtered_query), 4)
+
+    def test_range_filter_inverted_range(self):
+        class BookingFilter(filters.Filter):
+            date = fields.DateField(Booking.date, operator="range")
+
+        query = self.session.query(Booking)
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"date": "2022-01-04..2022-01-01"})
+
+    # relative dates
+
+    @mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 3, 8, 30, tzinfo=timezone.utc))
+    def test_relative_date_filter(self):
+        class BookingFilter(filters.Filter):
+            date = fields.DateField(Booking.date, operator="gte")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"date": "today-1d"}).all()), 2)
+        self.assertEqual(len(BookingFilter(query).filter({"date": "startofmonth"}).all()), 5)
+
+    def test_relative_date_is_not_cached(self):
+        field = fields.DateField(Booking.date, cache_size=10)
+
+        with mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 3, tzinfo=timezone.utc)):
+            self.assertEqual(field.clean("today"), date(2022, 1, 3))
+
+        with mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 4, tzinfo=timezone.utc)):
+            self.assertEqual(field.clean("today"), date(2022, 1, 4))
+
+        self.assertEqual(field.cache_info().misses, 0)
+
+    def test_invalid_rounding(self):
+        with self.assertRaises(exceptions.FieldInstantiationException):
+            fields.DateField(Booking.date, rounding="week")
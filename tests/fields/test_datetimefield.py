@@ -1,6 +1,9 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
 
-from sqlaf import fields, filters
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import exceptions, fields, filters
 from tests.base import FilterTestCase
 from tests.implementation.factories import BookingFactory
 from tests.implementation.models import Booking
@@ -142,3 +145,192 @@ class DateTimeFieldTestCase(FilterTestCase):
             filtered_query[2].created_at,
             datetime(2022, 1, 1, 17, 0, tzinfo=timezone.utc),
         )
+
+    # range operator
+
+    def test_range_filter(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, operator="range", bounds="[)")
+
+        query = self.session.query(Booking)
+        filtered_query = (
+            BookingFilter(query)
+            .filter({"created_at": "2022-01-01T15:00:00+0000..2022-01-02T10:00:00+0000"})
+            .order_by(Booking.created_at)
+            .all()
+        )
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].created_at, datetime(2022, 1, 1, 15, 0, tzinfo=timezone.utc))
+        self.assertEqual(filtered_query[1].created_at, datetime(2022, 1, 1, 17, 0, tzinfo=timezone.utc))
+
+    def test_range_filter_incomparable_bounds(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, operator="range")
+
+        query = self.session.query(Booking)
+        value = (datetime(2022, 1, 1), datetime(2022, 1, 2, tzinfo=timezone.utc))
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": value}).all()), 5)
+
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"created_at": value})
+
+    # granularity
+
+    def test_granularity_eq_filter(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="day")
+
+        query = BookingFilter(self.session.query(Booking)).filter({"created_at": "2022-01-01"})
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("booking.created_at >= %(created_at_1)s AND booking.created_at < %(created_at_2)s", sql)
+        self.assertNotIn("date(", sql)
+        self.assertEqual(len(query.all()), 3)
+
+    def test_granularity_date_value(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="day")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": date(2022, 1, 2)}).all()), 1)
+
+    def test_granularity_timestamp_value(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="day")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01-01T23:00:00+0000"}).all()), 3)
+
+    def test_granularity_hour(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="hour")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"created_at": "2022-01-01T15"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].created_at, datetime(2022, 1, 1, 15, 0, tzinfo=timezone.utc))
+
+    def test_granularity_month(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="month")
+
+        BookingFactory(created_at=datetime(2022, 2, 1, 0, 0))
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01"}).all()), 5)
+
+    def test_granularity_timezone(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(
+                Booking.created_at, granularity="day", timezone=timezone(timedelta(hours=12))
+            )
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01-02"}).all()), 4)
+
+    def test_granularity_comparison_operators(self):
+        query = self.session.query(Booking)
+        expected = {"~eq": 2, "gt": 2, "gte": 5, "lt": 0, "lte": 3}
+
+        for operator, count in expected.items():
+
+            class BookingFilter(filters.Filter):
+                created_at = fields.DateTimeField(Booking.created_at, operator=operator, granularity="day")
+
+            with self.subTest(operator=operator):
+                self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01-01"}).all()), count)
+
+    def test_granularity_range(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, operator="range", granularity="day")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01-01..2022-01-02"}).all()), 4)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01-02.."}).all()), 2)
+
+    def test_granularity_half_open_range(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, operator="range", granularity="day", bounds="[)")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "2022-01-01..2022-01-02"}).all()), 3)
+
+    def test_granularity_invalid_value(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="day")
+
+        query = self.session.query(Booking)
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"created_at": "2022-13-01"})
+
+    def test_granularity_null_value(self):
+        BookingFactory(created_at=None)
+
+        for operator, count in [("eq", 1), ("~eq", 5)]:
+
+            class BookingFilter(filters.Filter):
+                created_at = fields.DateTimeField(
+                    Booking.created_at, operator=operator, granularity="day", null_values=["null"]
+                )
+
+            with self.subTest(operator=operator):
+                query = BookingFilter(self.session.query(Booking)).filter({"created_at": "null"})
+                self.assertEqual(len(query.all()), count)
+
+        class GteBookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(
+                Booking.created_at, operator="gte", granularity="day", null_values=["null"]
+            )
+
+        query = GteBookingFilter(self.session.query(Booking)).filter({"created_at": "null"})
+        self.assertEqual(len(query.all()), 6)
+
+        with self.assertRaises(exceptions.OperatorArgumentError):
+            GteBookingFilter(self.session.query(Booking), raise_exceptions=True).filter({"created_at": "null"})
+
+    def test_invalid_granularity(self):
+        with self.assertRaises(exceptions.FieldInstantiationException) as context:
+            fields.DateTimeField(Booking.created_at, granularity="week")
+
+        self.assertEqual(
+            str(context.exception), "week is not a supported granularity, expected one of: month, day, hour."
+        )
+
+    # relative dates
+
+    @mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 2, 11, 0, tzinfo=timezone.utc))
+    def test_relative_datetime_filter(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, operator="gte")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "now-20h"}).all()), 4)
+
+    @mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 2, 11, 0, tzinfo=timezone.utc))
+    def test_relative_datetime_naive_format(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, format="%Y-%m-%dT%H:%M:%S", operator="range")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"created_at": "2022-01-01T14:00:00..now"}).all()
+        self.assertEqual(len(filtered_query), 3)
+
+    def test_relative_datetime_rounding_shares_cache_key(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, operator="gte")
+
+        query = self.session.query(Booking)
+        statements = []
+
+        for second in (5, 55):
+            with mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 2, 11, 0, second, tzinfo=timezone.utc)):
+                statements.append(BookingFilter(query).filter({"created_at": "now-7d"}).statement)
+
+        first, second = [statement.compile().params for statement in statements]
+        self.assertEqual(first, second)
+
+    @mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 1, 23, 30, tzinfo=timezone.utc))
+    def test_relative_datetime_granularity(self):
+        class BookingFilter(filters.Filter):
+            created_at = fields.DateTimeField(Booking.created_at, granularity="day")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"created_at": "now"}).all()), 3)
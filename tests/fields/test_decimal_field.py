@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import exceptions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class DecimalFieldTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(deposit=10.5)
+        BookingFactory(deposit=20.25)
+        BookingFactory(deposit=30)
+
+    def test_transform(self):
+        field = fields.DecimalField(Booking.deposit)
+        self.assertEqual(field.transform("20.25"), Decimal("20.25"))
+        self.assertEqual(field.transform(10.5), Decimal("10.5"))
+
+    def test_transform_invalid_value(self):
+        field = fields.DecimalField(Booking.deposit)
+
+        for value in ["ten", "NaN", "Infinity", [1]]:
+            with self.assertRaises(exceptions.FieldValidationException):
+                field.transform(value)
+
+    # eq operator
+
+    def test_eq_filter(self):
+        class BookingFilter(filters.Filter):
+            deposit = fields.DecimalField(Booking.deposit)
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"deposit": "20.25"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].deposit, 20.25)
+
+    # range operator
+
+    def test_range_filter(self):
+        class BookingFilter(filters.Filter):
+            deposit = fields.DecimalField(Booking.deposit, operator="range")
+
+        query = BookingFilter(self.session.query(Booking)).filter({"deposit": "10.5..20.25"})
+        self.assertIn("BETWEEN", str(query.statement.compile(dialect=postgresql.dialect())))
+
+        filtered_query = query.order_by(Booking.deposit).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].deposit, 10.5)
+        self.assertEqual(filtered_query[1].deposit, 20.25)
+
+    def test_range_filter_exclusive_lower_bound(self):
+        class BookingFilter(filters.Filter):
+            deposit = fields.DecimalField(Booking.deposit, operator="range", bounds="(]")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"deposit": "10.5.."}).all()
+        self.assertEqual(len(filtered_query), 2)
+
+    def test_range_filter_inverted_range(self):
+        class BookingFilter(filters.Filter):
+            deposit = fields.DecimalField(Booking.deposit, operator="range")
+
+        query = self.session.query(Booking)
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"deposit": "20..10.5"})
@@ -128,6 +128,29 @@ class IntegerFieldTestCase(FilterTestCase):
         filtered_query = BookingFilter(query).filter({"number_of_heads": "null"}).all()
         self.assertEqual(len(filtered_query), 3)
 
+    # in operator
+
+    def test_in_filter_int_enum(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.EnumField(Booking.number_of_heads, NumberOfHeads, operator="in")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"number_of_heads": "3,5"}).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].number_of_heads, 3)
+        self.assertEqual(filtered_query[1].number_of_heads, 5)
+
+    # ~in operator
+
+    def test_not_in_filter_string_enum(self):
+        class BookingFilter(filters.Filter):
+            name = fields.EnumField(Booking.name, Name, operator="~in")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"name": ["michael", "jim"]}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "dwight")
+
     # exceptions
 
     def test_invalid_int_enum_option(self):
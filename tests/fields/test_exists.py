@@ -0,0 +1,72 @@
+from sqlalchemy import select
+
+from sqlaf import fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    ordering = {"id": Booking.id}
+    default_ordering = "id"
+
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+    max_heads = fields.IntegerField(Booking.number_of_heads, operator="lte")
+
+
+class ExistsTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+
+        for number_of_heads in range(1, 6):
+            BookingFactory(id=number_of_heads, number_of_heads=number_of_heads)
+
+    def test_exists(self):
+        exists, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking)).exists(self.session, {"number_of_heads": 5})
+        )
+        self.assertIs(exists, True)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith("SELECT EXISTS (SELECT"))
+        self.assertIn("LIMIT", statements[0])
+        self.assertNotIn("ORDER BY", statements[0])
+
+    def test_not_exists(self):
+        self.assertIs(BookingFilter(select(Booking)).exists(self.session, {"number_of_heads": 6}), False)
+
+    def test_exists_query(self):
+        self.assertIs(BookingFilter(self.session.query(Booking)).exists(self.session, "number_of_heads=3"), True)
+
+    def test_count_at_most(self):
+        count, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking)).count_at_most(self.session, {"number_of_heads": 2}, 2)
+        )
+        self.assertEqual(count, 2)
+        self.assertEqual(len(statements), 1)
+        self.assertIn("LIMIT", statements[0])
+
+    def test_count_at_most_below_limit(self):
+        self.assertEqual(BookingFilter(select(Booking)).count_at_most(self.session, {"number_of_heads": 4}, 10), 2)
+
+    def test_count_at_most_query(self):
+        filter_ = BookingFilter(self.session.query(Booking.id))
+        self.assertEqual(filter_.count_at_most(self.session, {}, 3), 3)
+
+    def test_empty_filters_not_executed(self):
+        data = {"number_of_heads": 4, "max_heads": 2}
+        filter_ = BookingFilter(select(Booking), simplify=True)
+        (exists, count), statements = self.capture_statements(
+            lambda: (filter_.exists(self.session, data), filter_.count_at_most(self.session, data, 5))
+        )
+        self.assertIs(exists, False)
+        self.assertEqual(count, 0)
+        self.assertEqual(statements, [])
+
+    def test_async(self):
+        self.session.commit()
+
+        async def callback(session):
+            filter_ = BookingFilter(select(Booking))
+            return await filter_.exists(session, {"number_of_heads": 3}), await filter_.count_at_most(session, {}, 4)
+
+        self.assertEqual(self.run_async(callback), (True, 4))
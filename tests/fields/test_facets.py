@@ -0,0 +1,138 @@
+import enum
+from unittest import TestCase
+
+import sqlalchemy as db
+from sqlalchemy import event, select
+
+from sqlaf import exceptions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class NumberOfHeads(enum.IntEnum):
+
+    one = 1
+    two = 2
+    three = 3
+
+
+class BookingFilter(filters.Filter):
+    has_paid = fields.BooleanField(Booking.has_paid, truthy=["true"], falsy=["false"])
+    name = fields.CharField(Booking.name)
+    number_of_heads = fields.EnumField(Booking.number_of_heads, NumberOfHeads)
+    deposit = fields.IntegerField(Booking.deposit, operator="gte")
+    max_deposit = fields.IntegerField(Booking.deposit, operator="lte")
+    not_name = fields.CharField(Booking.name, operator="~eq")
+
+
+class FacetsTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="michael", has_paid=True, number_of_heads=1, deposit=10)
+        BookingFactory(name="michael", has_paid=False, number_of_heads=2, deposit=20)
+        BookingFactory(name="jim", has_paid=True, number_of_heads=2, deposit=30)
+        BookingFactory(name="dwight", has_paid=True, number_of_heads=3, deposit=40)
+
+    def facets(self, data, keys, query=None, **kwargs):
+        facets, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking) if query is None else query, **kwargs).facets(
+                self.session, data, keys
+            )
+        )
+        self.assertEqual(len(statements), 1)
+        return facets
+
+    def test_no_filters(self):
+        facets = self.facets({}, ["name", "has_paid", "number_of_heads"])
+        self.assertEqual(facets["name"], {"michael": 2, "jim": 1, "dwight": 1})
+        self.assertEqual(facets["has_paid"], {True: 3, False: 1})
+        self.assertEqual(facets["number_of_heads"], {1: 1, 2: 2, 3: 1})
+
+    def test_excludes_own_filter(self):
+        facets = self.facets({"name": "michael", "has_paid": "true"}, ["name", "has_paid"])
+        self.assertEqual(facets["name"], {"michael": 1, "jim": 1, "dwight": 1})
+        self.assertEqual(facets["has_paid"], {True: 1, False: 1})
+
+    def test_other_filters(self):
+        facets = self.facets({"deposit": 20, "number_of_heads": 2}, ["name", "number_of_heads"])
+        self.assertEqual(facets["name"], {"michael": 1, "jim": 1})
+        self.assertEqual(facets["number_of_heads"], {2: 2, 3: 1})
+
+    def test_query_string(self):
+        facets = self.facets("has_paid=false", ["name"])
+        self.assertEqual(facets, {"name": {"michael": 1}})
+
+    def test_query(self):
+        facets = self.facets({"has_paid": "true"}, ["name"], query=self.session.query(Booking))
+        self.assertEqual(facets, {"name": {"michael": 1, "jim": 1, "dwight": 1}})
+
+    def test_simplify(self):
+        facets = self.facets({"name": "jim", "not_name": "jim"}, ["name", "has_paid"], simplify=True)
+        self.assertEqual(facets, {"name": {"michael": 2, "dwight": 1}, "has_paid": {}})
+
+    def test_empty_filters_not_executed(self):
+        filter_ = BookingFilter(select(Booking), simplify=True)
+        facets, statements = self.capture_statements(
+            lambda: filter_.facets(self.session, {"deposit": 30, "max_deposit": 20}, ["name", "has_paid"])
+        )
+        self.assertTrue(filter_.is_empty)
+        self.assertEqual(facets, {"name": {}, "has_paid": {}})
+        self.assertEqual(statements, [])
+
+    def test_invalid_field(self):
+        for key in ["deposit", "missing"]:
+            with self.subTest(key=key), self.assertRaises(exceptions.QueryParamaterDataException):
+                BookingFilter(select(Booking)).facets(self.session, {}, [key])
+
+    def test_async(self):
+        self.session.commit()
+
+        facets = self.run_async(
+            lambda session: BookingFilter(select(Booking)).facets(session, {"name": "jim"}, ["name", "has_paid"])
+        )
+        self.assertEqual(facets, {"name": {"michael": 2, "jim": 1, "dwight": 1}, "has_paid": {True: 1}})
+
+
+metadata = db.MetaData()
+ticket = db.Table(
+    "ticket",
+    metadata,
+    db.Column("id", db.Integer, primary_key=True),
+    db.Column("status", db.String),
+    db.Column("is_urgent", db.Boolean),
+)
+
+
+class TicketFilter(filters.Filter):
+    status = fields.CharField(ticket.c.status)
+    is_urgent = fields.BooleanField(ticket.c.is_urgent)
+
+
+class SQLiteFacetsTestCase(TestCase):
+    def setUp(self):
+        self.engine = db.create_engine("sqlite://")
+        metadata.create_all(self.engine)
+
+        with self.engine.begin() as connection:
+            connection.execute(
+                ticket.insert(),
+                [
+                    {"id": 1, "status": "open", "is_urgent": True},
+                    {"id": 2, "status": "open", "is_urgent": False},
+                    {"id": 3, "status": "closed", "is_urgent": True},
+                ],
+            )
+
+    def test_union_all(self):
+        statements = []
+        event.listen(
+            self.engine, "before_cursor_execute", lambda c, cursor, statement, *args: statements.append(statement)
+        )
+
+        with self.engine.connect() as connection:
+            facets = TicketFilter(select(ticket)).facets(connection, {"status": "open"}, ["status", "is_urgent"])
+
+        self.assertEqual(facets, {"status": {"open": 2, "closed": 1}, "is_urgent": {True: 1, False: 1}})
+        self.assertEqual(len(statements), 1)
+        self.assertIn("UNION ALL", statements[0])
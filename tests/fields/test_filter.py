@@ -100,3 +100,44 @@ class IntegerFieldTestCase(FilterTestCase):
         with self.assertRaises(exceptions.QueryParamaterDataException):
             query = self.session.query(Booking)
             BookingFilter(query).filter(10).all()
+
+    def test_filter_inherited_fields(self):
+        class ParentFilter(filters.Filter):
+            name = fields.CharField(Booking.name, operator="icontains")
+
+        class ChildFilter(ParentFilter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+        self.assertEqual(list(ChildFilter._fields), ["name", "number_of_heads"])
+
+        query = self.session.query(Booking)
+        filtered_query = ChildFilter(query).filter({"name": "e", "number_of_heads": 4}).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].name, "Michael Scott")
+        self.assertEqual(filtered_query[1].name, "Dwight Schrute")
+
+    def test_filter_removed_inherited_field(self):
+        class ChildFilter(BookingFilter):
+            name = None
+
+        self.assertNotIn("name", ChildFilter._fields)
+
+        query = self.session.query(Booking)
+        filtered_query = ChildFilter(query).filter({"name": "Jim"}).all()
+        self.assertEqual(len(filtered_query), 5)
+
+    def test_filter_with_query_string_bytes(self):
+        query = self.session.query(Booking)
+        filtered_query = (
+            BookingFilter(query)
+            .filter(b"name=A&number_of_heads=2&guest_names=pam&date=2020-01-05&created_at=2020-01-01T10:00:00%2B0000")
+            .all()
+        )
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Jim Halpert")
+
+    def test_filter_with_query_string_too_many_parameters(self):
+        query = self.session.query(Booking)
+
+        with self.assertRaises(exceptions.QueryParamaterDataException):
+            BookingFilter(query).filter("&".join(f"key{i}=1" for i in range(1000))).all()
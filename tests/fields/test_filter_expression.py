@@ -0,0 +1,79 @@
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import exceptions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    expression_key = "where"
+
+    name = fields.CharField(Booking.name)
+    number_of_heads = fields.IntegerField(Booking.number_of_heads)
+
+
+class FilterExpressionTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Jim Halpert", number_of_heads=2)
+        BookingFactory(name="Michael Scott", number_of_heads=7)
+        BookingFactory(name="Dwight Schrute", number_of_heads=4)
+
+    def filter(self, data, **kwargs):
+        return BookingFilter(self.session.query(Booking), **kwargs).filter(data).order_by(Booking.name)
+
+    def test_or(self):
+        filtered_query = self.filter({"where": "or(name.icontains=jim,number_of_heads.gte=5)"}).all()
+        self.assertEqual([booking.name for booking in filtered_query], ["Jim Halpert", "Michael Scott"])
+
+    def test_query_string(self):
+        filtered_query = self.filter("where=or(name.icontains=jim,number_of_heads.gte=5)").all()
+        self.assertEqual(len(filtered_query), 2)
+
+    def test_json(self):
+        where = {
+            "or": [{"name": "Jim Halpert"}, {"and": [{"number_of_heads.gt": 3}, {"not": {"name.icontains": "m"}}]}]
+        }
+        filtered_query = self.filter({"where": where}).all()
+        self.assertEqual([booking.name for booking in filtered_query], ["Dwight Schrute", "Jim Halpert"])
+
+    def test_combined_with_fields(self):
+        filtered_query = self.filter(
+            {"name": "Michael Scott", "where": "or(number_of_heads=2,number_of_heads=7)"}
+        ).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Michael Scott")
+
+    def test_compiles_to_single_predicate(self):
+        query = self.filter({"where": 'or(name.icontains=jim,not(number_of_heads.in="2,4"))'})
+        sql = str(query.statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("WHERE booking.name ILIKE", sql)
+        self.assertIn(" OR (booking.number_of_heads NOT IN", sql)
+        self.assertEqual(len(query.all()), 2)
+
+    def test_bind_parameters(self):
+        query = self.filter({"where": "or(name=a,number_of_heads.gte=3)"}, bind_parameters=True)
+        self.assertEqual(query.statement.compile().params, {"sqlaf_where_0_0": "a", "sqlaf_where_1_0": 3})
+
+    def test_invalid_condition(self):
+        for where in ["or(guest=a,name=b)", "name.gte=a", "or(name=a,number_of_heads=four)", "or(name=a"]:
+            with self.subTest(where=where):
+                with self.assertRaises(exceptions.SQLAlchemyFiltersBaseException):
+                    self.filter({"where": where}, raise_exceptions=True)
+
+                self.assertEqual(len(self.filter({"where": where}).all()), 3)
+
+    def test_expression_key_not_set(self):
+        class NameFilter(filters.Filter):
+            name = fields.CharField(Booking.name)
+
+        query = NameFilter(self.session.query(Booking)).filter({"where": "name=Jim Halpert"})
+        self.assertEqual(len(query.all()), 3)
+
+    def test_max_nodes(self):
+        class LimitedFilter(BookingFilter):
+            expression_max_nodes = 2
+
+        with self.assertRaises(exceptions.QueryParamaterDataException):
+            LimitedFilter(self.session.query(Booking), raise_exceptions=True).filter({"where": "or(name=a,name=b)"})
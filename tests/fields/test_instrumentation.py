@@ -0,0 +1,135 @@
+import logging
+
+from sqlalchemy import select
+
+from sqlaf import caching, exceptions, fields, filters, instrumentation
+from tests.base import FilterTestCase
+from tests.implementation.db import engine
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    name = fields.CharField(Booking.name, operator="icontains")
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+
+class RecordingTracer(instrumentation.Tracer):
+    def __init__(self):
+        self.timings = []
+        self.failures = []
+
+    def timing(self, filter_name, stage, duration, field=None):
+        self.timings.append((filter_name, stage, field))
+
+    def failure(self, filter_name, field, exception):
+        self.failures.append((filter_name, field, type(exception)))
+
+
+class InstrumentationTestCase(FilterTestCase):
+    filter_name = caching.get_filter_name(BookingFilter)
+
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Jim Halpert", number_of_heads=2)
+        BookingFactory(name="Michael Scott", number_of_heads=7)
+
+    def test_stage_timings(self):
+        query = self.session.query(Booking)
+
+        with instrumentation.trace(RecordingTracer()) as tracer:
+            BookingFilter(query).filter("name=jim&number_of_heads=1")
+
+        self.assertEqual(
+            tracer.timings,
+            [
+                (self.filter_name, instrumentation.PARSE, None),
+                (self.filter_name, instrumentation.TRANSFORM, "name"),
+                (self.filter_name, instrumentation.OPERATOR, "name"),
+                (self.filter_name, instrumentation.TRANSFORM, "number_of_heads"),
+                (self.filter_name, instrumentation.OPERATOR, "number_of_heads"),
+                (self.filter_name, instrumentation.POST_FILTER, None),
+            ],
+        )
+
+    def test_failures(self):
+        query = self.session.query(Booking)
+
+        with instrumentation.trace(RecordingTracer()) as tracer:
+            filtered_query = BookingFilter(query).filter({"name": "jim", "number_of_heads": "many"}).all()
+
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(tracer.failures, [(self.filter_name, "number_of_heads", exceptions.FieldValidationException)])
+
+    def test_failures_with_raise_exceptions(self):
+        query = self.session.query(Booking)
+
+        with instrumentation.trace(RecordingTracer()) as tracer:
+            with self.assertRaises(exceptions.FieldValidationException):
+                BookingFilter(query, raise_exceptions=True).filter({"number_of_heads": "many"})
+
+        self.assertEqual(len(tracer.failures), 1)
+
+    def test_no_tracer(self):
+        query = self.session.query(Booking)
+        tracer = RecordingTracer()
+
+        with instrumentation.trace(tracer):
+            pass
+
+        BookingFilter(query).filter({"name": "jim"})
+        self.assertEqual(tracer.timings, [])
+
+    def test_global_tracer(self):
+        tracer = RecordingTracer()
+        instrumentation.set_tracer(tracer)
+        self.addCleanup(instrumentation.set_tracer, None)
+
+        BookingFilter(self.session.query(Booking)).filter({"name": "jim"})
+        self.assertEqual(len(tracer.timings), 4)
+
+    def test_instrument_engine(self):
+        tracer = RecordingTracer()
+        instrumentation.instrument_engine(engine, tracer)
+        self.addCleanup(instrumentation.uninstrument_engine, engine)
+
+        filtered_query = BookingFilter(self.session.query(Booking)).filter({"name": "jim"}).all()
+        self.session.query(Booking).all()
+
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(
+            tracer.timings,
+            [(self.filter_name, instrumentation.COMPILE, None), (self.filter_name, instrumentation.EXECUTE, None)],
+        )
+
+    def test_instrument_engine_with_execution_options(self):
+        tracer = RecordingTracer()
+        instrumentation.instrument_engine(engine, tracer)
+        self.addCleanup(instrumentation.uninstrument_engine, engine)
+
+        with engine.execution_options(stream_results=True).connect() as connection:
+            connection.execute(BookingFilter(select(Booking)).filter({"name": "jim"})).all()
+
+        self.assertEqual(
+            tracer.timings,
+            [(self.filter_name, instrumentation.COMPILE, None), (self.filter_name, instrumentation.EXECUTE, None)],
+        )
+
+    def test_metrics_tracer(self):
+        tracer = instrumentation.MetricsTracer()
+
+        with instrumentation.trace(tracer):
+            BookingFilter(self.session.query(Booking)).filter({"name": "jim", "number_of_heads": "many"})
+
+        registry = tracer.registry
+        self.assertEqual(registry.timings[f"{self.filter_name}.name.transform"].count, 1)
+        self.assertEqual(registry.timings[f"{self.filter_name}.parse"].count, 1)
+        self.assertEqual(registry.counters[f"{self.filter_name}.number_of_heads.failures.FieldValidationException"], 1)
+
+    def test_logging_tracer(self):
+        with self.assertLogs("sqlaf", level=logging.DEBUG) as logs:
+            with instrumentation.trace(instrumentation.LoggingTracer()):
+                BookingFilter(self.session.query(Booking)).filter({"number_of_heads": "many"})
+
+        self.assertTrue(any("number_of_heads failed with FieldValidationException" in line for line in logs.output))
+        self.assertTrue(any(f"{self.filter_name} parse took" in line for line in logs.output))
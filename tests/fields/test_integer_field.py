@@ -1,3 +1,7 @@
+from unittest import mock
+
+from sqlalchemy.dialects import postgresql
+
 from sqlaf import exceptions, fields, filters
 from tests.base import FilterTestCase
 from tests.implementation.factories import BookingFactory
@@ -275,3 +279,161 @@ class IntegerFieldTestCase(FilterTestCase):
         query = self.session.query(Booking)
         with self.assertRaises(exceptions.FieldValidationException):
             BookingFilter(query, raise_exceptions=True).filter({"number_of_heads": "four"}).all()
+
+    # in operator
+
+    def test_in_filter(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="in")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"number_of_heads": [3, "5"]}).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].number_of_heads, 3)
+        self.assertEqual(filtered_query[1].number_of_heads, 5)
+
+    def test_in_filter_comma_separated_value(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="in")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"number_of_heads": "3,4"}).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].number_of_heads, 3)
+        self.assertEqual(filtered_query[1].number_of_heads, 4)
+
+    def test_in_filter_query_string(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="in")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter("number_of_heads=3&number_of_heads=4,5").all()
+        self.assertEqual(len(filtered_query), 3)
+
+    def test_in_filter_invalid_value(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="in")
+
+        query = self.session.query(Booking)
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"number_of_heads": "3,four"}).all()
+
+    def test_in_filter_shares_statement_between_list_lengths(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="in")
+
+        query = self.session.query(Booking)
+        first = BookingFilter(query).filter({"number_of_heads": "3"}).statement
+        second = BookingFilter(query).filter({"number_of_heads": "3,4,5"}).statement
+        self.assertEqual(first._generate_cache_key(), second._generate_cache_key())
+
+    @mock.patch("sqlaf.operators.IN_ARRAY_THRESHOLD", 2)
+    def test_in_filter_large_list(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="in")
+
+        query = BookingFilter(self.session.query(Booking)).filter({"number_of_heads": "3,4,6"})
+        self.assertIn("= ANY (", str(query.statement.compile(dialect=postgresql.dialect())))
+
+        filtered_query = query.all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].number_of_heads, 3)
+        self.assertEqual(filtered_query[1].number_of_heads, 4)
+
+    # ~in operator
+
+    def test_not_in_filter(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="~in")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"number_of_heads": "3,5"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].number_of_heads, 4)
+
+    @mock.patch("sqlaf.operators.IN_ARRAY_THRESHOLD", 2)
+    def test_not_in_filter_large_list(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="~in")
+
+        query = BookingFilter(self.session.query(Booking)).filter({"number_of_heads": "3,5,6"})
+        self.assertIn("!= ALL (", str(query.statement.compile(dialect=postgresql.dialect())))
+
+        filtered_query = query.all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].number_of_heads, 4)
+
+    # range operator
+
+    def test_range_filter(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range")
+
+        query = BookingFilter(self.session.query(Booking)).filter({"number_of_heads": "4..5"})
+        self.assertIn("BETWEEN", str(query.statement.compile(dialect=postgresql.dialect())))
+
+        filtered_query = query.order_by(Booking.number_of_heads).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].number_of_heads, 4)
+        self.assertEqual(filtered_query[1].number_of_heads, 5)
+
+    def test_range_filter_open_bounds(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range")
+
+        query = self.session.query(Booking)
+        self.assertEqual(len(BookingFilter(query).filter({"number_of_heads": "4.."}).all()), 2)
+        self.assertEqual(len(BookingFilter(query).filter({"number_of_heads": "..3"}).all()), 1)
+
+    def test_range_filter_pair_value(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"number_of_heads": ("3", None)}).all()
+        self.assertEqual(len(filtered_query), 3)
+
+    def test_range_filter_half_open_bounds(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range", bounds="[)")
+
+        query = BookingFilter(self.session.query(Booking)).filter({"number_of_heads": "3..5"})
+        self.assertNotIn("BETWEEN", str(query.statement.compile(dialect=postgresql.dialect())))
+
+        filtered_query = query.order_by(Booking.number_of_heads).all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].number_of_heads, 3)
+        self.assertEqual(filtered_query[1].number_of_heads, 4)
+
+    def test_range_filter_exclusive_bounds(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range", bounds="()")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"number_of_heads": "3..5"}).all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].number_of_heads, 4)
+
+    def test_range_filter_inverted_range(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range")
+
+        query = self.session.query(Booking)
+        with mock.patch.object(self.session, "execute") as execute:
+            for value in ["5..3", "..", "4"]:
+                with self.assertRaises(exceptions.FieldValidationException):
+                    BookingFilter(query, raise_exceptions=True).filter({"number_of_heads": value})
+
+        execute.assert_not_called()
+
+    def test_range_filter_empty_exclusive_range(self):
+        class BookingFilter(filters.Filter):
+            number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="range", bounds="[)")
+
+        query = self.session.query(Booking)
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookingFilter(query, raise_exceptions=True).filter({"number_of_heads": "4..4"})
+
+    def test_range_filter_invalid_bounds(self):
+        with self.assertRaises(exceptions.FieldInstantiationException):
+            fields.IntegerField(Booking.number_of_heads, operator="range", bounds="[[")
@@ -0,0 +1,108 @@
+from datetime import date
+
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import advisor, exceptions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class JSONFieldTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(
+            name="Michael Scott",
+            attributes={"room": {"floor": 2, "view": "parking lot"}, "tags": ["vip", "late"], "arrival": "2022-01-03"},
+        )
+        BookingFactory(
+            name="Jim Halpert",
+            attributes={"room": {"floor": 3, "view": "sea"}, "tags": ["late"], "arrival": "2022-01-10", "paid": True},
+        )
+        BookingFactory(name="Pam Beesly", attributes={"room": {"floor": "3"}, "tags": [], "paid": False})
+
+    def filter(self, field, data):
+        class BookingFilter(filters.Filter):
+            value = field
+
+        query = self.session.query(Booking).order_by(Booking.name)
+
+        return [booking.name for booking in BookingFilter(query, raise_exceptions=True).filter({"value": data})]
+
+    def compile(self, field, data):
+        class BookingFilter(filters.Filter):
+            value = field
+
+        statement = BookingFilter(self.session.query(Booking)).filter({"value": data}).statement
+
+        return statement.whereclause.compile(dialect=postgresql.dialect())
+
+    # eq operator
+
+    def test_eq_filter(self):
+        field = fields.JSONField(Booking.attributes, path="room.view")
+        self.assertEqual(self.filter(field, "sea"), ["Jim Halpert"])
+
+    def test_eq_filter_typed_value(self):
+        field = fields.JSONField(Booking.attributes, path="room.floor", value_field=fields.IntegerField)
+        compiled = self.compile(field, "3")
+        self.assertEqual(str(compiled), "booking.attributes @> %(attributes_1)s")
+        self.assertEqual(compiled.params["attributes_1"], {"room": {"floor": 3}})
+        self.assertEqual(self.filter(field, "3"), ["Jim Halpert"])
+
+    def test_eq_filter_boolean_value(self):
+        field = fields.JSONField(
+            Booking.attributes, path="paid", value_field=fields.BooleanField(Booking.attributes, truthy=["yes"])
+        )
+        self.assertEqual(self.filter(field, "yes"), ["Jim Halpert"])
+
+    def test_eq_filter_invalid_value(self):
+        field = fields.JSONField(Booking.attributes, path="room.floor", value_field=fields.IntegerField)
+
+        with self.assertRaises(exceptions.FieldValidationException):
+            self.filter(field, "third")
+
+    # ~eq operator
+
+    def test_not_eq_filter(self):
+        field = fields.JSONField(Booking.attributes, path="room.view", operator="~eq")
+        self.assertEqual(self.filter(field, "sea"), ["Michael Scott", "Pam Beesly"])
+
+    # contains operator
+
+    def test_contains_filter(self):
+        field = fields.JSONField(Booking.attributes, path="tags", operator="contains")
+        self.assertEqual(self.filter(field, "late"), ["Jim Halpert", "Michael Scott"])
+        self.assertEqual(self.filter(field, "late,vip"), ["Michael Scott"])
+
+    # in operator
+
+    def test_in_filter(self):
+        field = fields.JSONField(Booking.attributes, path="room.view", operator="in")
+        self.assertEqual(self.filter(field, "sea,parking lot"), ["Jim Halpert", "Michael Scott"])
+
+    # range operators
+
+    def test_range_filter(self):
+        field = fields.JSONField(
+            Booking.attributes, path="arrival", operator="gte", value_field=fields.DateField(Booking.attributes)
+        )
+        compiled = self.compile(field, "2022-01-05")
+        self.assertEqual(str(compiled), "CAST((booking.attributes #>> %(attributes_1)s) AS DATE) >= %(param_1)s")
+        self.assertEqual(compiled.params["param_1"], date(2022, 1, 5))
+        self.assertEqual(self.filter(field, "2022-01-05"), ["Jim Halpert"])
+
+    def test_range_filter_integer(self):
+        field = fields.JSONField(Booking.attributes, path="room.floor", operator="gt", value_field=fields.IntegerField)
+        self.assertEqual(self.filter(field, "2"), ["Jim Halpert", "Pam Beesly"])
+
+    def test_advisor(self):
+        class BookingFilter(filters.Filter):
+            view = fields.JSONField(Booking.attributes, path="room.view")
+            floor = fields.JSONField(Booking.attributes, path="room.floor", operator="gt")
+
+        (recommendation,) = advisor.advise(BookingFilter)
+        self.assertEqual(
+            recommendation.to_ddl(),
+            "CREATE INDEX ix_booking_attributes_path ON booking USING gin (attributes jsonb_path_ops);",
+        )
@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+import sqlalchemy as db
+from sqlalchemy import select
+
+from sqlaf import fields, filters, pagination
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    ordering = {"id": Booking.id}
+    default_ordering = "id"
+
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+
+class PageWithTotalTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+
+        for number_of_heads in range(1, 6):
+            BookingFactory(id=number_of_heads, number_of_heads=number_of_heads)
+
+    def test_page_with_total(self):
+        page, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking)).page_with_total(self.session, {"number_of_heads": 2}, size=2)
+        )
+        self.assertEqual([booking.id for booking in page.items], [2, 3])
+        self.assertEqual(page.total, 4)
+        self.assertFalse(page.is_estimate)
+        self.assertEqual(len(statements), 1)
+        self.assertIn("count(*) OVER ()", statements[0])
+
+    def test_offset(self):
+        page = BookingFilter(select(Booking)).page_with_total(self.session, {}, size=2, offset=4)
+        self.assertEqual([booking.id for booking in page.items], [5])
+        self.assertEqual(page.total, 5)
+
+    def test_offset_past_last_row(self):
+        page = BookingFilter(select(Booking)).page_with_total(self.session, {}, size=2, offset=10)
+        self.assertEqual(page.items, [])
+        self.assertEqual(page.total, 5)
+
+    def test_no_rows(self):
+        page = BookingFilter(select(Booking)).page_with_total(self.session, {"number_of_heads": 10})
+        self.assertEqual(page, pagination.CountedPage([], 0))
+
+    def test_columns(self):
+        page = BookingFilter(select(Booking.id, Booking.number_of_heads)).page_with_total(self.session, {}, size=1)
+        self.assertEqual(page.items, [(1, 1)])
+        self.assertEqual(page.items[0].number_of_heads, 1)
+        self.assertEqual(page.total, 5)
+
+    def test_query(self):
+        page = BookingFilter(self.session.query(Booking)).page_with_total(self.session, {"number_of_heads": 4})
+        self.assertEqual([booking.id for booking in page.items], [4, 5])
+        self.assertEqual(page.total, 2)
+
+    def test_estimate(self):
+        page, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking)).page_with_total(self.session, {}, size=2, estimate_threshold=1)
+        )
+        self.assertEqual([booking.id for booking in page.items], [1, 2])
+        self.assertTrue(page.is_estimate)
+        self.assertGreaterEqual(page.total, 1)
+        self.assertTrue(statements[0].startswith("EXPLAIN (FORMAT JSON) SELECT"))
+        self.assertNotIn("OVER", statements[1])
+
+    def test_estimate_below_threshold(self):
+        page = BookingFilter(select(Booking)).page_with_total(self.session, {}, size=2, estimate_threshold=10**9)
+        self.assertEqual(page.total, 5)
+        self.assertFalse(page.is_estimate)
+
+    def test_async(self):
+        self.session.commit()
+
+        page = self.run_async(lambda session: BookingFilter(select(Booking)).page_with_total(session, {}, size=2))
+        self.assertEqual([booking.id for booking in page.items], [1, 2])
+        self.assertEqual(page.total, 5)
+
+
+metadata = db.MetaData()
+team = db.Table(
+    "team", metadata, db.Column("id", db.Integer, primary_key=True), db.Column("size", db.Integer, index=True)
+)
+
+
+class TeamFilter(filters.Filter):
+    size = fields.IntegerField(team.c.size)
+
+
+class SQLiteEstimateTestCase(TestCase):
+    def setUp(self):
+        self.engine = db.create_engine("sqlite://")
+        metadata.create_all(self.engine)
+
+        with self.engine.begin() as connection:
+            connection.execute(team.insert(), [{"id": i, "size": i % 10} for i in range(1, 1001)])
+            connection.exec_driver_sql("ANALYZE")
+
+    def test_estimate_scan(self):
+        with self.engine.connect() as connection:
+            self.assertEqual(pagination.estimate_count(connection, select(team)), 1000)
+
+    def test_estimate_search(self):
+        with self.engine.connect() as connection:
+            self.assertEqual(pagination.estimate_count(connection, select(team).where(team.c.size == 3)), 100)
+
+    def test_page_with_total_estimate(self):
+        with self.engine.connect() as connection:
+            page = TeamFilter(select(team.c.id)).page_with_total(connection, {"size": 3}, size=2, estimate_threshold=50)
+
+        self.assertEqual(page, pagination.CountedPage([3, 13], 100, is_estimate=True))
+
+    def test_estimate_without_statistics(self):
+        engine = db.create_engine("sqlite://")
+        metadata.create_all(engine)
+
+        with engine.connect() as connection:
+            self.assertIsNone(pagination.estimate_count(connection, select(team)))
@@ -0,0 +1,138 @@
+import warnings
+from datetime import datetime
+
+from sqlalchemy import select
+
+from sqlaf import exceptions, fields, filters, pagination
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    ordering = {"created": Booking.created_at, "id": Booking.id}
+    default_ordering = "created"
+    page_size = 2
+
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+
+class PaginationTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.bookings = [
+            BookingFactory(id=1, created_at=datetime(2020, 1, 3), number_of_heads=1),
+            BookingFactory(id=2, created_at=datetime(2020, 1, 1), number_of_heads=2),
+            BookingFactory(id=3, created_at=datetime(2020, 1, 2), number_of_heads=3),
+            BookingFactory(id=4, created_at=datetime(2020, 1, 1), number_of_heads=4),
+            BookingFactory(id=5, created_at=datetime(2020, 1, 2), number_of_heads=5),
+        ]
+
+    def paginate(self, data, **kwargs):
+        ids, cursor = [], None
+
+        while True:
+            page = BookingFilter(select(Booking), **kwargs).paginate(self.session, {**data, "cursor": cursor})
+            ids.append([booking.id for booking in page.items])
+            cursor = page.next_cursor
+
+            if not page.has_next:
+                return ids
+
+    def test_paginate(self):
+        self.assertEqual(self.paginate({}), [[2, 4], [3, 5], [1]])
+
+    def test_paginate_descending(self):
+        self.assertEqual(self.paginate({"ordering": "-created"}), [[1, 5], [3, 4], [2]])
+
+    def test_paginate_mixed_directions(self):
+        statement = select(Booking)
+        first = BookingFilter(statement).paginate(self.session, {"ordering": "created,-id"})
+        self.assertEqual([booking.id for booking in first.items], [4, 2])
+        second = BookingFilter(statement).paginate(
+            self.session, {"ordering": "created,-id", "cursor": first.next_cursor}
+        )
+        self.assertEqual([booking.id for booking in second.items], [5, 3])
+
+    def test_paginate_with_filters(self):
+        self.assertEqual(self.paginate({"number_of_heads": 3}), [[4, 3], [5]])
+
+    def test_paginate_query_string(self):
+        page = BookingFilter(select(Booking)).paginate(self.session, "ordering=-id&number_of_heads=2")
+        self.assertEqual([booking.id for booking in page.items], [5, 4])
+
+        page = BookingFilter(select(Booking)).paginate(self.session, f"ordering=-id&cursor={page.next_cursor}")
+        self.assertEqual([booking.id for booking in page.items], [3, 2])
+
+    def test_paginate_keyset_statement(self):
+        page = BookingFilter(select(Booking)).paginate(self.session, {})
+        statement = BookingFilter(select(Booking)).filter({})
+        self.assertIn("ORDER BY booking.created_at ASC NULLS LAST, booking.id ASC", str(statement))
+
+        _, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking)).paginate(self.session, {"cursor": page.next_cursor})
+        )
+
+        sql = "\n".join(statements)
+        self.assertIn("booking.created_at > %(param_1)s OR booking.created_at IS NULL", sql)
+        self.assertNotIn("OFFSET", sql)
+
+    def test_paginate_nullable(self):
+        BookingFactory(id=6, created_at=None, number_of_heads=6)
+        BookingFactory(id=7, created_at=None, number_of_heads=7)
+        BookingFactory(id=8, created_at=None, number_of_heads=8)
+
+        self.assertEqual(self.paginate({}), [[2, 4], [3, 5], [1, 6], [7, 8]])
+        self.assertEqual(self.paginate({"ordering": "-created"}), [[8, 7], [6, 1], [5, 3], [4, 2]])
+        self.assertEqual(self.paginate({"ordering": "created,-id"}), [[4, 2], [5, 3], [1, 8], [7, 6]])
+        self.assertEqual(self.paginate({"ordering": "-created,id"}), [[6, 7], [8, 1], [3, 5], [2, 4]])
+
+    def test_tampered_cursor(self):
+        for values in [["2020-01-01", 4], [None, None]]:
+            cursor = pagination.encode_cursor("created", values)
+
+            with self.subTest(values=values), self.assertRaises(exceptions.QueryParamaterDataException):
+                BookingFilter(select(Booking)).paginate(self.session, {"cursor": cursor})
+
+    def test_paginate_size(self):
+        page = BookingFilter(select(Booking)).paginate(self.session, {}, size=4)
+        self.assertEqual(len(page.items), 4)
+        self.assertTrue(page.has_next)
+
+    def test_invalid_ordering(self):
+        with self.assertRaises(exceptions.QueryParamaterDataException):
+            BookingFilter(select(Booking), raise_exceptions=True).paginate(self.session, {"ordering": "name"})
+
+        page = BookingFilter(select(Booking)).paginate(self.session, {"ordering": "name"})
+        self.assertEqual([booking.id for booking in page.items], [2, 4])
+
+    def test_cursor_of_other_ordering(self):
+        page = BookingFilter(select(Booking)).paginate(self.session, {})
+
+        with self.assertRaises(exceptions.QueryParamaterDataException):
+            BookingFilter(select(Booking)).paginate(self.session, {"ordering": "-created", "cursor": page.next_cursor})
+
+    def test_empty_page(self):
+        page = BookingFilter(select(Booking)).paginate(self.session, {"number_of_heads": 10})
+        self.assertEqual(page.items, [])
+        self.assertIsNone(page.next_cursor)
+
+    def test_unindexed_ordering(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+
+            class NameFilter(filters.Filter):
+                ordering = {"name": Booking.name, "created": Booking.created_at}
+
+        self.assertEqual(
+            [str(warning.message) for warning in caught],
+            ["The `name` ordering of NameFilter is not the leading column of an index."],
+        )
+        self.assertEqual([column.name for column in NameFilter.tiebreaker], ["id"])
+
+    def test_paginate_without_ordering(self):
+        class NameFilter(filters.Filter):
+            name = fields.CharField(Booking.name)
+
+        with self.assertRaises(exceptions.FieldInstantiationException):
+            NameFilter(select(Booking)).paginate(self.session, {})
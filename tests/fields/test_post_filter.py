@@ -28,3 +28,38 @@ class PostProcessTestCase(FilterTestCase):
         self.assertEqual(len(filtered_query), 1)
         self.assertEqual(filtered_query[0].name, "Jim Halpert")
         self.assertEqual(filtered_query[0].has_paid, True)
+
+    def test_post_process_query_string(self):
+        class BookingFilter(filters.Filter):
+            has_paid = fields.BooleanField(Booking.has_paid, truthy=["true"], falsy=["false"])
+
+            def post_filter(self, data: Dict, filters: List):
+                if "name" in data:
+                    filters.append(Booking.name == data.get("name"))
+
+                return filters
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter("name=Jim Halpert&has_paid=true").all()
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].name, "Jim Halpert")
+
+    def test_post_process_query_string_keys(self):
+        class BookingFilter(filters.Filter):
+            has_paid = fields.BooleanField(Booking.has_paid, truthy=["true"], falsy=["false"])
+            post_filter_keys = ["name"]
+
+            def post_filter(self, data: Dict, filters: List):
+                self.data = data
+
+                if "name" in data:
+                    filters.append(Booking.name == data.get("name"))
+
+                return filters
+
+        query = self.session.query(Booking)
+        booking_filter = BookingFilter(query)
+        filtered_query = booking_filter.filter("name=Jim Halpert&has_paid=false&other=1").all()
+        self.assertEqual(booking_filter.data, {"name": "Jim Halpert", "has_paid": "false"})
+        self.assertEqual(len(filtered_query), 1)
+        self.assertEqual(filtered_query[0].has_paid, False)
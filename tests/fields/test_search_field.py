@@ -0,0 +1,156 @@
+import sqlite3
+from unittest import TestCase, skipUnless
+
+import sqlalchemy as db
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql
+
+from sqlaf import advisor, exceptions, expressions, fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+def has_fts5() -> bool:
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE fts USING fts5(text)")
+    except sqlite3.OperationalError:
+        return False
+
+    return True
+
+
+metadata = db.MetaData()
+book = db.Table("book", metadata, db.Column("id", db.Integer, primary_key=True), db.Column("title", db.String))
+book_fts = db.Table("book_fts", metadata, db.Column("title", db.String))
+
+
+class BookFilter(filters.Filter):
+    search = fields.SearchField(book.c.id, fts_table=book_fts)
+
+
+class BookFTSFilter(filters.Filter):
+    search = fields.SearchField(book_fts.c.title)
+
+
+class FTS5QueryTestCase(TestCase):
+    def test_to_fts5_query(self):
+        self.assertEqual(
+            expressions.to_fts5_query('"dunder mifflin" paper or sales -scranton'),
+            '"dunder mifflin" AND ("paper" OR "sales") NOT "scranton"',
+        )
+        self.assertEqual(expressions.to_fts5_query('title:x* "say ""hi"'), '"title:x*" AND "say " AND "hi"')
+        self.assertEqual(expressions.to_fts5_query("or paper or"), '"paper"')
+
+    def test_excluded_only(self):
+        with self.assertRaises(exceptions.OperatorArgumentError):
+            expressions.to_fts5_query("-scranton")
+
+    def test_unsupported_dialect(self):
+        statement = BookFTSFilter(db.select(book_fts.c.title)).filter({"search": "paper"})
+
+        with self.assertRaises(db.exc.CompileError):
+            statement.compile(dialect=mysql.dialect())
+
+    def test_advisor(self):
+        class BookingFilter(filters.Filter):
+            search = fields.SearchField(Booking.name)
+
+        self.assertEqual([r.name for r in advisor.advise(BookingFilter, BookFilter)], ["ix_booking_name_gin"])
+
+
+@skipUnless(has_fts5(), "SQLite was built without FTS5")
+class SQLiteSearchFieldTestCase(TestCase):
+    def setUp(self):
+        self.engine = db.create_engine("sqlite://")
+        metadata.create_all(self.engine, tables=[book])
+
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql("CREATE VIRTUAL TABLE book_fts USING fts5(title)")
+            connection.execute(
+                book.insert(),
+                [
+                    {"id": 1, "title": "Dunder Mifflin paper"},
+                    {"id": 2, "title": "Scranton paper sales"},
+                    {"id": 3, "title": "Sabre printers and paper"},
+                ],
+            )
+            connection.exec_driver_sql("INSERT INTO book_fts (rowid, title) SELECT id, title FROM book")
+
+    def search(self, filter_class, statement, data):
+        with self.engine.connect() as connection:
+            return connection.execute(filter_class(statement).filter(data)).all()
+
+    def test_fts_table(self):
+        rows = self.search(BookFilter, db.select(book.c.id).order_by(book.c.id), {"search": "paper -scranton"})
+        self.assertEqual(rows, [(1,), (3,)])
+
+    def test_phrase_and_or(self):
+        statement = db.select(book.c.id).order_by(book.c.id)
+        self.assertEqual(self.search(BookFilter, statement, {"search": '"paper sales" or dunder'}), [(1,), (2,)])
+
+    def test_fts_column(self):
+        statement = db.select(book_fts.c.title)
+        self.assertEqual(self.search(BookFTSFilter, statement, {"search": "sabre"}), [("Sabre printers and paper",)])
+
+    def test_rank(self):
+        rank = BookFilter.search.rank("printers or sales")
+        statement = db.select(book.c.id).order_by(rank.desc(), book.c.id)
+        self.assertEqual(self.search(BookFilter, statement, {"search": "printers or sales"}), [(2,), (3,)])
+
+    def test_same_statement_shape(self):
+        statement = db.select(book.c.id).order_by(book.c.id)
+        self.assertEqual(self.search(BookFilter, statement, {"search": "dunder"}), [(1,)])
+        self.assertEqual(self.search(BookFilter, statement, {"search": "sabre"}), [(3,)])
+
+    def test_excluded_only(self):
+        statement = db.select(book.c.id).order_by(book.c.id)
+
+        # FTS5 can not match only excluded terms, so the search matches no rows rather than failing when it is bound.
+        for search in ["-paper", "or"]:
+            with self.subTest(search=search):
+                self.assertEqual(self.search(BookFilter, statement, {"search": search}), [])
+                self.assertEqual(self.search(BookFTSFilter, db.select(book_fts.c.title), {"search": search}), [])
+
+        self.assertEqual(self.search(BookFilter, statement, {"search": "printers"}), [(3,)])
+
+    def test_invalid_search(self):
+        with self.assertRaises(exceptions.FieldValidationException):
+            BookFilter(db.select(book.c.id), raise_exceptions=True).filter({"search": " "})
+
+
+class PostgresSearchFieldTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Dunder Mifflin paper")
+        BookingFactory(name="Scranton papers and sales")
+        BookingFactory(name="Sabre printers")
+
+    def test_search(self):
+        class BookingFilter(filters.Filter):
+            search = fields.SearchField(func.to_tsvector("english", Booking.name))
+
+        query = self.session.query(Booking.name).order_by(Booking.name)
+        filtered_query = BookingFilter(query).filter({"search": "paper -scranton"}).all()
+        self.assertEqual(filtered_query, [("Dunder Mifflin paper",)])
+
+        filtered_query = BookingFilter(query).filter({"search": '"sabre printer" or sales'}).all()
+        self.assertEqual(filtered_query, [("Sabre printers",), ("Scranton papers and sales",)])
+
+    def test_excluded_only(self):
+        class BookingFilter(filters.Filter):
+            search = fields.SearchField(func.to_tsvector("english", Booking.name))
+
+        query = self.session.query(Booking.name).order_by(Booking.name)
+        filtered_query = BookingFilter(query, raise_exceptions=True).filter({"search": "-scranton"}).all()
+        self.assertEqual(filtered_query, [("Dunder Mifflin paper",), ("Sabre printers",)])
+
+    def test_rank(self):
+        class BookingFilter(filters.Filter):
+            search = fields.SearchField(func.to_tsvector("simple", Booking.name), config="simple")
+
+        rank = BookingFilter.search.rank("paper or papers")
+        query = self.session.query(Booking.name, rank).order_by(rank.desc())
+        filtered_query = BookingFilter(query).filter({"search": "papers"}).all()
+        self.assertEqual([name for name, _ in filtered_query], ["Scranton papers and sales"])
+        self.assertGreater(filtered_query[0][1], 0)
@@ -0,0 +1,76 @@
+import asyncio
+from unittest import mock
+
+from sqlalchemy import select
+
+from sqlaf import fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    min_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+    max_heads = fields.IntegerField(Booking.number_of_heads, operator="lte")
+    name = fields.CharField(Booking.name)
+    not_name = fields.CharField(Booking.name, operator="~eq")
+
+
+class SimplifyTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Jim Halpert", number_of_heads=2)
+        BookingFactory(name="Michael Scott", number_of_heads=7)
+        BookingFactory(name="Pam Beesly", number_of_heads=4)
+
+    def test_merges_filters(self):
+        query = BookingFilter(self.session.query(Booking), simplify=True).filter({"min_heads": 3, "max_heads": 5})
+        self.assertIn("BETWEEN", str(query.statement))
+        self.assertEqual([booking.name for booking in query.all()], ["Pam Beesly"])
+
+    def test_bind_parameters(self):
+        filter_ = BookingFilter(select(Booking), simplify=True, bind_parameters=True)
+        statements = [filter_.filter({"min_heads": heads, "max_heads": heads + 2}) for heads in (3, 5)]
+        first, second = [str(statement.compile(self.session.bind)) for statement in statements]
+        self.assertEqual(first, second)
+        self.assertIn("BETWEEN %(sqlaf_min_heads_0)s AND %(sqlaf_max_heads_0)s", first)
+        self.assertEqual([booking.name for booking in self.session.execute(statements[0]).scalars()], ["Pam Beesly"])
+
+    def test_empty_filters(self):
+        filter_ = BookingFilter(self.session.query(Booking), simplify=True)
+        query = filter_.filter({"name": "Jim Halpert", "not_name": "Jim Halpert"})
+        self.assertTrue(filter_.is_empty)
+        self.assertIn("false", str(query.statement))
+        self.assertEqual(query.all(), [])
+
+        filter_.filter({"name": "Jim Halpert"})
+        self.assertFalse(filter_.is_empty)
+
+    def test_empty_filters_not_executed(self):
+        session = mock.Mock()
+        data = {"min_heads": 10, "max_heads": 5}
+
+        self.assertEqual(BookingFilter(select(Booking), simplify=True).all(session, data), [])
+        self.assertIsNone(BookingFilter(select(Booking), simplify=True).first(session, data))
+        session.execute.assert_not_called()
+
+    def test_empty_filters_not_executed_async(self):
+        session = mock.Mock(execute=mock.AsyncMock())
+        result = BookingFilter(select(Booking), simplify=True).all(session, {"min_heads": 10, "max_heads": 5})
+        self.assertEqual(asyncio.run(result), [])
+        session.execute.assert_not_called()
+
+    def test_post_filter(self):
+        class DefaultFilter(BookingFilter):
+            def post_filter(self, data, filters):
+                filters.append(Booking.number_of_heads >= 3)
+
+        query = DefaultFilter(self.session.query(Booking), simplify=True).filter({"min_heads": 5})
+        self.assertEqual(str(query.statement.whereclause), "booking.number_of_heads >= :number_of_heads_1")
+        self.assertEqual([booking.name for booking in query.all()], ["Michael Scott"])
+
+    def test_not_simplified_by_default(self):
+        filter_ = BookingFilter(self.session.query(Booking))
+        query = filter_.filter({"min_heads": 10, "max_heads": 5})
+        self.assertFalse(filter_.is_empty)
+        self.assertNotIn("BETWEEN", str(query.statement))
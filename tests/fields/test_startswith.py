@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+import sqlalchemy as db
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from sqlaf import expressions, fields, filters
+
+guest = db.Table(
+    "guest",
+    db.MetaData(),
+    db.Column("name", db.String),
+    db.Column("code", db.String(collation="C")),
+)
+
+
+class GuestFilter(filters.Filter):
+    name = fields.CharField(guest.c.name, operator="startswith")
+    code = fields.CharField(guest.c.code, operator="startswith")
+    lower_name = fields.CharField(guest.c.name, operator="istartswith")
+
+
+def compile_where(statement, dialect):
+    return str(statement.whereclause.compile(dialect=dialect))
+
+
+class StartsWithTestCase(TestCase):
+    def test_next_prefix(self):
+        self.assertEqual(expressions.next_prefix("abc"), "abd")
+        self.assertEqual(expressions.next_prefix("a\U0010ffff"), "b")
+        self.assertEqual(expressions.next_prefix("a퟿"), "a")
+        self.assertIsNone(expressions.next_prefix("\U0010ffff"))
+        self.assertIsNone(expressions.next_prefix(""))
+
+    def test_sqlite_range(self):
+        statement = GuestFilter(db.select(guest.c.name)).filter({"name": "Jim_"})
+        compiled = statement.whereclause.compile(dialect=sqlite.dialect())
+        self.assertEqual(str(compiled), "guest.name >= ? AND guest.name < ?")
+        self.assertEqual(compiled.params, {"param_1": "Jim_", "param_2": "Jim`"})
+
+    def test_postgresql(self):
+        statement = GuestFilter(db.select(guest.c.name)).filter({"name": "Jim_", "code": "A"})
+        self.assertEqual(
+            compile_where(statement, postgresql.dialect()),
+            "guest.code >= %(param_1)s AND guest.code < %(param_2)s AND guest.name LIKE %(param_3)s || '%%' ESCAPE '/'",
+        )
+        self.assertEqual(statement.whereclause.compile(dialect=postgresql.dialect()).params["param_3"], "Jim/_")
+
+    def test_other_dialects(self):
+        statement = GuestFilter(db.select(guest.c.name)).filter({"name": "Jim"})
+        self.assertEqual(compile_where(statement, mysql.dialect()), "guest.name LIKE concat(%s, '%%') ESCAPE '/'")
+
+    def test_unbounded(self):
+        statement = GuestFilter(db.select(guest.c.name)).filter({"name": ""})
+        self.assertEqual(compile_where(statement, sqlite.dialect()), "guest.name >= ?")
+
+    def test_istartswith(self):
+        statement = GuestFilter(db.select(guest.c.name)).filter({"lower_name": "Jim"})
+        self.assertEqual(
+            compile_where(statement, postgresql.dialect()), "lower(guest.name) LIKE %(param_1)s || '%%' ESCAPE '/'"
+        )
+        self.assertEqual(compile_where(statement, sqlite.dialect()), "guest.name LIKE ? || '%' ESCAPE '/'")
+
+    def test_sqlite_execution(self):
+        engine = db.create_engine("sqlite://")
+        table = db.Table("guest", db.MetaData(), db.Column("name", db.String))
+        table.create(engine)
+
+        class NameFilter(filters.Filter):
+            name = fields.CharField(table.c.name, operator="startswith")
+            lower_name = fields.CharField(table.c.name, operator="istartswith")
+
+        with engine.begin() as connection:
+            connection.execute(table.insert(), [{"name": "Jim_Halpert"}, {"name": "JimXHalpert"}, {"name": "jim"}])
+            statement = db.select(table.c.name).order_by(table.c.name)
+
+            self.assertEqual(
+                connection.execute(NameFilter(statement).filter({"name": "Jim"})).scalars().all(),
+                ["JimXHalpert", "Jim_Halpert"],
+            )
+            self.assertEqual(
+                connection.execute(NameFilter(statement).filter({"name": "Jim_"})).scalars().all(), ["Jim_Halpert"]
+            )
+            self.assertEqual(
+                connection.execute(NameFilter(statement).filter({"lower_name": "JIM_"})).scalars().all(),
+                ["Jim_Halpert"],
+            )
@@ -0,0 +1,88 @@
+from sqlalchemy import delete, select, update
+
+from sqlaf import fields, filters
+from tests.base import FilterTestCase
+from tests.implementation.factories import BookingFactory
+from tests.implementation.models import Booking
+
+
+class BookingFilter(filters.Filter):
+    name = fields.CharField(Booking.name, operator="icontains")
+    number_of_heads = fields.IntegerField(Booking.number_of_heads, operator="gte")
+
+
+class StatementTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Jim Halpert", number_of_heads=2)
+        BookingFactory(name="Michael Scott", number_of_heads=7)
+        BookingFactory(name="Pam Beesly", number_of_heads=4)
+
+    def test_select(self):
+        statement = BookingFilter(select(Booking)).filter({"name": "m", "number_of_heads": 4})
+        filtered_query = self.session.execute(statement.order_by(Booking.id)).scalars().all()
+        self.assertEqual(len(filtered_query), 2)
+        self.assertEqual(filtered_query[0].name, "Michael Scott")
+        self.assertEqual(filtered_query[1].name, "Pam Beesly")
+
+    def test_select_columns(self):
+        statement = BookingFilter(select(Booking.name, Booking.number_of_heads)).filter("number_of_heads=7")
+        filtered_query = self.session.execute(statement).all()
+        self.assertEqual(filtered_query, [("Michael Scott", 7)])
+
+    def test_update(self):
+        statement = BookingFilter(update(Booking).values(has_paid=True)).filter({"number_of_heads": 4})
+        self.session.execute(statement.execution_options(synchronize_session=False))
+        self.session.expire_all()
+        paid = self.session.query(Booking).filter(Booking.has_paid.is_(True)).order_by(Booking.id).all()
+        self.assertEqual([b.name for b in paid], ["Michael Scott", "Pam Beesly"])
+
+    def test_delete(self):
+        statement = BookingFilter(delete(Booking)).filter({"name": "jim"})
+        self.session.execute(statement.execution_options(synchronize_session=False))
+        self.assertEqual(self.session.query(Booking).count(), 2)
+
+    def test_all(self):
+        filtered_query = BookingFilter(select(Booking)).all(self.session, {"number_of_heads": 4})
+        self.assertEqual(len(filtered_query), 2)
+        self.assertIsInstance(filtered_query[0], Booking)
+
+    def test_all_query(self):
+        filtered_query = BookingFilter(self.session.query(Booking)).all(self.session, {"number_of_heads": 4})
+        self.assertEqual(len(filtered_query), 2)
+        self.assertIsInstance(filtered_query[0], Booking)
+
+    def test_first(self):
+        booking, statements = self.capture_statements(
+            lambda: BookingFilter(select(Booking)).first(self.session, {"name": "pam"})
+        )
+        self.assertEqual(booking.name, "Pam Beesly")
+        self.assertIn("LIMIT", statements[0])
+
+    def test_one_or_none(self):
+        self.assertIsNone(BookingFilter(select(Booking)).one_or_none(self.session, {"name": "dwight"}))
+
+
+class AsyncStatementTestCase(FilterTestCase):
+    def setUp(self):
+        super().setUp()
+        BookingFactory(name="Jim Halpert", number_of_heads=2)
+        BookingFactory(name="Michael Scott", number_of_heads=7)
+        BookingFactory(name="Pam Beesly", number_of_heads=4)
+        self.session.commit()
+
+    def test_all(self):
+        filtered_query = self.run_async(
+            lambda session: BookingFilter(select(Booking).order_by(Booking.id)).all(session, "?number_of_heads=4")
+        )
+        self.assertEqual([b.name for b in filtered_query], ["Michael Scott", "Pam Beesly"])
+
+    def test_first(self):
+        booking = self.run_async(lambda session: BookingFilter(select(Booking)).first(session, {"name": "jim"}))
+        self.assertEqual(booking.name, "Jim Halpert")
+
+    def test_one_or_none(self):
+        booking = self.run_async(
+            lambda session: BookingFilter(select(Booking.name)).one_or_none(session, {"name": "dwight"})
+        )
+        self.assertIsNone(booking)
@@ -1,4 +1,5 @@
-from datetime import time, timezone
+from datetime import datetime, time, timezone
+from unittest import mock
 
 from sqlaf import fields, filters
 from tests.base import FilterTestCase
@@ -91,3 +92,14 @@ class TimeFieldTestCase(FilterTestCase):
         self.assertEqual(filtered_query[0].time, time(13, 0, tzinfo=timezone.utc))
         self.assertEqual(filtered_query[1].time, time(15, 0, tzinfo=timezone.utc))
         self.assertEqual(filtered_query[2].time, time(10, 0, tzinfo=timezone.utc))
+
+    # relative times
+
+    @mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 1, 2, 16, 0, tzinfo=timezone.utc))
+    def test_relative_time_naive_format(self):
+        class BookingFilter(filters.Filter):
+            time = fields.TimeField(Booking.time, format="%H:%M:%S", operator="range")
+
+        query = self.session.query(Booking)
+        filtered_query = BookingFilter(query).filter({"time": "12:00:00..now"}).all()
+        self.assertEqual(len(filtered_query), 2)
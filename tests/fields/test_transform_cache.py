@@ -0,0 +1,74 @@
+import enum
+from unittest import TestCase
+
+from sqlaf import exceptions, fields
+from tests.implementation.models import Booking
+
+
+class NumberOfHeads(enum.IntEnum):
+
+    three = 3
+    four = 4
+
+
+class TransformCacheTestCase(TestCase):
+    def test_cache_disabled(self):
+        field = fields.IntegerField(Booking.number_of_heads)
+        field.filter("2")
+        self.assertIsNone(field.cache)
+        self.assertIsNone(field.cache_info())
+
+    def test_cache_hits_and_misses(self):
+        field = fields.IntegerField(Booking.number_of_heads, cache_size=10)
+        field.filter("2")
+        field.filter("2")
+        field.filter("3")
+        info = field.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.maxsize, info.currsize), (1, 2, 0, 10, 2))
+
+    def test_cache_evicts_least_recently_used(self):
+        field = fields.IntegerField(Booking.number_of_heads, cache_size=2)
+        field.filter("1")
+        field.filter("2")
+        field.filter("1")
+        field.filter("3")
+        field.filter("1")
+        info = field.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.currsize), (2, 3, 1, 2))
+
+        field.filter("2")
+        self.assertEqual(field.cache_info().misses, 4)
+
+    def test_cache_validation_exception(self):
+        field = fields.IntegerField(Booking.number_of_heads, cache_size=10)
+
+        for _ in range(2):
+            with self.assertRaisesRegex(exceptions.FieldValidationException, "four is not of type integer."):
+                field.filter("four")
+
+        self.assertEqual(field.cache_info().hits, 1)
+
+    def test_cache_keys_by_type(self):
+        field = fields.BooleanField(Booking.has_paid, truthy=[1], falsy=[0, "1"], cache_size=10)
+        self.assertEqual(field._transform(1), True)
+        self.assertEqual(field._transform("1"), False)
+        self.assertEqual(field.cache_info().misses, 2)
+
+    def test_cache_multi_value_operator(self):
+        field = fields.IntegerField(Booking.number_of_heads, operator="in", cache_size=10)
+        field.filter("1,2")
+        field.filter("2,3")
+        info = field.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+
+    def test_cache_unhashable_value(self):
+        field = fields.ArrayField(Booking.guest_names, cache_size=10)
+        field.filter(["jim"])
+        self.assertEqual(field.cache_info().currsize, 0)
+
+    def test_cache_clear(self):
+        field = fields.EnumField(Booking.number_of_heads, enum_class=NumberOfHeads, cache_size=10)
+        self.assertEqual(field._transform("3"), 3)
+        field.cache.clear()
+        info = field.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
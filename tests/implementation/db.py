@@ -2,6 +2,7 @@ import abc
 import os
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 
@@ -18,6 +19,10 @@ class IDBConfig(abc.ABC):
     def create_engine(cls):
         return create_engine(cls.get_db_url(), connect_args=cls.get_connect_args())
 
+    @classmethod
+    def create_async_engine(cls):
+        return create_async_engine(cls.get_async_db_url(), connect_args=cls.get_async_connect_args())
+
 
 class PostgresDBConfig(IDBConfig):
     @classmethod
@@ -28,6 +33,14 @@ class PostgresDBConfig(IDBConfig):
     def get_connect_args(cls):
         return {"options": "-c timezone=utc"}
 
+    @classmethod
+    def get_async_db_url(cls):
+        return cls.get_db_url().replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    @classmethod
+    def get_async_connect_args(cls):
+        return {"server_settings": {"timezone": "utc"}}
+
 
 engine = PostgresDBConfig.create_engine()
 session_factory = sessionmaker(bind=engine)
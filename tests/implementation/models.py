@@ -9,7 +9,8 @@ class Booking(Base):
 
     __tablename__ = "booking"
 
-    created_at = db.Column(db.DateTime)
+    attributes = db.Column(postgresql.JSONB)
+    created_at = db.Column(db.DateTime, index=True)
     date = db.Column(db.Date)
     deposit = db.Column(db.Float)
     guest_names = db.Column(postgresql.ARRAY(db.String))
@@ -17,4 +18,5 @@ class Booking(Base):
     name = db.Column(db.String)
     number_of_heads = db.Column(db.Integer)
     has_paid = db.Column(db.Boolean)
+    room_numbers = db.Column(postgresql.ARRAY(db.Integer))
     time = db.Column(db.Time)
@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from sqlaf.exceptions import QueryParamaterDataException
+from sqlaf.grammar import AND, NOT, OR, Condition, Group, parse_expression
+
+
+class ParseExpressionTestCase(TestCase):
+    def test_parse_compact(self):
+        self.assertEqual(
+            parse_expression("or(name.icontains=a,size.gte=3)"),
+            Group(OR, [Condition("name", "icontains", "a"), Condition("size", "gte", "3")]),
+        )
+
+    def test_parse_compact_nested(self):
+        self.assertEqual(
+            parse_expression("and(or(name=a, name=b), not(size.~eq=3))"),
+            Group(
+                AND,
+                [
+                    Group(OR, [Condition("name", None, "a"), Condition("name", None, "b")]),
+                    Group(NOT, [Condition("size", "~eq", "3")]),
+                ],
+            ),
+        )
+
+    def test_parse_compact_top_level_list(self):
+        self.assertEqual(
+            parse_expression("name=a,size=3"), Group(AND, [Condition("name", None, "a"), Condition("size", None, "3")])
+        )
+
+    def test_parse_compact_quoted_value(self):
+        self.assertEqual(
+            parse_expression('or(name="Scott, Michael (\\"Mike\\")",name=)'),
+            Group(OR, [Condition("name", None, 'Scott, Michael ("Mike")'), Condition("name", None, "")]),
+        )
+
+    def test_parse_compact_whitespace(self):
+        self.assertEqual(
+            parse_expression("or( name = a , n=2 )"),
+            Group(OR, [Condition("name", None, "a"), Condition("n", None, "2")]),
+        )
+        self.assertEqual(
+            parse_expression('and (name=a ,name= " b ")'),
+            Group(AND, [Condition("name", None, "a"), Condition("name", None, " b ")]),
+        )
+
+    def test_parse_compact_invalid(self):
+        for value in ["or(name=a", "name", "or()", "not(name=a,name=b)", "name=a)", 'name="a']:
+            with self.subTest(value=value), self.assertRaises(QueryParamaterDataException):
+                parse_expression(value)
+
+    def test_parse_json(self):
+        self.assertEqual(
+            parse_expression({"or": [{"name.icontains": "a"}, {"not": {"size": 3}}]}),
+            Group(OR, [Condition("name", "icontains", "a"), Group(NOT, [Condition("size", None, 3)])]),
+        )
+
+    def test_parse_json_string(self):
+        self.assertEqual(
+            parse_expression('[{"name": "a"}, {"size.gte": 3}]'),
+            Group(AND, [Condition("name", None, "a"), Condition("size", "gte", 3)]),
+        )
+
+    def test_parse_json_object_with_several_keys(self):
+        self.assertEqual(
+            parse_expression({"name": "a", "size": 3}),
+            Group(AND, [Condition("name", None, "a"), Condition("size", None, 3)]),
+        )
+
+    def test_parse_json_invalid(self):
+        for value in [{}, {"or": {"name": "a"}}, {"or": []}, "[", 3]:
+            with self.subTest(value=value), self.assertRaises(QueryParamaterDataException):
+                parse_expression(value)
+
+    def test_max_depth(self):
+        parse_expression("not(not(name=a))", max_depth=3)
+
+        with self.assertRaises(QueryParamaterDataException):
+            parse_expression("not(not(name=a))", max_depth=2)
+
+        with self.assertRaises(QueryParamaterDataException):
+            parse_expression({"not": {"not": {"name": "a"}}}, max_depth=2)
+
+    def test_max_nodes(self):
+        parse_expression("or(name=a,name=b)", max_nodes=3)
+
+        with self.assertRaises(QueryParamaterDataException):
+            parse_expression("or(name=a,name=b,name=c)", max_nodes=3)
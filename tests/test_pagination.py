@@ -0,0 +1,93 @@
+import base64
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import TestCase
+from uuid import UUID
+
+import sqlalchemy as db
+from sqlalchemy.dialects import postgresql
+
+from sqlaf.exceptions import QueryParamaterDataException
+from sqlaf.pagination import decode_cursor, encode_cursor, keyset_filter, order_by
+from tests.implementation.models import Booking
+
+metadata = db.MetaData()
+event = db.Table(
+    "event",
+    metadata,
+    db.Column("id", db.Integer, primary_key=True),
+    db.Column("starts_at", db.DateTime, nullable=False),
+    db.Column("price", db.Float, nullable=False),
+)
+
+
+class CursorTestCase(TestCase):
+    def test_round_trip(self):
+        values = [datetime(2020, 1, 1, 9, tzinfo=timezone.utc), Decimal("1.50"), UUID(int=1), "Jim", 3, None]
+        cursor = encode_cursor("-created", values)
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_cursor(cursor, "-created", len(values)), values)
+
+    def test_invalid_cursor(self):
+        payloads = ['["-created",[{"decimal":"abc"}]]', '["-created",[{"date":"2020-13-01"}]]']
+        cursors = [base64.urlsafe_b64encode(payload.encode()).decode() for payload in payloads]
+
+        for cursor in ["not a cursor", encode_cursor("-created", [1])[:-2], "e30", *cursors]:
+            with self.subTest(cursor=cursor), self.assertRaises(QueryParamaterDataException):
+                decode_cursor(cursor, "-created", 1)
+
+    def test_other_ordering(self):
+        with self.assertRaises(QueryParamaterDataException):
+            decode_cursor(encode_cursor("-created", [1, 2]), "created", 2)
+
+    def test_column_types(self):
+        columns = [Booking.created_at, event.c.price, Booking.id]
+        values = [datetime(2020, 1, 1), 2, 3]
+        self.assertEqual(decode_cursor(encode_cursor("created", values), "created", 3, columns), values)
+        self.assertEqual(decode_cursor(encode_cursor("created", [None, 2.5, 3]), "created", 3, columns), [None, 2.5, 3])
+
+        for values in [["2020-01-01", 2, 3], [datetime(2020, 1, 1), "2", 3], [None, 2, None], [None, 2, True]]:
+            with self.subTest(values=values), self.assertRaises(QueryParamaterDataException):
+                decode_cursor(encode_cursor("created", values), "created", 3, columns)
+
+
+class KeysetFilterTestCase(TestCase):
+    def compile(self, expression):
+        return str(expression.compile(dialect=postgresql.dialect()))
+
+    def test_single_column(self):
+        self.assertEqual(self.compile(keyset_filter([(Booking.id, True)], [3])), "booking.id < %(param_1)s")
+
+    def test_row_value(self):
+        self.assertEqual(
+            self.compile(keyset_filter([(event.c.starts_at, False), (event.c.id, False)], [datetime(2020, 1, 1), 3])),
+            "(event.starts_at, event.id) > (%(param_1)s, %(param_2)s)",
+        )
+
+    def test_nullable(self):
+        self.assertEqual(
+            self.compile(keyset_filter([(Booking.created_at, False), (Booking.id, False)], [datetime(2020, 1, 1), 3])),
+            "booking.created_at > %(param_1)s OR booking.created_at IS NULL "
+            "OR booking.created_at = %(param_1)s AND booking.id > %(param_2)s",
+        )
+
+    def test_nullable_null_value(self):
+        self.assertEqual(
+            self.compile(keyset_filter([(Booking.created_at, False), (Booking.id, False)], [None, 3])),
+            "booking.created_at IS NULL AND booking.id > %(param_1)s",
+        )
+        self.assertEqual(
+            self.compile(keyset_filter([(Booking.created_at, True), (Booking.id, True)], [None, 3])),
+            "booking.created_at IS NOT NULL OR booking.created_at IS NULL AND booking.id < %(param_1)s",
+        )
+
+    def test_order_by(self):
+        self.assertEqual(self.compile(order_by(Booking.created_at, False)), "booking.created_at ASC NULLS LAST")
+        self.assertEqual(self.compile(order_by(Booking.created_at, True)), "booking.created_at DESC NULLS FIRST")
+        self.assertEqual(self.compile(order_by(Booking.id, True)), "booking.id DESC")
+
+    def test_mixed_directions(self):
+        self.assertEqual(
+            self.compile(keyset_filter([(Booking.created_at, True), (Booking.id, False)], [datetime(2020, 1, 1), 3])),
+            "booking.created_at < %(param_1)s OR booking.created_at = %(param_1)s AND booking.id > %(param_2)s",
+        )
@@ -0,0 +1,98 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from sqlalchemy.dialects import postgresql
+
+from sqlaf import caching
+from sqlaf.simplifier import simplify
+from tests.implementation.models import Booking
+
+
+def compile_filters(filters):
+    return [str(f.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})) for f in filters]
+
+
+class SimplifyTestCase(TestCase):
+    def test_merges_ranges(self):
+        filters, is_empty = simplify(
+            [Booking.number_of_heads >= 3, Booking.number_of_heads >= 5, Booking.number_of_heads <= 10]
+        )
+        self.assertFalse(is_empty)
+        self.assertEqual(compile_filters(filters), ["booking.number_of_heads BETWEEN 5 AND 10"])
+
+    def test_keeps_strictest_bound(self):
+        filters, _ = simplify([Booking.number_of_heads > 3, Booking.number_of_heads > 5, Booking.number_of_heads >= 5])
+        self.assertEqual(compile_filters(filters), ["booking.number_of_heads > 5"])
+
+    def test_contradictory_range(self):
+        self.assertEqual(simplify([Booking.number_of_heads >= 10, Booking.number_of_heads <= 5]), ([], True))
+        self.assertEqual(simplify([Booking.number_of_heads > 5, Booking.number_of_heads <= 5]), ([], True))
+        self.assertEqual(simplify([Booking.number_of_heads.between(10, 5)]), ([], True))
+
+    def test_excluded_point_range(self):
+        heads = Booking.number_of_heads
+        self.assertEqual(simplify([heads >= 3, heads <= 3, heads != 3]), ([], True))
+        self.assertEqual(simplify([heads.between(3, 3), heads.not_in([1, 3])]), ([], True))
+        self.assertEqual(
+            compile_filters(simplify([heads >= 3, heads <= 3, heads != 4])[0])[0],
+            "booking.number_of_heads BETWEEN 3 AND 3",
+        )
+
+    def test_contradictory_values(self):
+        self.assertEqual(simplify([Booking.name == "Jim", Booking.name != "Jim"]), ([], True))
+        self.assertEqual(simplify([Booking.name == "Jim", Booking.name == "Pam"]), ([], True))
+        self.assertEqual(simplify([Booking.number_of_heads == 3, Booking.number_of_heads > 5]), ([], True))
+        self.assertEqual(
+            simplify([Booking.number_of_heads.in_([1, 2]), Booking.number_of_heads.not_in([1, 2])]), ([], True)
+        )
+
+    def test_merges_values(self):
+        filters, is_empty = simplify(
+            [Booking.number_of_heads.in_([1, 5, 7]), Booking.number_of_heads > 4, Booking.number_of_heads != 7]
+        )
+        self.assertFalse(is_empty)
+        self.assertEqual(compile_filters(filters), ["booking.number_of_heads = 5"])
+
+    def test_removes_duplicates(self):
+        filters, _ = simplify([Booking.name.contains("a"), Booking.name.contains("a"), Booking.has_paid.is_(True)])
+        self.assertEqual(len(filters), 2)
+
+    def test_flattens_and(self):
+        filters, is_empty = simplify([(Booking.number_of_heads >= 3) & (Booking.number_of_heads < 3)])
+        self.assertTrue(is_empty)
+
+    def test_keeps_single_filters(self):
+        original = [Booking.number_of_heads >= 3, Booking.name == "Jim"]
+        filters, is_empty = simplify(original)
+        self.assertFalse(is_empty)
+        self.assertIs(filters[0], original[0])
+        self.assertIs(filters[1], original[1])
+
+    def test_keeps_string_ranges(self):
+        original = [Booking.name >= "b", Booking.name <= "a"]
+        self.assertEqual(simplify(original), (original, False))
+
+    def test_keeps_incomparable_values(self):
+        original = [
+            Booking.created_at >= datetime(2020, 1, 2),
+            Booking.created_at <= datetime(2020, 1, 1, tzinfo=timezone.utc),
+        ]
+        filters, is_empty = simplify(original)
+        self.assertFalse(is_empty)
+        self.assertEqual(len(filters), 2)
+
+    def test_keeps_bind_parameter_names(self):
+        filters, _ = simplify(
+            [
+                caching.bind_parameters(Booking.number_of_heads >= 3, "min_heads"),
+                caching.bind_parameters(Booking.number_of_heads <= 5, "max_heads"),
+                caching.bind_parameters(Booking.number_of_heads.not_in([4]), "not_heads"),
+            ]
+        )
+        self.assertEqual(
+            [str(f.compile(dialect=postgresql.dialect())) for f in filters],
+            [
+                "booking.number_of_heads BETWEEN %(sqlaf_min_heads_0)s AND %(sqlaf_max_heads_0)s",
+                "booking.number_of_heads != %(sqlaf_not_heads_0)s",
+            ],
+        )
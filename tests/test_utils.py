@@ -0,0 +1,142 @@
+import re
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, mock
+
+from sqlaf.exceptions import QueryParamaterDataException
+from sqlaf.utils import get_datetime_parser, is_relative_datetime, parse_query_string, resolve_relative_datetime
+
+
+class ParseQueryStringTestCase(TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_query_string("?name=Jim&size=2"), {"name": "Jim", "size": "2"})
+
+    def test_parse_empty(self):
+        self.assertEqual(parse_query_string(""), {})
+
+    def test_parse_repeated_key_keeps_first_value(self):
+        self.assertEqual(parse_query_string("name=Jim&name=Pam"), {"name": "Jim"})
+
+    def test_parse_multi_value_keys(self):
+        self.assertEqual(
+            parse_query_string("id=1,2&id=3&name=Jim,Pam", multi_value_keys={"id"}),
+            {"id": ["1", "2", "3"], "name": "Jim,Pam"},
+        )
+
+    def test_parse_bytes(self):
+        self.assertEqual(parse_query_string(b"name=Jim+Halpert&size=%32"), {"name": "Jim Halpert", "size": "2"})
+
+    def test_parse_skips_blank_values(self):
+        self.assertEqual(parse_query_string("name=&size=2&flag"), {"size": "2"})
+
+    def test_parse_keys(self):
+        self.assertEqual(parse_query_string("name=Jim&size=2&other=%ZZ", keys={"name"}), {"name": "Jim"})
+
+    def test_parse_keys_encoded_key(self):
+        self.assertEqual(parse_query_string("%6Eame=Jim&size=2", keys={"name"}), {"name": "Jim"})
+
+    def test_parse_keys_bytes(self):
+        self.assertEqual(
+            parse_query_string(b"id=1,2&id=3&other=4", multi_value_keys={"id"}, keys={"id"}), {"id": ["1", "2", "3"]}
+        )
+
+    def test_parse_max_pairs(self):
+        self.assertEqual(parse_query_string("a=1&b=2", max_pairs=2), {"a": "1", "b": "2"})
+
+        with self.assertRaises(QueryParamaterDataException):
+            parse_query_string("a=1&b=2&c=3", max_pairs=2)
+
+    def test_parse_max_key_length(self):
+        with self.assertRaises(QueryParamaterDataException):
+            parse_query_string("name=Jim&" + "a" * 11 + "=1", keys={"name"}, max_key_length=10)
+
+    def test_parse_max_value_length(self):
+        with self.assertRaises(QueryParamaterDataException):
+            parse_query_string("name=" + "a" * 11, max_value_length=10)
+
+
+class GetDatetimeParserTestCase(TestCase):
+    def assertParsesLikeStrptime(self, format, values):
+        parse = get_datetime_parser(format)
+
+        for value in values:
+            try:
+                expected = datetime.strptime(value, format)
+            except ValueError as e:
+                with self.assertRaisesRegex(ValueError, re.escape(str(e))):
+                    parse(value)
+            else:
+                self.assertEqual(repr(parse(value)), repr(expected))
+
+    def test_date_format(self):
+        self.assertEqual(get_datetime_parser("%Y-%m-%d")("2020-01-05"), datetime(2020, 1, 5))
+        self.assertParsesLikeStrptime("%Y-%m-%d", ["2020-01-05", "2020-1-5", "2020-02-30", "20200105", "2020-01-05 "])
+
+    def test_datetime_format(self):
+        self.assertEqual(
+            get_datetime_parser("%Y-%m-%dT%H:%M:%S%z")("2020-01-01T10:00:00-05:30"),
+            datetime(2020, 1, 1, 10, tzinfo=timezone(-timedelta(hours=5, minutes=30))),
+        )
+        self.assertParsesLikeStrptime(
+            "%Y-%m-%dT%H:%M:%S%z",
+            [
+                "2020-01-01T10:00:00+0000",
+                "2020-01-01T10:00:00Z",
+                "2020-01-01t10:00:00z",
+                "2020-01-01T10:00:00+0160",
+                "2020-01-01T24:00:00+0000",
+                "2020-01-01T10:00:60+0000",
+                "2020-01-01T10:00:00",
+            ],
+        )
+
+    def test_time_format(self):
+        self.assertParsesLikeStrptime("%H:%M:%S%z", ["13:00:00+0000", "13:00:00", "9:00:00+0000"])
+
+    def test_custom_format(self):
+        self.assertParsesLikeStrptime("%d %b %Y", ["05 Jan 2020", "5 January 2020"])
+        self.assertParsesLikeStrptime("%d/%m/%Y %H:%M", ["05/01/2020 10:30", "05/01/2020  10:30"])
+
+
+@mock.patch("sqlaf.config.CLOCK", lambda: datetime(2022, 3, 31, 13, 45, 30, 500, tzinfo=timezone.utc))
+class ResolveRelativeDatetimeTestCase(TestCase):
+    def test_is_relative_datetime(self):
+        self.assertTrue(is_relative_datetime("now"))
+        self.assertTrue(is_relative_datetime("today-1d+2h"))
+        self.assertFalse(is_relative_datetime("now-7"))
+        self.assertFalse(is_relative_datetime("2022-01-01"))
+        self.assertFalse(is_relative_datetime(None))
+
+    def test_now(self):
+        self.assertEqual(resolve_relative_datetime("now"), datetime(2022, 3, 31, 13, 45, tzinfo=timezone.utc))
+
+    def test_offsets(self):
+        self.assertEqual(resolve_relative_datetime("now-7d"), datetime(2022, 3, 24, 13, 45, tzinfo=timezone.utc))
+        self.assertEqual(resolve_relative_datetime("now-1h+30m"), datetime(2022, 3, 31, 13, 15, tzinfo=timezone.utc))
+        self.assertEqual(resolve_relative_datetime("now-1M"), datetime(2022, 2, 28, 13, 45, tzinfo=timezone.utc))
+        self.assertEqual(resolve_relative_datetime("now-2y"), datetime(2020, 3, 31, 13, 45, tzinfo=timezone.utc))
+
+    def test_anchors(self):
+        self.assertEqual(resolve_relative_datetime("today"), datetime(2022, 3, 31, tzinfo=timezone.utc))
+        self.assertEqual(resolve_relative_datetime("startofweek"), datetime(2022, 3, 28, tzinfo=timezone.utc))
+        self.assertEqual(resolve_relative_datetime("startofmonth"), datetime(2022, 3, 1, tzinfo=timezone.utc))
+        self.assertEqual(resolve_relative_datetime("startofyear-1M"), datetime(2021, 12, 1, tzinfo=timezone.utc))
+
+    def test_rounding(self):
+        self.assertEqual(
+            resolve_relative_datetime("now", rounding="second"), datetime(2022, 3, 31, 13, 45, 30, tzinfo=timezone.utc)
+        )
+        self.assertEqual(
+            resolve_relative_datetime("now", rounding="hour"), datetime(2022, 3, 31, 13, tzinfo=timezone.utc)
+        )
+        self.assertEqual(resolve_relative_datetime("now", rounding="day"), datetime(2022, 3, 31, tzinfo=timezone.utc))
+
+    def test_timezone(self):
+        tz = timezone(timedelta(hours=12))
+        self.assertEqual(resolve_relative_datetime("today", tz), datetime(2022, 4, 1, tzinfo=tz))
+
+    def test_invalid_value(self):
+        with self.assertRaises(ValueError):
+            resolve_relative_datetime("yesterday")
+
+        with self.assertRaises(ValueError):
+            resolve_relative_datetime("now", rounding="week")